@@ -134,6 +134,9 @@ ONCHAIN_VOLUME_THRESHOLD = float(
 ONCHAIN_MIN_SIGNAL_INTERVAL = int(
     os.getenv("ONCHAIN_MIN_SIGNAL_INTERVAL", "86400")
 )  # 24 hours between signals
+ONCHAIN_SPAN_SAMPLE_EVERY = int(
+    os.getenv("ONCHAIN_SPAN_SAMPLE_EVERY", "100")
+)  # Trace 1 in N analyzed ticks
 
 # Trading Configuration
 TRADING_SYMBOLS = os.getenv("TRADING_SYMBOLS", "BTCUSDT,ETHUSDT,BNBUSDT").split(",")
@@ -192,6 +195,7 @@ MAX_CPU_PERCENT = int(os.getenv("MAX_CPU_PERCENT", "80"))
 MESSAGE_PROCESSING_TIMEOUT = float(os.getenv("MESSAGE_PROCESSING_TIMEOUT", "1.0"))
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
 BATCH_TIMEOUT = float(os.getenv("BATCH_TIMEOUT", "1.0"))
+USE_UVLOOP = os.getenv("USE_UVLOOP", "true").lower() == "true"
 
 # OpenTelemetry Configuration
 ENABLE_OTEL = os.getenv("ENABLE_OTEL", "true").lower() == "true"
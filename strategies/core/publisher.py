@@ -10,6 +10,7 @@ import time
 from typing import Any, Optional
 
 import nats
+import orjson
 import structlog
 from nats.aio.client import Client as NATSClient
 
@@ -70,6 +71,20 @@ class TradeOrderPublisher:
         self.batch_size = constants.BATCH_SIZE
         self.batch_timeout = constants.BATCH_TIMEOUT
 
+    @staticmethod
+    def _serialize_order(order: TradeOrder) -> bytes:
+        """
+        Serialize an order, with trace context, to JSON bytes for NATS.
+
+        orjson formats the datetime timestamp itself and coerces non-str
+        metadata keys to strings, as json.dumps did. Unlike json.dumps, it
+        encodes NaN and infinite floats as null, which keeps the payload
+        valid JSON.
+        """
+        # Inject trace context into order for distributed tracing
+        order_dict = inject_trace_context(order._payload_dict())
+        return orjson.dumps(order_dict, option=orjson.OPT_NON_STR_KEYS)
+
     def _signal_subject_for_order(self, order: TradeOrder) -> str:
         """
         Build NATS subject routing orders through the CIO intent topic.
@@ -218,15 +233,11 @@ class TradeOrderPublisher:
         publishing_time = 0.0
 
         try:
-            # Convert orders to JSON and publish each on a strategy-scoped subject
+            # Serialize orders to JSON bytes, publishing each on a strategy subject
             for order in orders:
-                order_dict = order.to_dict()
-                order_dict_with_trace = inject_trace_context(order_dict)
-                order_message = json.dumps(order_dict_with_trace)
                 subject = self._signal_subject_for_order(order)
                 await self.nats_client.publish(
-                    subject=subject,
-                    payload=order_message.encode(),
+                    subject=subject, payload=self._serialize_order(order)
                 )
 
             # Update metrics
@@ -313,16 +324,11 @@ class TradeOrderPublisher:
         publishing_time = 0.0
 
         try:
-            # Convert order to JSON
-            order_dict = order.to_dict()
-            # Inject trace context into order for distributed tracing
-            order_dict_with_trace = inject_trace_context(order_dict)
-            order_message = json.dumps(order_dict_with_trace)
-
-            # Publish message to NATS (strategy-scoped subject for tradeengine wildcard)
+            # Publish message to NATS (strategy-scoped subject for tradeengine
+            # wildcard), serialized straight to bytes
             await self.nats_client.publish(
                 subject=self._signal_subject_for_order(order),
-                payload=order_message.encode(),
+                payload=self._serialize_order(order),
             )
 
             # Update metrics
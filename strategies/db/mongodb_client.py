@@ -167,6 +167,9 @@ class MongoDBClient:
             await self.database.strategy_config_audit.create_index(
                 [("changed_at", -1)]  # Descending for recent-first queries
             )
+            await self.database.strategy_config_audit.create_index(
+                [("strategy_id", 1), ("symbol", 1), ("new_parameters.version", 1)]
+            )
 
             logger.info("MongoDB indexes created successfully")
 
@@ -537,7 +540,7 @@ class MongoDBClient:
             symbol: Optional symbol filter
 
         Returns:
-            Audit record or None if not found
+            Most recent matching audit record, or None if not found
         """
         if self.use_data_manager:
             return await self.data_manager_client.get_audit_record_by_version(
@@ -555,7 +558,10 @@ class MongoDBClient:
             if symbol:
                 query["symbol"] = symbol
 
-            record = await self.database.strategy_config_audit.find_one(query)
+            # Newest first, served by the strategy/symbol/version index
+            record = await self.database.strategy_config_audit.find_one(
+                query, sort=[("changed_at", -1)]
+            )
             return record
         except Exception as e:
             logger.debug(
@@ -610,3 +616,63 @@ class MongoDBClient:
         except Exception as e:
             logger.error(f"Error listing symbol overrides for {strategy_id}: {e}")
             return []
+
+    async def list_global_config_ids(self, strategy_ids: list[str]) -> set[str] | None:
+        """
+        Get which of the given strategies have a global configuration.
+
+        Args:
+            strategy_ids: Strategy identifiers to check
+
+        Returns:
+            Set of strategy IDs with a global config, or None in Data Manager
+            mode where no bulk lookup is available
+        """
+        if self.use_data_manager:
+            return None
+
+        if not self._connected:
+            return set()
+
+        try:
+            global_ids = await self.database.strategy_configs_global.distinct(
+                "strategy_id", {"strategy_id": {"$in": strategy_ids}}
+            )
+            return set(global_ids)
+        except Exception as e:
+            logger.error(f"Error listing global configs: {e}")
+            return set()
+
+    async def list_symbol_overrides_bulk(
+        self, strategy_ids: list[str]
+    ) -> dict[str, list[str]]:
+        """
+        Get symbols with configuration overrides for several strategies at once.
+
+        Args:
+            strategy_ids: Strategy identifiers
+
+        Returns:
+            Mapping of strategy ID to its sorted override symbols (strategies
+            without overrides are omitted)
+        """
+        if not self._connected:
+            return {}
+
+        try:
+            cursor = self.database.strategy_configs_symbol.aggregate(
+                [
+                    {"$match": {"strategy_id": {"$in": strategy_ids}}},
+                    {
+                        "$group": {
+                            "_id": "$strategy_id",
+                            "symbols": {"$addToSet": "$symbol"},
+                        }
+                    },
+                ]
+            )
+            groups = await cursor.to_list(length=None)
+            return {group["_id"]: sorted(group["symbols"]) for group in groups}
+        except Exception as e:
+            logger.error(f"Error listing symbol overrides: {e}")
+            return {}
@@ -37,6 +37,13 @@ try:
     from petrosa_otel import ConfigRateLimiter
 except ImportError:
     pass
+
+uvloop = None
+try:
+    import uvloop
+except ImportError:
+    pass
+
 # Load environment variables
 load_dotenv()
 
@@ -354,8 +361,15 @@ def run(
         attach_logging_handler()
     signal_handler.service = service
 
+    # Use uvloop for lower per-message dispatch overhead when available; the
+    # loop factory only affects this runner, not the process-wide policy
+    loop_factory = None
+    if constants.USE_UVLOOP and uvloop is not None:
+        loop_factory = uvloop.new_event_loop
+
     try:
-        asyncio.run(service.start())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(service.start())
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e:
@@ -8,7 +8,7 @@ strategies for order book analysis.
 
 from .btc_dominance import BitcoinDominanceStrategy
 from .cross_exchange_spread import CrossExchangeSpreadStrategy
-from .iceberg_detector import IcebergDetectorStrategy
+from .iceberg_detector import IcebergDetectorStrategy, OrderBookSnapshot
 from .onchain_metrics import OnChainMetricsStrategy
 from .spread_liquidity import SpreadLiquidityStrategy
 
@@ -17,5 +17,6 @@ __all__ = [
     "CrossExchangeSpreadStrategy",
     "OnChainMetricsStrategy",
     "IcebergDetectorStrategy",
+    "OrderBookSnapshot",
     "SpreadLiquidityStrategy",
 ]
@@ -531,6 +531,42 @@ PARAMETER_SCHEMAS: dict[str, dict[str, dict[str, Any]]] = {
 }
 
 
+# Compiled validation rules derived from PARAMETER_SCHEMAS at import time:
+# {strategy_id: {param: (accepted_types, type_error, is_numeric, min, max)}}
+_TYPE_CHECKS: dict[str, tuple[tuple[type, ...], str]] = {
+    "int": ((int,), "must be an integer"),
+    "float": ((int, float), "must be a number"),
+    "bool": ((bool,), "must be a boolean"),
+    "str": ((str,), "must be a string"),
+}
+
+_ParamRule = tuple[tuple[type, ...] | None, str, bool, Any, Any]
+
+
+def _compile_parameter_rules(
+    schemas: dict[str, dict[str, dict[str, Any]]],
+) -> dict[str, dict[str, _ParamRule]]:
+    """Flatten parameter schemas into per-parameter rule tuples."""
+    compiled: dict[str, dict[str, _ParamRule]] = {}
+    for strategy_id, schema in schemas.items():
+        rules: dict[str, _ParamRule] = {}
+        for param_name, param_schema in schema.items():
+            param_type = param_schema.get("type")
+            accepted, type_error = _TYPE_CHECKS.get(param_type, (None, ""))
+            rules[param_name] = (
+                accepted,
+                type_error,
+                param_type in ("int", "float"),
+                param_schema.get("min"),
+                param_schema.get("max"),
+            )
+        compiled[strategy_id] = rules
+    return compiled
+
+
+_PARAMETER_RULES = _compile_parameter_rules(PARAMETER_SCHEMAS)
+
+
 # =============================================================================
 # STRATEGY METADATA
 # =============================================================================
@@ -655,44 +691,31 @@ def validate_parameters(
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    schema = get_parameter_schema(strategy_id)
-    if not schema:
+    rules = _PARAMETER_RULES.get(strategy_id)
+    if not rules:
         # No schema defined, accept all parameters
         return True, []
 
     errors = []
 
     for param_name, param_value in parameters.items():
-        if param_name not in schema:
+        rule = rules.get(param_name)
+        if rule is None:
             errors.append(f"Unknown parameter: {param_name}")
             continue
 
-        param_schema = schema[param_name]
-        param_type = param_schema.get("type")
+        accepted, type_error, is_numeric, min_value, max_value = rule
 
         # Type validation
-        if param_type == "int" and not isinstance(param_value, int):
-            errors.append(f"{param_name} must be an integer")
-            continue
-        elif param_type == "float" and not isinstance(param_value, (int, float)):
-            errors.append(f"{param_name} must be a number")
-            continue
-        elif param_type == "bool" and not isinstance(param_value, bool):
-            errors.append(f"{param_name} must be a boolean")
-            continue
-        elif param_type == "str" and not isinstance(param_value, str):
-            errors.append(f"{param_name} must be a string")
+        if accepted is not None and not isinstance(param_value, accepted):
+            errors.append(f"{param_name} {type_error}")
             continue
 
         # Range validation for numeric types
-        if param_type in ("int", "float"):
-            if "min" in param_schema and param_value < param_schema["min"]:
-                errors.append(
-                    f"{param_name} must be >= {param_schema['min']}, got {param_value}"
-                )
-            if "max" in param_schema and param_value > param_schema["max"]:
-                errors.append(
-                    f"{param_name} must be <= {param_schema['max']}, got {param_value}"
-                )
+        if is_numeric:
+            if min_value is not None and param_value < min_value:
+                errors.append(f"{param_name} must be >= {min_value}, got {param_value}")
+            if max_value is not None and param_value > max_value:
+                errors.append(f"{param_name} must be <= {max_value}, got {param_value}")
 
     return len(errors) == 0, errors
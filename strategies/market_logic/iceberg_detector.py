@@ -10,18 +10,43 @@ Win Rate Target: 60-70%
 Signal Frequency: 2-5 per symbol per day
 """
 
+import logging
+import os
 import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 from opentelemetry import trace
 
+import constants
 from strategies.models.orderbook_tracker import IcebergPattern, OrderBookTracker
 from strategies.models.signals import Signal, SignalAction, SignalConfidence, SignalType
 
 logger = structlog.get_logger(__name__)
 
+# Stdlib logger backing the structlog logger, used for cheap level checks
+_stdlib_logger = logging.getLogger(__name__)
+
+
+# Static Signal.metadata entries shared by every iceberg signal
+_SIGNAL_METADATA_TEMPLATE: dict[str, Any] = {
+    "strategy_id": "iceberg_detector",
+    "quantity": 0.001,
+    "timeframe": "tick",
+}
+
+
+# Per-side signal parameters: {side: (type, action, direction, participant)}
+# Hidden bid (support) -> BUY, hidden ask (resistance) -> SELL
+_SIDE_PARAMS: dict[str, tuple[SignalType, SignalAction, float, str]] = {
+    "bid": (SignalType.BUY, SignalAction.OPEN_LONG, 1.0, "buyer"),
+    "ask": (SignalType.SELL, SignalAction.OPEN_SHORT, -1.0, "seller"),
+}
+
 
 # Get tracer for this module
 def get_tracer():
@@ -29,6 +54,30 @@ def get_tracer():
     return trace.get_tracer(__name__)
 
 
+# Resolved once at import: when tracing is off the hot path skips span
+# creation and attribute writes entirely instead of going through a no-op tracer
+_TRACING_ENABLED = (
+    constants.ENABLE_OTEL and os.getenv("OTEL_SDK_DISABLED", "false").lower() != "true"
+)
+
+
+def _start_span(name: str):
+    """Start a span, or a no-op context yielding a non-recording span."""
+    if _TRACING_ENABLED:
+        return get_tracer().start_as_current_span(name)
+    return nullcontext(trace.INVALID_SPAN)
+
+
+@dataclass(slots=True)
+class OrderBookSnapshot:
+    """Order book snapshot input for IcebergDetectorStrategy.analyze_batch."""
+
+    symbol: str
+    bids: list[tuple[float, float]]  # [(price, quantity), ...] sorted descending
+    asks: list[tuple[float, float]]  # [(price, quantity), ...] sorted ascending
+    timestamp: datetime | None = None
+
+
 class IcebergDetectorStrategy:
     """
     Iceberg Order Detection Strategy.
@@ -89,6 +138,10 @@ class IcebergDetectorStrategy:
         self.max_symbols = max_symbols
         self.min_signal_interval = min_signal_interval_seconds
 
+        # Risk management constants
+        self._min_atr_pct = 0.005  # Min 0.5% of price as ATR proxy
+        self._tp_mult = 2.5  # Take profit at 2.5x ATR proxy
+
         # Order book tracker
         self.tracker = OrderBookTracker(
             history_window_seconds=history_window_seconds,
@@ -98,8 +151,11 @@ class IcebergDetectorStrategy:
             min_refill_count=min_refill_count,
         )
 
-        # Last signal time: {(symbol, price, side): timestamp}
-        self.last_signal_time: dict[tuple[str, float, str], float] = {}
+        # Last signal time: {(symbol, packed price/side int): timestamp}
+        # Kept in insertion order (oldest first) and bounded so long-running
+        # processes don't accumulate one entry per level ever signalled.
+        self.last_signal_time: OrderedDict[tuple[str, int], float] = OrderedDict()
+        self.max_signal_keys = max_symbols * 64
 
         # Statistics
         self.signals_generated = 0
@@ -132,39 +188,89 @@ class IcebergDetectorStrategy:
         Returns:
             Signal if iceberg detected near price, None otherwise
         """
-        with get_tracer().start_as_current_span(
-            "strategy.iceberg_detector.analyze"
-        ) as span:
-            span.set_attribute("symbol", symbol)
-
-            if timestamp is None:
-                timestamp = datetime.utcnow()
-
-            # Validate inputs
-            if not bids or not asks:
-                span.set_attribute("result", "skipped_empty_data")
-                return None
-
-            # Update tracker with order book
-            self.tracker.update_orderbook(symbol, bids, asks, timestamp)
-
-            # Calculate current mid price
-            mid_price = (bids[0][0] + asks[0][0]) / 2
-
-            # Detect icebergs near current price
-            icebergs = self.tracker.detect_icebergs(
-                symbol=symbol,
-                current_price=mid_price,
-                proximity_pct=self.level_proximity_pct,
-            )
+        with _start_span("strategy.iceberg_detector.analyze") as span:
+            if _TRACING_ENABLED:
+                span.set_attribute("symbol", symbol)
+
+            # Unix seconds, avoiding datetime construction when not supplied
+            unix_ts = time.time() if timestamp is None else timestamp.timestamp()
+
+            return self._analyze_book(symbol, bids, asks, unix_ts, span)
+
+    def analyze_batch(self, snapshots: list[OrderBookSnapshot]) -> list[Signal]:
+        """
+        Analyze several order book snapshots in one call.
+
+        Equivalent to calling analyze() for each snapshot in order, but opens
+        a single span for the whole batch and reads the clock once.
+
+        Args:
+            snapshots: Order book snapshots, processed in order
+
+        Returns:
+            Signals generated by the batch (at most one per snapshot)
+        """
+        with _start_span("strategy.iceberg_detector.analyze_batch") as span:
+            now = time.time()
+            signals = []
+
+            for snapshot in snapshots:
+                timestamp = snapshot.timestamp
+                unix_ts = now if timestamp is None else timestamp.timestamp()
+                signal = self._analyze_book(
+                    snapshot.symbol,
+                    snapshot.bids,
+                    snapshot.asks,
+                    unix_ts,
+                    trace.INVALID_SPAN,
+                )
+                if signal:
+                    signals.append(signal)
+
+            if _TRACING_ENABLED:
+                span.set_attribute("batch.size", len(snapshots))
+                span.set_attribute("batch.signals", len(signals))
+
+            return signals
 
-            if not icebergs:
-                span.set_attribute("result", "no_icebergs")
-                return None
+    def _analyze_book(
+        self,
+        symbol: str,
+        bids: list[tuple[float, float]],
+        asks: list[tuple[float, float]],
+        unix_ts: float,
+        span: trace.Span,
+    ) -> Signal | None:
+        """Run tracking, detection and signal generation for one snapshot."""
+        # Validate inputs
+        if not bids or not asks:
+            span.set_attribute("result", "skipped_empty_data")
+            return None
+
+        # Update tracker with order book
+        self.tracker.update_orderbook(symbol, bids, asks, unix_ts)
+
+        # Calculate current mid price
+        mid_price = (bids[0][0] + asks[0][0]) / 2
+
+        # Detect icebergs near current price
+        icebergs = self.tracker.detect_icebergs(
+            symbol=symbol,
+            current_price=mid_price,
+            proximity_pct=self.level_proximity_pct,
+        )
 
-            # Log detection
-            for iceberg in icebergs:
-                self.icebergs_detected += 1
+        if not icebergs:
+            span.set_attribute("result", "no_icebergs")
+            return None
+
+        # Log detections and pick the strongest iceberg in a single pass
+        debug_enabled = _stdlib_logger.isEnabledFor(logging.DEBUG)
+        strongest_iceberg = icebergs[0]
+        for iceberg in icebergs:
+            if iceberg.confidence > strongest_iceberg.confidence:
+                strongest_iceberg = iceberg
+            if debug_enabled:
                 logger.debug(
                     f"Iceberg detected: {iceberg.side.upper()}",
                     symbol=symbol,
@@ -173,119 +279,144 @@ class IcebergDetectorStrategy:
                     refill_count=iceberg.refill_count,
                     confidence=round(iceberg.confidence, 2),
                 )
+        self.icebergs_detected += len(icebergs)
 
-            # Generate signal from strongest iceberg
-            strongest_iceberg = max(icebergs, key=lambda x: x.confidence)
-            signal = self._generate_signal(strongest_iceberg, mid_price)
+        # Generate signal from strongest iceberg
+        signal = self._generate_signal(strongest_iceberg, mid_price, span)
 
-            if signal:
-                self.signals_generated += 1
+        if signal:
+            self.signals_generated += 1
+            if _TRACING_ENABLED:
                 span.set_attribute("result", "signal_generated")
                 span.set_attribute("signal.type", signal.signal_type.value)
-            else:
-                span.set_attribute("result", "signal_suppressed")
+        else:
+            span.set_attribute("result", "signal_suppressed")
+
+        return signal
+
+    def _signal_key(self, iceberg: IcebergPattern) -> tuple[str, int]:
+        """
+        Build the (symbol, price/side) rate-limit key for an iceberg.
+
+        Price and side are packed as ``price_ticks << 1 | side_bit``, where
+        ``price_ticks`` is the price at 0.01 resolution. The symbol string is
+        kept as is, so keys need no per-symbol state beyond last_signal_time.
+        """
+        price_ticks = int(round(iceberg.price * 100))
+        side_bit = 0 if iceberg.side == "bid" else 1
+
+        return iceberg.symbol, (price_ticks << 1) | side_bit
+
+    def _record_signal_time(
+        self, signal_key: tuple[str, int], current_time: float
+    ) -> None:
+        """Record signal time and evict expired or excess rate-limit entries."""
+        last_signal_time = self.last_signal_time
+        last_signal_time[signal_key] = current_time
+        last_signal_time.move_to_end(signal_key)
+
+        # Entries older than the interval can no longer rate limit anything
+        expiry = current_time - self.min_signal_interval
+        while last_signal_time and next(iter(last_signal_time.values())) < expiry:
+            last_signal_time.popitem(last=False)
 
-            return signal
+        while len(last_signal_time) > self.max_signal_keys:
+            last_signal_time.popitem(last=False)
 
     def _generate_signal(
-        self, iceberg: IcebergPattern, current_price: float
+        self,
+        iceberg: IcebergPattern,
+        current_price: float,
+        span: trace.Span = trace.INVALID_SPAN,
     ) -> Signal | None:
-        """Generate trading signal from iceberg pattern."""
-        with get_tracer().start_as_current_span(
-            "strategy.iceberg_detector.generate_signal"
-        ) as span:
-            span.set_attribute("symbol", iceberg.symbol)
+        """
+        Generate trading signal from iceberg pattern.
+
+        Outcome details are recorded on the caller's analyze span rather than
+        a separate child span.
+        """
+        if _TRACING_ENABLED:
             span.set_attribute("iceberg.price", iceberg.price)
             span.set_attribute("iceberg.side", iceberg.side)
 
-            # Rate limiting per (symbol, price, side)
-            signal_key = (iceberg.symbol, round(iceberg.price, 2), iceberg.side)
-            current_time = time.time()
-
-            if signal_key in self.last_signal_time:
-                time_since_last = current_time - self.last_signal_time[signal_key]
-                if time_since_last < self.min_signal_interval:
-                    logger.debug(
-                        "Signal rate limited",
-                        symbol=iceberg.symbol,
-                        price=iceberg.price,
-                        side=iceberg.side,
-                        time_since_last=round(time_since_last, 1),
-                    )
-                    span.set_attribute("result", "rate_limited")
-                    return None
-
-            # Determine signal type and action based on iceberg side
-            if iceberg.side == "bid":
-                # Hidden buyer (support) → BUY signal
-                signal_type = SignalType.BUY
-                signal_action = SignalAction.OPEN_LONG
-                reasoning = f"Large hidden buyer detected at {iceberg.price} ({iceberg.pattern_type})"
-            elif iceberg.side == "ask":
-                # Hidden seller (resistance) → SELL signal
-                signal_type = SignalType.SELL
-                signal_action = SignalAction.OPEN_SHORT
-                reasoning = f"Large hidden seller detected at {iceberg.price} ({iceberg.pattern_type})"
-            else:
-                span.set_attribute("result", "invalid_side")
-                return None
-
-            # Calculate confidence score and map to enum
-            confidence_score = iceberg.confidence
-            if confidence_score >= 0.8:
-                confidence_level = SignalConfidence.HIGH
-            elif confidence_score >= 0.6:
-                confidence_level = SignalConfidence.MEDIUM
-            else:
-                confidence_level = SignalConfidence.LOW
-
-            # Calculate risk management levels
-            # Use distance to iceberg level as ATR proxy
-            distance_to_level = abs(current_price - iceberg.price)
-            atr_proxy = max(distance_to_level, current_price * 0.005)  # Min 0.5%
-
-            if signal_type == SignalType.BUY:
-                # Enter near support, stop below iceberg
-                entry_price = current_price
-                stop_loss = iceberg.price - atr_proxy
-                take_profit = entry_price + (atr_proxy * 2.5)
-            else:  # SELL
-                # Enter near resistance, stop above iceberg
-                entry_price = current_price
-                stop_loss = iceberg.price + atr_proxy
-                take_profit = entry_price - (atr_proxy * 2.5)
-
-            # Create signal with all required fields
-            signal = Signal(
-                symbol=iceberg.symbol,
-                signal_type=signal_type,
-                signal_action=signal_action,
-                confidence=confidence_level,
-                confidence_score=confidence_score,
-                price=entry_price,
-                strategy_name="Iceberg Order Detector",
-                metadata={
-                    "strategy_id": "iceberg_detector",
-                    "pattern_type": iceberg.pattern_type,
-                    "reasoning": reasoning,
-                    "distance_to_level_pct": (distance_to_level / current_price) * 100,
-                    "iceberg_price": iceberg.price,
-                    "iceberg_side": iceberg.side,
-                    "refill_count": iceberg.refill_count,
-                    "avg_refill_speed": iceberg.avg_refill_speed_seconds,
-                    "volume_consistency": iceberg.volume_consistency_score,
-                    "persistence_seconds": iceberg.persistence_seconds,
-                    "current_price": current_price,
-                    "stop_loss": stop_loss,
-                    "take_profit": take_profit,
-                    "quantity": 0.001,
-                    "timeframe": "tick",
-                },
-            )
+        # Rate limiting per (symbol, price, side)
+        signal_key = self._signal_key(iceberg)
+        current_time = time.time()
+
+        time_since_last = current_time - self.last_signal_time.get(signal_key, 0.0)
+        if time_since_last < self.min_signal_interval:
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Signal rate limited",
+                    symbol=iceberg.symbol,
+                    price=iceberg.price,
+                    side=iceberg.side,
+                    time_since_last=round(time_since_last, 1),
+                )
+            span.add_event("signal_rate_limited")
+            return None
+
+        # Determine signal type and action based on iceberg side
+        side_params = _SIDE_PARAMS.get(iceberg.side)
+        if side_params is None:
+            span.add_event("invalid_iceberg_side")
+            return None
+        signal_type, signal_action, direction, participant = side_params
+        reasoning = (
+            f"Large hidden {participant} detected at {iceberg.price} "
+            f"({iceberg.pattern_type})"
+        )
+
+        # Calculate confidence score and map to enum
+        confidence_score = iceberg.confidence
+        if confidence_score >= 0.8:
+            confidence_level = SignalConfidence.HIGH
+        elif confidence_score >= 0.6:
+            confidence_level = SignalConfidence.MEDIUM
+        else:
+            confidence_level = SignalConfidence.LOW
+
+        # Calculate risk management levels
+        # Use distance to iceberg level as ATR proxy
+        distance_to_level = abs(current_price - iceberg.price)
+        atr_proxy = max(distance_to_level, current_price * self._min_atr_pct)
+
+        # Enter at market, stop beyond the iceberg level (below support
+        # for BUY, above resistance for SELL)
+        entry_price = current_price
+        stop_loss = iceberg.price - direction * atr_proxy
+        take_profit = entry_price + direction * atr_proxy * self._tp_mult
+
+        # Create signal with all required fields
+        signal = Signal(
+            symbol=iceberg.symbol,
+            signal_type=signal_type,
+            signal_action=signal_action,
+            confidence=confidence_level,
+            confidence_score=confidence_score,
+            price=entry_price,
+            strategy_name="Iceberg Order Detector",
+            metadata={
+                **_SIGNAL_METADATA_TEMPLATE,
+                "pattern_type": iceberg.pattern_type,
+                "reasoning": reasoning,
+                "distance_to_level_pct": (distance_to_level / current_price) * 100,
+                "iceberg_price": iceberg.price,
+                "iceberg_side": iceberg.side,
+                "refill_count": iceberg.refill_count,
+                "avg_refill_speed": iceberg.avg_refill_speed_seconds,
+                "volume_consistency": iceberg.volume_consistency_score,
+                "persistence_seconds": iceberg.persistence_seconds,
+                "current_price": current_price,
+                "stop_loss": stop_loss,
+                "take_profit": take_profit,
+            },
+        )
 
-            # Update last signal time
-            self.last_signal_time[signal_key] = current_time
+        # Update last signal time
+        self._record_signal_time(signal_key, current_time)
 
+        if _stdlib_logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Iceberg signal generated: {signal_type.value}",
                 symbol=iceberg.symbol,
@@ -297,11 +428,11 @@ class IcebergDetectorStrategy:
                 refill_count=iceberg.refill_count,
             )
 
-            span.set_attribute("result", "success")
+        if _TRACING_ENABLED:
             span.set_attribute("order.stop_loss", stop_loss)
             span.set_attribute("order.take_profit", take_profit)
 
-            return signal
+        return signal
 
     def get_statistics(self) -> dict:
         """Get strategy statistics."""
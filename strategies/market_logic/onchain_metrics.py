@@ -11,7 +11,14 @@ Strategy Logic:
 - Exchange outflows = Hodling behavior = Bullish
 """
 
+import asyncio
+import bisect
+import os
+import random
 import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
@@ -25,6 +32,65 @@ from strategies.models.signals import Signal, SignalAction, SignalConfidence, Si
 # OpenTelemetry tracer for manual spans
 tracer = trace.get_tracer(__name__)
 
+# Confidence score cut-offs (inclusive) and the level at or above each
+_CONFIDENCE_THRESHOLDS = (0.5, 0.7)
+_CONFIDENCE_LEVELS = (
+    SignalConfidence.LOW,
+    SignalConfidence.MEDIUM,
+    SignalConfidence.HIGH,
+)
+
+
+# Resolved once at import: when tracing is off, spans are skipped outright
+# instead of going through a no-op tracer
+_TRACING_ENABLED = (
+    constants.ENABLE_OTEL and os.getenv("OTEL_SDK_DISABLED", "false").lower() != "true"
+)
+
+
+def _start_span(name: str, traced: bool = True):
+    """Start a span, or a no-op stand-in when tracing is off or not sampled."""
+    if traced and _TRACING_ENABLED:
+        return tracer.start_as_current_span(name)
+    return nullcontext(trace.INVALID_SPAN)
+
+
+# Hourly metrics history retained per asset (7 days)
+HISTORY_MAX_ENTRIES = 7 * 24
+
+# History row layout per asset: (active addresses, transaction volume,
+# network metric, exchange inflow, exchange outflow)
+HISTORY_FIELDS: dict[str, tuple[str, ...]] = {
+    "BTC": (
+        "active_addresses",
+        "transaction_volume_btc",
+        "hash_rate_eh",
+        "exchange_inflow_btc",
+        "exchange_outflow_btc",
+    ),
+    "ETH": (
+        "active_addresses",
+        "transaction_volume_eth",
+        "defi_tvl_usd",
+        "exchange_inflow_eth",
+        "exchange_outflow_eth",
+    ),
+}
+
+
+# Rate-limit key per asset, built once instead of formatted per tick
+_SIGNAL_KEYS = {asset: f"{asset}_onchain" for asset in HISTORY_FIELDS}
+
+
+@dataclass(slots=True)
+class GrowthMetrics:
+    """24-hour on-chain growth rates (percent) and current net exchange flow."""
+
+    active_addresses_24h: float
+    transaction_volume_24h: float
+    network_24h: float  # Hash rate for BTC, DeFi TVL for ETH
+    net_exchange_flow: float  # Positive = net inflow (bearish)
+
 
 class OnChainMetricsStrategy:
     """
@@ -34,6 +100,33 @@ class OnChainMetricsStrategy:
     shifts in network usage and adoption.
     """
 
+    # Symbol prefix -> asset key (only BTC/ETH supported for now)
+    _PREFIX_TO_ASSET = {"BTC": "BTC", "ETH": "ETH"}
+
+    # Fixed attribute set: no per-instance __dict__ on the per-tick path
+    __slots__ = (
+        "logger",
+        "network_growth_threshold",
+        "volume_threshold",
+        "min_signal_interval",
+        "metrics_cache",
+        "metrics_history",
+        "last_signal_times",
+        "_source_timestamps",
+        "_growth_cache",
+        "data_sources",
+        "signals_generated",
+        "last_update_time",
+        "last_fetch_time",
+        "fetch_interval",
+        "_fetch_interval_ns",
+        "_next_fetch_ns",
+        "_fetch_lock",
+        "_rng",
+        "span_sample_every",
+        "ticks_analyzed",
+    )
+
     def __init__(self, logger: structlog.BoundLogger | None = None):
         """Initialize the On-Chain Metrics Strategy."""
         self.logger = logger or structlog.get_logger()
@@ -47,8 +140,15 @@ class OnChainMetricsStrategy:
 
         # Metrics cache (QTZD-style data storage)
         self.metrics_cache: dict[str, dict[str, Any]] = {}
-        self.metrics_history: dict[str, list] = {}
-        self.last_signal_times: dict[str, datetime] = {}
+        # History rows per asset in HISTORY_FIELDS order, oldest first
+        self.metrics_history: dict[str, deque[tuple]] = {}
+        # Monotonic seconds of the last signal per key
+        self.last_signal_times: dict[str, float] = {}
+        # Source-reported timestamp of the last observation ingested per asset
+        self._source_timestamps: dict[str, Any] = {}
+        # Growth metrics per asset for the current history; history only
+        # changes hourly, so every other tick reuses the computed value
+        self._growth_cache: dict[str, GrowthMetrics] = {}
 
         # On-chain data sources (would need API keys in production)
         self.data_sources = {
@@ -62,6 +162,19 @@ class OnChainMetricsStrategy:
         self.last_update_time = time.time()
         self.last_fetch_time = 0
         self.fetch_interval = 3600  # 1 hour between on-chain data fetches
+        # Fetch schedule on the monotonic clock, in integer nanoseconds;
+        # last_fetch_time stays wall-clock for reporting
+        self._fetch_interval_ns = self.fetch_interval * 1_000_000_000
+        self._next_fetch_ns = 0
+        # Serializes fetches so concurrent ticks trigger a single upstream burst
+        self._fetch_lock = asyncio.Lock()
+
+        # Per-tick span sampling (1 in N analyzed ticks)
+        self.span_sample_every = max(1, constants.ONCHAIN_SPAN_SAMPLE_EVERY)
+        self.ticks_analyzed = 0
+
+        # Dedicated RNG for the simulated data sources
+        self._rng = random.Random()  # nosec B311
 
         self.logger.info(
             "On-Chain Metrics Strategy initialized",
@@ -83,49 +196,107 @@ class OnChainMetricsStrategy:
         Returns:
             Signal if on-chain conditions are met, None otherwise
         """
-        with tracer.start_as_current_span(
-            "onchain_metrics.process_market_data"
-        ) as span:
-            span.set_attribute("symbol", market_data.symbol or "UNKNOWN")
-            try:
-                current_time = time.time()
-
-                # Fetch on-chain metrics periodically (QTZD-style batch processing)
-                if current_time - self.last_fetch_time > self.fetch_interval:
-                    with tracer.start_as_current_span(
-                        "onchain_metrics.fetch_metrics"
-                    ) as fetch_span:
+        now_ns = time.monotonic_ns()
+        symbol = market_data.symbol
+
+        # Fetch on-chain metrics periodically (QTZD-style batch processing)
+        if now_ns > self._next_fetch_ns:
+            async with self._fetch_lock:
+                # Ticks that queued behind an in-flight fetch reuse its result
+                if now_ns > self._next_fetch_ns:
+                    current_time = time.time()
+                    with _start_span("onchain_metrics.fetch_metrics") as fetch_span:
                         fetch_span.set_attribute(
-                            "time_since_last_fetch", current_time - self.last_fetch_time
+                            "time_since_last_fetch",
+                            current_time - self.last_fetch_time,
                         )
                         await self._fetch_onchain_metrics()
                         self.last_fetch_time = current_time
+                        self._next_fetch_ns = now_ns + self._fetch_interval_ns
                         fetch_span.set_attribute("result", "metrics_fetched")
 
+        # Most ticks are for unsupported symbols or rate-limited assets; reject
+        # them before paying for a span
+        asset_key = self._prefilter(symbol)
+        if asset_key is None:
+            return None
+
+        # Trace 1 in N analyzed ticks; the rest run without span overhead
+        self.ticks_analyzed += 1
+        traced = self.ticks_analyzed % self.span_sample_every == 0
+
+        with _start_span("onchain_metrics.process_market_data", traced) as span:
+            span.set_attribute("symbol", symbol)
+            try:
                 # Generate signals based on cached metrics
-                signal = await self._analyze_onchain_metrics(market_data)
+                signal = self._analyze_onchain_metrics(market_data, asset_key, traced)
 
                 if signal:
                     self.signals_generated += 1
-                    span.set_attribute("result", "signal_generated")
-                    span.set_attribute("signal_type", signal.signal_type.value)
-                    span.set_attribute("signal_confidence", signal.confidence_score)
+                    self._set_signal_attributes(span, signal)
                     self.logger.info(
                         "On-chain metrics signal generated",
                         signal_type=signal.signal_type,
-                        symbol=market_data.symbol,
+                        symbol=symbol,
                     )
                 else:
                     span.set_attribute("result", "no_signal")
 
-                return signal
-
             except Exception as e:
-                span.set_attribute("error", str(e))
-                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+                if traced:
+                    self._set_error_attributes(span, e)
+                else:
+                    # Errors are always traced, even on unsampled ticks
+                    with _start_span(
+                        "onchain_metrics.process_market_data"
+                    ) as error_span:
+                        error_span.set_attribute("symbol", symbol)
+                        self._set_error_attributes(error_span, e)
                 self.logger.error("Error processing on-chain metrics", error=str(e))
                 return None
 
+        if signal and not traced:
+            # Signal emissions are always traced, even on unsampled ticks
+            with _start_span("onchain_metrics.process_market_data") as span:
+                span.set_attribute("symbol", symbol)
+                self._set_signal_attributes(span, signal)
+
+        return signal
+
+    @staticmethod
+    def _set_signal_attributes(span: trace.Span, signal: Signal) -> None:
+        """Record a generated signal on a span."""
+        span.set_attribute("result", "signal_generated")
+        span.set_attribute("signal_type", signal.signal_type.value)
+        span.set_attribute("signal_confidence", signal.confidence_score)
+
+    @staticmethod
+    def _set_error_attributes(span: trace.Span, error: Exception) -> None:
+        """Record a processing error on a span."""
+        span.record_exception(error)
+        span.set_attribute("error", str(error))
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+
+    def _asset_key(self, symbol: str | None) -> str | None:
+        """Map a trading symbol to the on-chain asset whose metrics apply."""
+        if not symbol:
+            return None
+        return self._PREFIX_TO_ASSET.get(symbol[:3])
+
+    def _prefilter(self, symbol: str | None) -> str | None:
+        """
+        Cheap per-tick guard run before any analysis.
+
+        Returns:
+            Asset key if the symbol is supported and not rate-limited, None otherwise
+        """
+        asset_key = self._asset_key(symbol)
+        if asset_key is None or not self._should_generate_signal(
+            _SIGNAL_KEYS[asset_key]
+        ):
+            return None
+        return asset_key
+
     async def _fetch_onchain_metrics(self) -> None:
         """
         Fetch on-chain metrics from various sources.
@@ -138,19 +309,20 @@ class OnChainMetricsStrategy:
             # Simplified on-chain metrics (in production, use real APIs)
             current_time = time.time()
 
-            # Simulate fetching Bitcoin network metrics
-            btc_metrics = await self._simulate_btc_metrics()
-            # Simulate fetching Ethereum network metrics
-            eth_metrics = await self._simulate_eth_metrics()
+            # Fetch Bitcoin and Ethereum network metrics concurrently
+            btc_metrics, eth_metrics = await asyncio.gather(
+                self._simulate_btc_metrics(), self._simulate_eth_metrics()
+            )
 
             # Update cache (QTZD-style data storage)
             self.metrics_cache.update(
                 {"BTC": btc_metrics, "ETH": eth_metrics, "last_updated": current_time}
             )
 
-            # Update history for trend analysis
-            self._update_metrics_history("BTC", btc_metrics)
-            self._update_metrics_history("ETH", eth_metrics)
+            # Update history for trend analysis, skipping re-served observations
+            for asset, metrics in (("BTC", btc_metrics), ("ETH", eth_metrics)):
+                if self._is_new_observation(asset, metrics):
+                    self._update_metrics_history(asset, metrics)
 
             self.logger.debug("On-chain metrics updated successfully")
 
@@ -163,20 +335,18 @@ class OnChainMetricsStrategy:
 
         In production, this would fetch real data from Glassnode, etc.
         """
-        import random
-
         # Simulate realistic Bitcoin network metrics
         base_addresses = 1000000
         base_volume = 500000
         base_hash_rate = 200
 
         return {
-            "active_addresses": base_addresses + random.randint(-50000, 50000),  # nosec B311
-            "transaction_volume_btc": base_volume + random.randint(-100000, 100000),  # nosec B311
-            "hash_rate_eh": base_hash_rate + random.randint(-20, 20),  # nosec B311
-            "exchange_inflow_btc": random.randint(1000, 5000),  # nosec B311
-            "exchange_outflow_btc": random.randint(1000, 5000),  # nosec B311
-            "network_value_usd": random.randint(800000000000, 1200000000000),  # nosec B311
+            "active_addresses": base_addresses + self._rng.randint(-50000, 50000),  # nosec B311
+            "transaction_volume_btc": base_volume + self._rng.randint(-100000, 100000),  # nosec B311
+            "hash_rate_eh": base_hash_rate + self._rng.randint(-20, 20),  # nosec B311
+            "exchange_inflow_btc": self._rng.randint(1000, 5000),  # nosec B311
+            "exchange_outflow_btc": self._rng.randint(1000, 5000),  # nosec B311
+            "network_value_usd": self._rng.randint(800000000000, 1200000000000),  # nosec B311
             "timestamp": time.time(),
         }
 
@@ -186,70 +356,70 @@ class OnChainMetricsStrategy:
 
         In production, this would fetch real data from various sources.
         """
-        import random
-
         # Simulate realistic Ethereum network metrics
         base_addresses = 800000
         base_volume = 300000
         base_gas = 50
 
         return {
-            "active_addresses": base_addresses + random.randint(-40000, 40000),  # nosec B311
-            "transaction_volume_eth": base_volume + random.randint(-50000, 50000),  # nosec B311
-            "avg_gas_price": base_gas + random.randint(-20, 20),  # nosec B311
-            "defi_tvl_usd": random.randint(50000000000, 100000000000),  # nosec B311
-            "exchange_inflow_eth": random.randint(50000, 200000),  # nosec B311
-            "exchange_outflow_eth": random.randint(50000, 200000),  # nosec B311
+            "active_addresses": base_addresses + self._rng.randint(-40000, 40000),  # nosec B311
+            "transaction_volume_eth": base_volume + self._rng.randint(-50000, 50000),  # nosec B311
+            "avg_gas_price": base_gas + self._rng.randint(-20, 20),  # nosec B311
+            "defi_tvl_usd": self._rng.randint(50000000000, 100000000000),  # nosec B311
+            "exchange_inflow_eth": self._rng.randint(50000, 200000),  # nosec B311
+            "exchange_outflow_eth": self._rng.randint(50000, 200000),  # nosec B311
             "timestamp": time.time(),
         }
 
+    def _is_new_observation(self, asset: str, metrics: dict[str, Any]) -> bool:
+        """
+        Check whether a source returned a fresh observation for an asset.
+
+        Sources can serve the same observation across fetches (e.g. their own
+        update cadence is slower than ours); appending it again would skew the
+        hourly growth windows.
+        """
+        source_timestamp = metrics.get("timestamp")
+        if source_timestamp is None:
+            return True
+        if self._source_timestamps.get(asset) == source_timestamp:
+            return False
+        self._source_timestamps[asset] = source_timestamp
+        return True
+
     def _update_metrics_history(self, asset: str, metrics: dict[str, Any]) -> None:
         """Update metrics history for trend analysis."""
-        if asset not in self.metrics_history:
-            self.metrics_history[asset] = []
+        fields = HISTORY_FIELDS.get(asset)
+        if fields is None:
+            return
 
-        self.metrics_history[asset].append(metrics)
+        history = self.metrics_history.get(asset)
+        if history is None:
+            # Bounded ring: appending past capacity evicts the oldest entry
+            history = self.metrics_history[asset] = deque(maxlen=HISTORY_MAX_ENTRIES)
 
-        # Keep only recent history (7 days worth of hourly data)
-        max_entries = 7 * 24  # 7 days * 24 hours
-        if len(self.metrics_history[asset]) > max_entries:
-            self.metrics_history[asset] = self.metrics_history[asset][-max_entries:]
+        history.append(tuple(metrics.get(field, 0) for field in fields))
+        self._growth_cache.pop(asset, None)
 
-    async def _analyze_onchain_metrics(
-        self, market_data: MarketDataMessage
+    def _analyze_onchain_metrics(
+        self, market_data: MarketDataMessage, asset_key: str, traced: bool = True
     ) -> Signal | None:
         """
         Analyze on-chain metrics and generate fundamental signals.
 
-        Uses QTZD-style threshold analysis and rate limiting.
+        Uses QTZD-style threshold analysis. The asset key comes from
+        _prefilter, which has already rejected unsupported symbols and
+        rate-limited assets.
         """
-        with tracer.start_as_current_span("onchain_metrics.analyze_metrics") as span:
+        with _start_span("onchain_metrics.analyze_metrics", traced) as span:
             span.set_attribute("symbol", market_data.symbol)
-            symbol = market_data.symbol
-
-            # Determine which asset metrics to use
-            if symbol.startswith("BTC"):
-                asset_metrics = self.metrics_cache.get("BTC")
-                asset_key = "BTC"
-            elif symbol.startswith("ETH"):
-                asset_metrics = self.metrics_cache.get("ETH")
-                asset_key = "ETH"
-            else:
-                span.set_attribute("result", "unsupported_symbol")
-                return None  # Only support BTC/ETH for now
-
             span.set_attribute("asset_key", asset_key)
+            asset_metrics = self.metrics_cache.get(asset_key)
 
             if not asset_metrics:
                 span.set_attribute("result", "no_asset_metrics")
                 return None
 
-            # Rate limiting (QTZD-style minimum intervals)
-            signal_key = f"{asset_key}_onchain"
-            if not self._should_generate_signal(signal_key):
-                span.set_attribute("result", "rate_limited")
-                return None
-
             # Calculate growth rates
             growth_metrics = self._calculate_growth_metrics(asset_key)
             if not growth_metrics:
@@ -262,7 +432,7 @@ class OnChainMetricsStrategy:
             )
 
             if signal:
-                self.last_signal_times[signal_key] = datetime.utcnow()
+                self.last_signal_times[_SIGNAL_KEYS[asset_key]] = time.monotonic()
                 span.set_attribute("result", "signal_generated")
                 span.set_attribute("signal_type", signal.signal_type.value)
                 span.set_attribute("confidence_score", signal.confidence_score)
@@ -271,86 +441,42 @@ class OnChainMetricsStrategy:
 
             return signal
 
-    def _calculate_growth_metrics(self, asset_key: str) -> dict[str, float] | None:
+    def _calculate_growth_metrics(self, asset_key: str) -> GrowthMetrics | None:
         """Calculate growth rates from historical data."""
-        history = self.metrics_history.get(asset_key, [])
+        cached = self._growth_cache.get(asset_key)
+        if cached is not None:
+            return cached
+
+        history = self.metrics_history.get(asset_key)
 
-        if len(history) < 24:  # Need at least 24 hours of data
+        if history is None or len(history) < 24:  # Need at least 24 hours of data
             return None
 
         current = history[-1]
-        day_ago = history[-24] if len(history) >= 24 else history[0]
-        week_ago = (
-            history[-168] if len(history) >= 168 else history[0]
-        )  # 7 days * 24 hours
+        day_ago = history[-24]
 
         try:
-            growth_metrics = {}
-
-            # Calculate 24-hour growth rates
-            if asset_key == "BTC":
-                growth_metrics["active_addresses_24h"] = (
-                    self._calculate_percentage_change(
-                        day_ago.get("active_addresses", 0),
-                        current.get("active_addresses", 0),
-                    )
-                )
-                growth_metrics["transaction_volume_24h"] = (
-                    self._calculate_percentage_change(
-                        day_ago.get("transaction_volume_btc", 0),
-                        current.get("transaction_volume_btc", 0),
-                    )
-                )
-                growth_metrics["hash_rate_24h"] = self._calculate_percentage_change(
-                    day_ago.get("hash_rate_eh", 0), current.get("hash_rate_eh", 0)
-                )
-
-                # Exchange flow analysis
-                inflow = current.get("exchange_inflow_btc", 0)
-                outflow = current.get("exchange_outflow_btc", 0)
-                growth_metrics["net_exchange_flow"] = (
-                    inflow - outflow
-                )  # Positive = net inflow (bearish)
-
-            elif asset_key == "ETH":
-                growth_metrics["active_addresses_24h"] = (
-                    self._calculate_percentage_change(
-                        day_ago.get("active_addresses", 0),
-                        current.get("active_addresses", 0),
-                    )
-                )
-                growth_metrics["transaction_volume_24h"] = (
-                    self._calculate_percentage_change(
-                        day_ago.get("transaction_volume_eth", 0),
-                        current.get("transaction_volume_eth", 0),
-                    )
-                )
-                growth_metrics["defi_tvl_24h"] = self._calculate_percentage_change(
-                    day_ago.get("defi_tvl_usd", 0), current.get("defi_tvl_usd", 0)
-                )
-
-                # Exchange flow analysis
-                inflow = current.get("exchange_inflow_eth", 0)
-                outflow = current.get("exchange_outflow_eth", 0)
-                growth_metrics["net_exchange_flow"] = inflow - outflow
-
+            # Calculate 24-hour growth rates (0 when there is no base value)
+            growth_metrics = GrowthMetrics(
+                *(
+                    ((now - then) / then) * 100 if then != 0 else 0
+                    for now, then in zip(current[:3], day_ago[:3], strict=True)
+                ),
+                # Exchange flow analysis: positive = net inflow (bearish)
+                net_exchange_flow=current[3] - current[4],
+            )
+            self._growth_cache[asset_key] = growth_metrics
             return growth_metrics
 
         except Exception as e:
             self.logger.error("Error calculating growth metrics", error=str(e))
             return None
 
-    def _calculate_percentage_change(self, old_value: float, new_value: float) -> float:
-        """Calculate percentage change between two values."""
-        if old_value == 0:
-            return 0
-        return ((new_value - old_value) / old_value) * 100
-
     def _evaluate_fundamental_conditions(
         self,
         asset_key: str,
         current_metrics: dict[str, Any],
-        growth_metrics: dict[str, float],
+        growth_metrics: GrowthMetrics,
         market_data: MarketDataMessage,
     ) -> Signal | None:
         """
@@ -359,9 +485,9 @@ class OnChainMetricsStrategy:
         QTZD-style multi-condition analysis.
         """
         # Network growth analysis (QTZD-style threshold evaluation)
-        active_addresses_growth = growth_metrics.get("active_addresses_24h", 0)
-        transaction_volume_growth = growth_metrics.get("transaction_volume_24h", 0)
-        net_exchange_flow = growth_metrics.get("net_exchange_flow", 0)
+        active_addresses_growth = growth_metrics.active_addresses_24h
+        transaction_volume_growth = growth_metrics.transaction_volume_24h
+        net_exchange_flow = growth_metrics.net_exchange_flow
 
         # Strong network fundamentals = Bullish signal
         if (
@@ -370,7 +496,7 @@ class OnChainMetricsStrategy:
         ):
             # Additional confirmation for Bitcoin
             if asset_key == "BTC":
-                hash_rate_growth = growth_metrics.get("hash_rate_24h", 0)
+                hash_rate_growth = growth_metrics.network_24h
                 if (
                     hash_rate_growth > 0
                 ):  # Hash rate increasing = network security improving
@@ -397,7 +523,7 @@ class OnChainMetricsStrategy:
 
             # Additional confirmation for Ethereum
             elif asset_key == "ETH":
-                defi_tvl_growth = growth_metrics.get("defi_tvl_24h", 0)
+                defi_tvl_growth = growth_metrics.network_24h
                 if defi_tvl_growth > 5:  # DeFi TVL growing = ecosystem usage increasing
                     confidence_score = min(
                         0.75, (active_addresses_growth + transaction_volume_growth) / 35
@@ -446,11 +572,11 @@ class OnChainMetricsStrategy:
 
     def _should_generate_signal(self, signal_key: str) -> bool:
         """Check if enough time has passed since last signal."""
-        if signal_key not in self.last_signal_times:
+        last_signal_time = self.last_signal_times.get(signal_key)
+        if last_signal_time is None:
             return True
 
-        time_since_last = datetime.utcnow() - self.last_signal_times[signal_key]
-        return time_since_last.total_seconds() >= self.min_signal_interval
+        return time.monotonic() - last_signal_time >= self.min_signal_interval
 
     def _create_onchain_signal(
         self,
@@ -462,22 +588,26 @@ class OnChainMetricsStrategy:
         market_data: MarketDataMessage,
         metadata: dict[str, Any],
     ) -> Signal:
-        """Create an on-chain based trading signal."""
+        """
+        Create an on-chain based trading signal.
+
+        ``metadata`` is built fresh by each caller and is completed in place.
+        """
+        metadata["reasoning"] = reasoning
+        metadata["timestamp"] = datetime.utcnow().isoformat()
 
         # Map confidence score to confidence level
-        if confidence_score >= 0.7:
-            confidence = SignalConfidence.HIGH
-        elif confidence_score >= 0.5:
-            confidence = SignalConfidence.MEDIUM
-        else:
-            confidence = SignalConfidence.LOW
+        confidence = _CONFIDENCE_LEVELS[
+            bisect.bisect_right(_CONFIDENCE_THRESHOLDS, confidence_score)
+        ]
 
         # Get current price from market data
+        data = market_data.data
         current_price = 0.0
-        if market_data.is_ticker and hasattr(market_data.data, "c"):
-            current_price = float(market_data.data.c)
-        elif market_data.is_trade and hasattr(market_data.data, "p"):
-            current_price = float(market_data.data.p)
+        if market_data.is_ticker and hasattr(data, "c"):
+            current_price = float(data.c)
+        elif market_data.is_trade and hasattr(data, "p"):
+            current_price = float(data.p)
 
         return Signal(
             symbol=symbol,
@@ -487,11 +617,7 @@ class OnChainMetricsStrategy:
             confidence_score=confidence_score,
             price=current_price,
             strategy_name="onchain_metrics",
-            metadata={
-                **metadata,
-                "reasoning": reasoning,
-                "timestamp": datetime.utcnow().isoformat(),
-            },
+            metadata=metadata,
         )
 
     def get_metrics(self) -> dict[str, Any]:
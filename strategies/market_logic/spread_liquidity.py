@@ -10,9 +10,14 @@ Win Rate Target: 55-65%
 Signal Frequency: 5-10 per symbol per day
 """
 
+import logging
 import time
-from collections import defaultdict, deque
-from datetime import datetime
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional
 
 import structlog
@@ -23,9 +28,47 @@ from strategies.models.spread_metrics import SpreadEvent, SpreadMetrics, SpreadS
 
 logger = structlog.get_logger(__name__)
 
+# Stdlib logger backing the structlog logger, used for cheap level checks
+_stdlib_logger = logging.getLogger(__name__)
+
 # OpenTelemetry tracer for manual spans
 tracer = trace.get_tracer(__name__)
 
+# Quantity of a (price, quantity) order book level
+_level_qty = itemgetter(1)
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Per-tick spread state bits, packed into one int by _compare_to_history
+_WIDENING = 1
+_NARROWING = 2
+_ABNORMAL = 4
+
+
+def _to_unix_ns(timestamp: datetime) -> int:
+    """Convert a snapshot timestamp to Unix nanoseconds (naive means UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return int(timestamp.timestamp() * _NS_PER_SECOND)
+
+
+@dataclass(slots=True)
+class SymbolState:
+    """Per-symbol rolling state, fetched with a single lookup per tick."""
+
+    history: deque  # deque[SpreadMetrics], bounded by lookback_ticks
+
+    # Running sums over history, kept in step with the deque so averages
+    # don't re-scan it every tick
+    spread_sum: float = 0.0
+    depth_sum: float = 0.0
+
+    # Active wide spread event: {"start_time": unix_ns, "spread_bps": value}
+    wide_event: dict | None = None
+
+    # Last signal time on the snapshot clock (unix ns)
+    last_signal_ns: int | None = None
+
 
 class SpreadLiquidityStrategy:
     """
@@ -83,18 +126,16 @@ class SpreadLiquidityStrategy:
         self.base_confidence = base_confidence
         self.lookback_ticks = lookback_ticks
         self.min_signal_interval = min_signal_interval_seconds
+        self._min_signal_interval_ns = int(min_signal_interval_seconds * _NS_PER_SECOND)
 
-        # History tracking: {symbol: deque[SpreadMetrics]}
-        self.spread_history: dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=lookback_ticks)
+        # Derived thresholds, fixed after init
+        self._widening_ratio_threshold = spread_ratio_threshold * 1.2
+        self._persistence_threshold_ns = int(
+            persistence_threshold_seconds * _NS_PER_SECOND
         )
 
-        # Event tracking: {symbol: {"start_time": timestamp, "spread_bps": value}}
-        self.wide_spread_events: dict[str, dict] = {}
-        self.narrow_spread_events: dict[str, dict] = {}
-
-        # Last signal time: {symbol: timestamp}
-        self.last_signal_time: dict[str, float] = {}
+        # Per-symbol history, running sums, events and rate limiting
+        self.symbol_state: dict[str, SymbolState] = {}
 
         # Statistics
         self.signals_generated = 0
@@ -108,6 +149,42 @@ class SpreadLiquidityStrategy:
             lookback_ticks=lookback_ticks,
         )
 
+    @property
+    def spread_history(self) -> Mapping[str, deque]:
+        """
+        Read-only snapshot of history per symbol: {symbol: deque[SpreadMetrics]}.
+
+        Built from symbol_state on each access; update symbol_state instead.
+        """
+        return MappingProxyType(
+            {symbol: state.history for symbol, state in self.symbol_state.items()}
+        )
+
+    @property
+    def wide_spread_events(self) -> Mapping[str, dict]:
+        """
+        Read-only snapshot of active wide spread events per symbol.
+
+        Maps symbol to {"start_time", "spread_bps"}. Built from symbol_state on
+        each access; update symbol_state instead.
+        """
+        return MappingProxyType(
+            {
+                symbol: state.wide_event
+                for symbol, state in self.symbol_state.items()
+                if state.wide_event is not None
+            }
+        )
+
+    def _get_state(self, symbol: str) -> SymbolState:
+        """Get a symbol's state, creating it on first use."""
+        state = self.symbol_state.get(symbol)
+        if state is None:
+            state = self.symbol_state[symbol] = SymbolState(
+                history=deque(maxlen=self.lookback_ticks)
+            )
+        return state
+
     def analyze(
         self,
         symbol: str,
@@ -132,16 +209,23 @@ class SpreadLiquidityStrategy:
             span.set_attribute("bids_count", len(bids))
             span.set_attribute("asks_count", len(asks))
 
-            if timestamp is None:
-                timestamp = datetime.utcnow()
-
             # Validate inputs
             if not bids or not asks:
                 span.set_attribute("result", "invalid_input")
                 return None
 
+            # Per-tick clock as integer nanoseconds; the datetime is only
+            # carried for the emitted models
+            if timestamp is None:
+                ts_ns = time.time_ns()
+                timestamp = datetime.utcnow()
+            else:
+                ts_ns = _to_unix_ns(timestamp)
+
             # Calculate spread metrics
-            metrics = self._calculate_spread_metrics(symbol, bids, asks, timestamp)
+            metrics = self._calculate_spread_metrics(
+                symbol, bids, asks, timestamp, ts_ns
+            )
             if not metrics:
                 span.set_attribute("result", "no_metrics")
                 return None
@@ -150,27 +234,41 @@ class SpreadLiquidityStrategy:
             span.set_attribute("mid_price", metrics.mid_price)
 
             # Update history
-            self.spread_history[symbol].append(metrics)
+            state = self._get_state(symbol)
+            self._append_history(state, metrics)
 
             # Need history for comparison
-            if len(self.spread_history[symbol]) < 3:
+            if len(state.history) < 3:
                 span.set_attribute("result", "insufficient_history")
                 return None
 
-            # Create snapshot with comparative metrics
-            snapshot = self._create_snapshot(symbol, metrics)
-            span.set_attribute("spread_ratio", snapshot.spread_ratio)
-            span.set_attribute("spread_velocity", snapshot.spread_velocity)
+            # Inside the rate limit window with no wide spread being tracked
+            # and a spread too tight to start tracking, no signal can come
+            # out of this tick; history is already updated, so stop here
+            last_signal_ns = state.last_signal_ns
+            if (
+                last_signal_ns is not None
+                and ts_ns - last_signal_ns < self._min_signal_interval_ns
+                and state.wide_event is None
+                and metrics.spread_bps <= self.spread_threshold_bps
+            ):
+                span.set_attribute("result", "rate_limited")
+                return None
+
+            # Comparative metrics (the snapshot model is only built for events)
+            comparison = self._compare_to_history(state, metrics)
+            span.set_attribute("spread_ratio", comparison[0])
+            span.set_attribute("spread_velocity", comparison[1])
 
             # Detect events
-            event = self._detect_event(symbol, snapshot, timestamp)
+            event = self._detect_event(state, metrics, comparison)
             if event:
                 self.events_detected += 1
                 span.set_attribute("event_type", event.event_type)
                 span.set_attribute("event_confidence", event.confidence)
 
                 # Generate signal
-                signal = self._generate_signal(event, snapshot)
+                signal = self._generate_signal(event, event.snapshot)
                 if signal:
                     self.signals_generated += 1
                     span.set_attribute("result", "signal_generated")
@@ -187,6 +285,7 @@ class SpreadLiquidityStrategy:
         bids: list[tuple[float, float]],
         asks: list[tuple[float, float]],
         timestamp: datetime,
+        ts_ns: int,
     ) -> SpreadMetrics | None:
         """Calculate spread metrics from order book."""
         try:
@@ -198,117 +297,138 @@ class SpreadLiquidityStrategy:
             if best_bid <= 0 or best_ask <= 0 or best_ask <= best_bid:
                 return None
 
-            # Mid price
-            mid_price = (best_bid + best_ask) / 2
-
-            # Spread calculations
-            spread_abs = best_ask - best_bid
-            spread_bps = (spread_abs / mid_price) * 10000
-            spread_pct = (spread_abs / mid_price) * 100
-
-            # Top 5 levels depth
-            bid_volume_top5 = sum(qty for _, qty in bids[:5])
-            ask_volume_top5 = sum(qty for _, qty in asks[:5])
-            total_depth = bid_volume_top5 + ask_volume_top5
-
-            return SpreadMetrics(
-                symbol=symbol,
-                timestamp=timestamp,
-                best_bid=best_bid,
-                best_ask=best_ask,
-                mid_price=mid_price,
-                spread_abs=spread_abs,
-                spread_bps=spread_bps,
-                spread_pct=spread_pct,
-                bid_volume_top5=bid_volume_top5,
-                ask_volume_top5=ask_volume_top5,
-                total_depth=total_depth,
+            # Top 5 levels depth; from_book derives mid price, spreads and total
+            return SpreadMetrics.from_book(
+                symbol,
+                timestamp,
+                best_bid,
+                best_ask,
+                sum(map(_level_qty, bids[:5])),
+                sum(map(_level_qty, asks[:5])),
+                ts_ns,
             )
         except Exception as e:
-            logger.error(f"Error calculating spread metrics: {e}", symbol=symbol)
+            logger.error(
+                "Error calculating spread metrics", error=str(e), symbol=symbol
+            )
             return None
 
-    def _create_snapshot(self, symbol: str, metrics: SpreadMetrics) -> SpreadSnapshot:
-        """Create snapshot with comparative metrics."""
-        history = list(self.spread_history[symbol])
+    @staticmethod
+    def _append_history(state: SymbolState, metrics: SpreadMetrics) -> None:
+        """Append metrics to a symbol's history, updating its running sums."""
+        history = state.history
+        spread_sum = state.spread_sum + metrics.spread_bps
+        depth_sum = state.depth_sum + metrics.total_depth
+        if len(history) == history.maxlen:
+            # Oldest entry is about to be evicted by the append
+            evicted = history[0]
+            spread_sum -= evicted.spread_bps
+            depth_sum -= evicted.total_depth
+
+        history.append(metrics)
+        state.spread_sum = spread_sum
+        state.depth_sum = depth_sum
+
+    def _compare_to_history(
+        self, state: SymbolState, metrics: SpreadMetrics
+    ) -> tuple[float, float, float, int]:
+        """
+        Compare metrics to recent history.
+
+        Returns:
+            (spread_ratio, spread_velocity, depth_reduction_pct, flags)
+        """
+        history = state.history
+        spread_bps = metrics.spread_bps
+        total_depth = metrics.total_depth
+        prior_count = max(1, len(history) - 1)
 
         # Calculate average spread (exclude current)
-        avg_spread_bps = sum(m.spread_bps for m in history[:-1]) / max(
-            1, len(history) - 1
-        )
+        avg_spread_bps = (state.spread_sum - spread_bps) / prior_count
 
         # Spread ratio
-        spread_ratio = (
-            metrics.spread_bps / avg_spread_bps if avg_spread_bps > 0 else 1.0
-        )
+        spread_ratio = spread_bps / avg_spread_bps if avg_spread_bps > 0 else 1.0
 
         # Spread velocity (change over last minute)
         spread_velocity = 0.0
         if len(history) >= 2:
-            # Compare to 1 minute ago (approximate with available history)
-            old_metric = (
-                history[0] if len(history) >= self.lookback_ticks else history[0]
-            )
-            time_diff = (metrics.timestamp - old_metric.timestamp).total_seconds()
+            # Compare to the oldest retained tick (approximates 1 minute ago)
+            old_metric = history[0]
+            time_diff = (metrics.ts_ns - old_metric.ts_ns) / _NS_PER_SECOND
 
             if time_diff > 0:
-                spread_change = (
-                    metrics.spread_bps - old_metric.spread_bps
-                ) / old_metric.spread_bps
+                old_spread_bps = old_metric.spread_bps
+                spread_change = (spread_bps - old_spread_bps) / old_spread_bps
                 spread_velocity = spread_change / time_diff  # % per second
 
         # Average depth (for reduction calculation)
-        avg_depth = sum(m.total_depth for m in history[:-1]) / max(1, len(history) - 1)
-        depth_reduction_pct = (
-            1.0 - (metrics.total_depth / avg_depth) if avg_depth > 0 else 0.0
-        )
+        avg_depth = (state.depth_sum - total_depth) / prior_count
+        depth_reduction_pct = 1.0 - (total_depth / avg_depth) if avg_depth > 0 else 0.0
 
         # Flags
-        is_widening = spread_velocity > self.velocity_threshold
-        is_narrowing = spread_velocity < -self.velocity_threshold
-        is_abnormal = spread_ratio > self.spread_ratio_threshold
+        velocity_threshold = self.velocity_threshold
+        flags = (
+            (spread_velocity > velocity_threshold)
+            | (spread_velocity < -velocity_threshold) << 1
+            | (spread_ratio > self.spread_ratio_threshold) << 2
+        )
 
+        return spread_ratio, spread_velocity, depth_reduction_pct, flags
+
+    @staticmethod
+    def _create_snapshot(
+        metrics: SpreadMetrics, comparison: tuple[float, float, float, int]
+    ) -> SpreadSnapshot:
+        """Create snapshot model from metrics and their comparison to history."""
+        spread_ratio, spread_velocity, depth_reduction_pct, flags = comparison
         return SpreadSnapshot(
             metrics=metrics,
             spread_ratio=spread_ratio,
             spread_velocity=spread_velocity,
             persistence_seconds=0.0,  # Will be calculated in event detection
-            is_widening=is_widening,
-            is_narrowing=is_narrowing,
-            is_abnormal=is_abnormal,
+            is_widening=bool(flags & _WIDENING),
+            is_narrowing=bool(flags & _NARROWING),
+            is_abnormal=bool(flags & _ABNORMAL),
             depth_reduction_pct=depth_reduction_pct,
         )
 
     def _detect_event(
-        self, symbol: str, snapshot: SpreadSnapshot, timestamp: datetime
+        self,
+        state: SymbolState,
+        metrics: SpreadMetrics,
+        comparison: tuple[float, float, float, int],
     ) -> SpreadEvent | None:
-        """Detect spread widening or narrowing event."""
-        current_time = timestamp.timestamp()
-        metrics = snapshot.metrics
+        """Detect spread widening or narrowing event from comparative metrics."""
+        spread_ratio, spread_velocity, depth_reduction_pct, flags = comparison
+        symbol = metrics.symbol
+        spread_bps = metrics.spread_bps
+        current_ns = metrics.ts_ns
 
         # Event 1: Spread Normalization (BUY signal)
         # Wide spread that has been persistent, now narrowing
-        if symbol in self.wide_spread_events:
-            event = self.wide_spread_events[symbol]
-            persistence = current_time - event["start_time"]
+        event = state.wide_event
+        if event is not None:
+            persistence_ns = current_ns - event["start_time"]
 
             # Check if normalizing
             if (
-                snapshot.is_narrowing
-                and snapshot.spread_ratio < self.spread_ratio_threshold
-                and persistence > self.persistence_threshold_seconds
+                flags & _NARROWING
+                and spread_ratio < self.spread_ratio_threshold
+                and persistence_ns > self._persistence_threshold_ns
             ):
                 # Event complete - liquidity returning
+                persistence = persistence_ns / _NS_PER_SECOND
                 spread_before = event["spread_bps"]
+                snapshot = self._create_snapshot(metrics, comparison)
 
                 spread_event = SpreadEvent(
                     event_type="narrowing",
                     symbol=symbol,
-                    timestamp=timestamp,
+                    timestamp=metrics.timestamp,
                     spread_before_bps=spread_before,
-                    spread_current_bps=metrics.spread_bps,
-                    spread_ratio=snapshot.spread_ratio,
-                    spread_velocity=snapshot.spread_velocity,
+                    spread_current_bps=spread_bps,
+                    spread_ratio=spread_ratio,
+                    spread_velocity=spread_velocity,
                     duration_seconds=persistence,
                     persistence_above_threshold=True,
                     confidence=self._calculate_confidence(
@@ -319,35 +439,34 @@ class SpreadLiquidityStrategy:
                 )
 
                 # Clear event
-                del self.wide_spread_events[symbol]
+                state.wide_event = None
 
                 return spread_event
 
         # Track wide spread events
-        if snapshot.is_abnormal and metrics.spread_bps > self.spread_threshold_bps:
-            if symbol not in self.wide_spread_events:
-                self.wide_spread_events[symbol] = {
-                    "start_time": current_time,
-                    "spread_bps": metrics.spread_bps,
+        if flags & _ABNORMAL and spread_bps > self.spread_threshold_bps:
+            if state.wide_event is None:
+                state.wide_event = {
+                    "start_time": current_ns,
+                    "spread_bps": spread_bps,
                 }
 
         # Event 2: Liquidity Withdrawal (SELL signal)
         # Rapid widening from tight spread with depth reduction
         if (
-            snapshot.is_widening
-            and snapshot.spread_ratio > self.spread_ratio_threshold * 1.2
-            and snapshot.depth_reduction_pct  # Higher threshold
-            > self.min_depth_reduction_pct
+            flags & _WIDENING
+            and spread_ratio > self._widening_ratio_threshold  # Higher threshold
+            and depth_reduction_pct > self.min_depth_reduction_pct
         ):
+            snapshot = self._create_snapshot(metrics, comparison)
             spread_event = SpreadEvent(
                 event_type="widening",
                 symbol=symbol,
-                timestamp=timestamp,
-                spread_before_bps=metrics.spread_bps
-                / (1 + snapshot.spread_velocity),  # Approximate
-                spread_current_bps=metrics.spread_bps,
-                spread_ratio=snapshot.spread_ratio,
-                spread_velocity=snapshot.spread_velocity,
+                timestamp=metrics.timestamp,
+                spread_before_bps=spread_bps / (1 + spread_velocity),  # Approximate
+                spread_current_bps=spread_bps,
+                spread_ratio=spread_ratio,
+                spread_velocity=spread_velocity,
                 duration_seconds=0.0,  # Immediate event
                 persistence_above_threshold=False,
                 confidence=self._calculate_confidence("widening", snapshot, 0.0),
@@ -401,22 +520,25 @@ class SpreadLiquidityStrategy:
             span.set_attribute("event_type", event.event_type)
             span.set_attribute("event_confidence", event.confidence)
 
-            # Rate limiting
-            current_time = time.time()
-            if event.symbol in self.last_signal_time:
-                time_since_last = current_time - self.last_signal_time[event.symbol]
-                if time_since_last < self.min_signal_interval:
+            metrics = snapshot.metrics
+
+            # Rate limiting on the snapshot clock
+            state = self._get_state(event.symbol)
+            current_ns = metrics.ts_ns
+            if state.last_signal_ns is not None:
+                elapsed_ns = current_ns - state.last_signal_ns
+                if elapsed_ns < self._min_signal_interval_ns:
+                    time_since_last = elapsed_ns / _NS_PER_SECOND
                     span.set_attribute("result", "rate_limited")
                     span.set_attribute("time_since_last", time_since_last)
-                    logger.debug(
-                        "Signal rate limited",
-                        symbol=event.symbol,
-                        time_since_last=time_since_last,
-                    )
+                    if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Signal rate limited",
+                            symbol=event.symbol,
+                            time_since_last=time_since_last,
+                        )
                     return None
 
-            metrics = snapshot.metrics
-
             # Determine signal type and action
             if event.event_type == "narrowing":
                 signal_type = SignalType.BUY
@@ -503,7 +625,7 @@ class SpreadLiquidityStrategy:
             )
 
             # Update last signal time
-            self.last_signal_time[event.symbol] = current_time
+            state.last_signal_ns = current_ns
 
             span.set_attribute("result", "signal_generated")
             span.set_attribute("signal_type", signal_type.value)
@@ -525,6 +647,8 @@ class SpreadLiquidityStrategy:
         return {
             "signals_generated": self.signals_generated,
             "events_detected": self.events_detected,
-            "symbols_tracked": len(self.spread_history),
-            "active_wide_events": len(self.wide_spread_events),
+            "symbols_tracked": len(self.symbol_state),
+            "active_wide_events": sum(
+                state.wide_event is not None for state in self.symbol_state.values()
+            ),
         }
@@ -5,13 +5,47 @@ This module contains Pydantic models for processing real-time market data
 from Binance WebSocket streams including depth updates, trades, and tickers.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Union
-
-from pydantic import BaseModel, Field, validator
+from functools import cache, cached_property
+from typing import Any, Self, Union
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class _CachedModel(BaseModel):
+    """
+    Base for models with cached_property values derived from their fields.
+
+    Cached values are computed on first access and kept in the instance
+    __dict__. model_copy(update=...) drops them so the copy re-derives them
+    from its updated fields. Assigning to a field in place does not, so
+    treat these messages as immutable once a derived value has been read.
+    """
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, discarding cached values when fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_property_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
+
+@cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of the cached_property attributes defined on a model class."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
 
 
-class MarkPriceData(BaseModel):
+class MarkPriceData(_CachedModel):
     """Mark price update from Binance WebSocket."""
 
     symbol: str = Field(..., description="Trading symbol")
@@ -22,20 +56,22 @@ class MarkPriceData(BaseModel):
     next_funding_time: int = Field(..., description="Next funding time in milliseconds")
     event_time: int = Field(..., description="Event time in milliseconds")
 
-    @validator("symbol")
-    def validate_symbol(cls, v):
+    @field_validator("symbol")
+    @classmethod
+    def validate_symbol(cls, v: str) -> str:
         """Validate trading symbol format."""
         if not v or len(v) < 6:
             raise ValueError("Invalid symbol format")
         return v.upper()
 
-    @validator(
+    @field_validator(
         "mark_price",
         "index_price",
         "estimated_settle_price",
         "funding_rate",
     )
-    def validate_numeric_string(cls, v):
+    @classmethod
+    def validate_numeric_string(cls, v: str) -> str:
         """Validate that the string can be converted to a float."""
         try:
             float(v)
@@ -43,9 +79,9 @@ class MarkPriceData(BaseModel):
         except ValueError:
             raise ValueError(f"Invalid numeric string: {v}")
 
-    @property
+    @cached_property
     def timestamp(self) -> datetime:
-        """Convert event_time to datetime."""
+        """Convert event_time to datetime (computed once per message)."""
         return datetime.fromtimestamp(self.event_time / 1000)
 
     @property
@@ -70,8 +106,9 @@ class DepthLevel(BaseModel):
     price: str = Field(..., description="Price level")
     quantity: str = Field(..., description="Quantity at this price level")
 
-    @validator("price", "quantity")
-    def validate_numeric_string(cls, v):
+    @field_validator("price", "quantity")
+    @classmethod
+    def validate_numeric_string(cls, v: str) -> str:
         """Validate that the string can be converted to a float."""
         try:
             float(v)
@@ -80,7 +117,7 @@ class DepthLevel(BaseModel):
             raise ValueError(f"Invalid numeric string: {v}")
 
 
-class DepthUpdate(BaseModel):
+class DepthUpdate(_CachedModel):
     """Order book depth update from Binance WebSocket."""
 
     symbol: str = Field(..., description="Trading symbol (e.g., BTCUSDT)")
@@ -90,21 +127,22 @@ class DepthUpdate(BaseModel):
     bids: list[DepthLevel] = Field(..., description="Bid orders")
     asks: list[DepthLevel] = Field(..., description="Ask orders")
 
-    @validator("symbol")
-    def validate_symbol(cls, v):
+    @field_validator("symbol")
+    @classmethod
+    def validate_symbol(cls, v: str) -> str:
         """Validate trading symbol format."""
         if not v or len(v) < 6:
             raise ValueError("Invalid symbol format")
         return v.upper()
 
-    @property
+    @cached_property
     def timestamp(self) -> datetime:
-        """Convert event_time to datetime."""
+        """Convert event_time to datetime (computed once per message)."""
         return datetime.fromtimestamp(self.event_time / 1000)
 
-    @property
+    @cached_property
     def spread_percent(self) -> float:
-        """Calculate the bid-ask spread as a percentage."""
+        """Calculate the bid-ask spread as a percentage (computed once)."""
         if not self.bids or not self.asks:
             return 0.0
 
@@ -112,9 +150,9 @@ class DepthUpdate(BaseModel):
         best_ask = float(self.asks[0].price)
         return ((best_ask - best_bid) / best_bid) * 100
 
-    @property
+    @cached_property
     def mid_price(self) -> float:
-        """Calculate the mid price."""
+        """Calculate the mid price (computed once)."""
         if not self.bids or not self.asks:
             return 0.0
 
@@ -123,7 +161,7 @@ class DepthUpdate(BaseModel):
         return (best_bid + best_ask) / 2
 
 
-class TradeData(BaseModel):
+class TradeData(_CachedModel):
     """Individual trade data from Binance WebSocket."""
 
     symbol: str = Field(..., description="Trading symbol")
@@ -136,15 +174,17 @@ class TradeData(BaseModel):
     is_buyer_maker: bool = Field(..., description="Whether buyer is maker")
     event_time: int = Field(..., description="Event time in milliseconds")
 
-    @validator("symbol")
-    def validate_symbol(cls, v):
+    @field_validator("symbol")
+    @classmethod
+    def validate_symbol(cls, v: str) -> str:
         """Validate trading symbol format."""
         if not v or len(v) < 6:
             raise ValueError("Invalid symbol format")
         return v.upper()
 
-    @validator("price", "quantity")
-    def validate_numeric_string(cls, v):
+    @field_validator("price", "quantity")
+    @classmethod
+    def validate_numeric_string(cls, v: str) -> str:
         """Validate that the string can be converted to a float."""
         try:
             float(v)
@@ -152,9 +192,9 @@ class TradeData(BaseModel):
         except ValueError:
             raise ValueError(f"Invalid numeric string: {v}")
 
-    @property
+    @cached_property
     def timestamp(self) -> datetime:
-        """Convert trade_time to datetime."""
+        """Convert trade_time to datetime (computed once per message)."""
         return datetime.fromtimestamp(self.trade_time / 1000)
 
     @property
@@ -173,7 +213,7 @@ class TradeData(BaseModel):
         return self.price_float * self.quantity_float
 
 
-class TickerData(BaseModel):
+class TickerData(_CachedModel):
     """24hr ticker data from Binance WebSocket."""
 
     symbol: str = Field(..., description="Trading symbol")
@@ -199,14 +239,15 @@ class TickerData(BaseModel):
     count: int = Field(..., description="Trade count")
     event_time: int = Field(..., description="Event time in milliseconds")
 
-    @validator("symbol")
-    def validate_symbol(cls, v):
+    @field_validator("symbol")
+    @classmethod
+    def validate_symbol(cls, v: str) -> str:
         """Validate trading symbol format."""
         if not v or len(v) < 6:
             raise ValueError("Invalid symbol format")
         return v.upper()
 
-    @validator(
+    @field_validator(
         "price_change",
         "price_change_percent",
         "weighted_avg_price",
@@ -223,7 +264,8 @@ class TickerData(BaseModel):
         "volume",
         "quote_volume",
     )
-    def validate_numeric_string(cls, v):
+    @classmethod
+    def validate_numeric_string(cls, v: str) -> str:
         """Validate that the string can be converted to a float."""
         try:
             float(v)
@@ -231,9 +273,9 @@ class TickerData(BaseModel):
         except ValueError:
             raise ValueError(f"Invalid numeric string: {v}")
 
-    @property
+    @cached_property
     def timestamp(self) -> datetime:
-        """Convert event_time to datetime."""
+        """Convert event_time to datetime (computed once per message)."""
         return datetime.fromtimestamp(self.event_time / 1000)
 
     @property
@@ -262,7 +304,16 @@ class TickerData(BaseModel):
         return float(self.quote_volume)
 
 
-class MarketDataMessage(BaseModel):
+# Payload model -> MarketDataMessage.kind tag
+_DATA_KINDS = (
+    (DepthUpdate, "depth"),
+    (TradeData, "trade"),
+    (TickerData, "ticker"),
+    (MarkPriceData, "mark_price"),
+)
+
+
+class MarketDataMessage(_CachedModel):
     """Generic market data message wrapper."""
 
     stream: str = Field(..., description="Stream name")
@@ -273,39 +324,49 @@ class MarketDataMessage(BaseModel):
         default_factory=datetime.utcnow, description="Message timestamp"
     )
 
-    @validator("stream")
-    def validate_stream(cls, v):
+    @field_validator("stream")
+    @classmethod
+    def validate_stream(cls, v: str) -> str:
         """Validate stream name format."""
         if not v or "@" not in v:
             raise ValueError("Invalid stream format")
         return v
 
-    @property
+    @cached_property
     def symbol(self) -> str:
-        """Extract symbol from stream name."""
+        """Extract symbol from stream name (parsed once per message)."""
         return self.stream.split("@")[0].upper()
 
-    @property
+    @cached_property
     def stream_type(self) -> str:
-        """Extract stream type from stream name."""
+        """Extract stream type from stream name (parsed once per message)."""
         return self.stream.split("@")[1]
 
+    @cached_property
+    def kind(self) -> str | None:
+        """Payload kind tag ("depth", "trade", "ticker", "mark_price"), resolved once."""
+        data = self.data
+        for model, kind in _DATA_KINDS:
+            if isinstance(data, model):
+                return kind
+        return None
+
     @property
     def is_depth(self) -> bool:
         """Check if this is a depth update."""
-        return isinstance(self.data, DepthUpdate)
+        return self.kind == "depth"
 
     @property
     def is_trade(self) -> bool:
         """Check if this is a trade."""
-        return isinstance(self.data, TradeData)
+        return self.kind == "trade"
 
     @property
     def is_ticker(self) -> bool:
         """Check if this is a ticker."""
-        return isinstance(self.data, TickerData)
+        return self.kind == "ticker"
 
     @property
     def is_mark_price(self) -> bool:
         """Check if this is a mark price update."""
-        return isinstance(self.data, MarkPriceData)
+        return self.kind == "mark_price"
@@ -6,23 +6,21 @@ iceberg order patterns (repeated refills, consistent sizing, price anchoring).
 """
 
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+# Snapshots retained per price level
+LEVEL_HISTORY_SIZE = 100
 
-@dataclass
-class LevelSnapshot:
-    """Single snapshot of an order book level."""
+# Read-only stand-ins for a symbol with no tracked levels
+_NO_LEVELS: dict = {}
+_NO_PRICES: list = []
 
-    price: float
-    quantity: float
-    timestamp: float  # Unix timestamp for performance
-    side: str  # "bid" or "ask"
 
-
-@dataclass
+@dataclass(slots=True)
 class LevelHistory:
     """
     Historical tracking for a single price level.
@@ -35,13 +33,22 @@ class LevelHistory:
 
     price: float
     side: str
-    snapshots: deque  # deque of LevelSnapshot
+
+    # Retained snapshots as parallel flat buffers (quantity, Unix timestamp)
+    # instead of one object per snapshot
+    volumes: deque = field(default_factory=lambda: deque(maxlen=LEVEL_HISTORY_SIZE))
+    timestamps: deque = field(default_factory=lambda: deque(maxlen=LEVEL_HISTORY_SIZE))
 
     # Pattern detection
     refill_count: int = 0
     last_refill_time: float | None = None
     avg_refill_speed_seconds: float = 0.0
 
+    # Running (Welford) mean and sum of squared deviations over `volumes`,
+    # updated as snapshots are appended and evicted
+    volume_mean: float = 0.0
+    volume_m2: float = 0.0
+
     # Volume statistics
     avg_volume: float = 0.0
     volume_std_dev: float = 0.0
@@ -60,7 +67,7 @@ class LevelHistory:
             self.last_seen = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class IcebergPattern:
     """
     Detected iceberg order pattern.
@@ -126,9 +133,22 @@ class OrderBookTracker:
         self.consistency_threshold = consistency_threshold
         self.min_refill_count = min_refill_count
 
-        # Storage: {symbol: {price: LevelHistory}}
-        self.bid_levels: dict[str, dict[float, LevelHistory]] = defaultdict(dict)
-        self.ask_levels: dict[str, dict[float, LevelHistory]] = defaultdict(dict)
+        # Storage: {symbol: {price: LevelHistory}}, each per-symbol dict kept
+        # in least- to most-recently-seen order so expiry only looks at the front.
+        # Symbols are only added by update_orderbook (read paths use .get()) and
+        # are themselves kept in least- to most-recently-updated order so the
+        # oldest can be evicted once max_symbols is reached
+        self.bid_levels: OrderedDict[str, OrderedDict[float, LevelHistory]] = (
+            OrderedDict()
+        )
+        self.ask_levels: OrderedDict[str, OrderedDict[float, LevelHistory]] = (
+            OrderedDict()
+        )
+
+        # Ascending price index per symbol and side, kept in step with the
+        # level dicts so proximity scans can bisect to the in-range prices
+        self._bid_prices: dict[str, list[float]] = {}
+        self._ask_prices: dict[str, list[float]] = {}
 
         # Statistics
         self.total_levels_tracked = 0
@@ -139,7 +159,7 @@ class OrderBookTracker:
         symbol: str,
         bids: list[tuple[float, float]],
         asks: list[tuple[float, float]],
-        timestamp: datetime | None = None,
+        timestamp: datetime | float | None = None,
     ) -> None:
         """
         Update tracker with new orderbook snapshot.
@@ -148,49 +168,102 @@ class OrderBookTracker:
             symbol: Trading symbol
             bids: [(price, quantity), ...]
             asks: [(price, quantity), ...]
-            timestamp: Snapshot timestamp
+            timestamp: Snapshot timestamp (datetime or Unix seconds)
         """
         if timestamp is None:
-            timestamp = datetime.utcnow()
-
-        unix_ts = timestamp.timestamp()
-
-        # Update bid levels
-        for price, qty in bids:
-            self._update_level(symbol, price, qty, unix_ts, "bid")
-
-        # Update ask levels
-        for price, qty in asks:
-            self._update_level(symbol, price, qty, unix_ts, "ask")
+            unix_ts = time.time()
+        elif isinstance(timestamp, datetime):
+            unix_ts = timestamp.timestamp()
+        else:
+            unix_ts = timestamp
+
+        # Update bid and ask levels (per-symbol dicts resolved once per side)
+        bid_levels = self.bid_levels.get(symbol)
+        if bid_levels is None:
+            # New symbol: drop the least recently updated one if at capacity
+            if len(self.bid_levels) >= self.max_symbols:
+                stale_symbol, _ = self.bid_levels.popitem(last=False)
+                self.ask_levels.popitem(last=False)
+                del self._bid_prices[stale_symbol]
+                del self._ask_prices[stale_symbol]
+            bid_levels = self.bid_levels[symbol] = OrderedDict()
+            ask_levels = self.ask_levels[symbol] = OrderedDict()
+            bid_prices = self._bid_prices[symbol] = []
+            ask_prices = self._ask_prices[symbol] = []
+        else:
+            self.bid_levels.move_to_end(symbol)
+            self.ask_levels.move_to_end(symbol)
+            ask_levels = self.ask_levels[symbol]
+            bid_prices = self._bid_prices[symbol]
+            ask_prices = self._ask_prices[symbol]
+        self._update_side(bid_levels, bid_prices, bids, unix_ts, "bid")
+        self._update_side(ask_levels, ask_prices, asks, unix_ts, "ask")
 
         # Cleanup old levels
-        self._cleanup_old_levels(symbol, unix_ts)
+        cutoff_time = unix_ts - self.history_window
+        self._expire_levels(bid_levels, bid_prices, cutoff_time)
+        self._expire_levels(ask_levels, ask_prices, cutoff_time)
 
-    def _update_level(
-        self, symbol: str, price: float, quantity: float, timestamp: float, side: str
+    def _update_side(
+        self,
+        levels: OrderedDict[float, LevelHistory],
+        prices: list[float],
+        entries: list[tuple[float, float]],
+        timestamp: float,
+        side: str,
     ) -> None:
-        """Update a single price level."""
-        levels = self.bid_levels if side == "bid" else self.ask_levels
+        """Update all price levels of one side of a symbol's book."""
+        update_level = self._update_level
+        for price, qty in entries:
+            update_level(levels, prices, price, qty, timestamp, side)
 
+    def _update_level(
+        self,
+        levels: OrderedDict[float, LevelHistory],
+        prices: list[float],
+        price: float,
+        quantity: float,
+        timestamp: float,
+        side: str,
+    ) -> None:
+        """Update a single price level in a symbol's per-side level dict."""
         # Get or create level history
-        if price not in levels[symbol]:
-            levels[symbol][price] = LevelHistory(
+        history = levels.get(price)
+        if history is None:
+            history = levels[price] = LevelHistory(
                 price=price,
                 side=side,
-                snapshots=deque(maxlen=100),  # Limit snapshots
                 first_seen=timestamp,
                 last_seen=timestamp,
                 total_appearances=0,
             )
+            insort(prices, price)
             self.total_levels_tracked += 1
-
-        history = levels[symbol][price]
-
-        # Add snapshot
-        snapshot = LevelSnapshot(
-            price=price, quantity=quantity, timestamp=timestamp, side=side
-        )
-        history.snapshots.append(snapshot)
+        else:
+            # Keep the dict in last-seen order for expiry
+            levels.move_to_end(price)
+
+        # Add snapshot, keeping the running volume moments in step
+        volumes = history.volumes
+        count = len(volumes)
+        mean = history.volume_mean
+        m2 = history.volume_m2
+        if count == volumes.maxlen:
+            # Remove the oldest volume, which the append below evicts
+            evicted = volumes[0]
+            count -= 1
+            delta = evicted - mean
+            mean -= delta / count
+            m2 -= delta * (evicted - mean)
+        count += 1
+        delta = quantity - mean
+        mean += delta / count
+        m2 += delta * (quantity - mean)
+        history.volume_mean = mean
+        history.volume_m2 = m2
+
+        volumes.append(quantity)
+        history.timestamps.append(timestamp)
         history.last_seen = timestamp
         history.total_appearances += 1
 
@@ -206,50 +279,39 @@ class OrderBookTracker:
                     time_since_first / history.refill_count
                 )
 
-        # Update statistics
-        self._update_statistics(history)
-
     def _is_refill(self, history: LevelHistory, current_qty: float) -> bool:
         """
         Detect if current quantity represents a refill.
 
         Pattern: Volume drops significantly then restores quickly.
         """
-        if len(history.snapshots) < 3:
+        volumes = history.volumes
+        if len(volumes) < 3:
             return False
 
-        # Get recent snapshots
-        recent = list(history.snapshots)[-3:]
-
-        # Check for depletion then restoration
+        # Check for depletion then restoration over the last three snapshots
         # Pattern: high -> low -> high
-        if len(recent) == 3:
-            vol_0, vol_1, vol_2 = (
-                recent[0].quantity,
-                recent[1].quantity,
-                recent[2].quantity,
-            )
+        vol_0, vol_1, vol_2 = volumes[-3], volumes[-2], volumes[-1]
 
-            # Volume dropped by >50% then restored by >80%
-            if vol_1 < vol_0 * 0.5 and vol_2 > vol_0 * 0.8:
-                # Check speed (fast refill)
-                time_elapsed = recent[2].timestamp - recent[0].timestamp
-                if time_elapsed < self.refill_speed_threshold:
-                    return True
+        # Volume dropped by >50% then restored by >80%
+        if vol_1 < vol_0 * 0.5 and vol_2 > vol_0 * 0.8:
+            # Check speed (fast refill)
+            timestamps = history.timestamps
+            time_elapsed = timestamps[-1] - timestamps[-3]
+            if time_elapsed < self.refill_speed_threshold:
+                return True
 
         return False
 
     def _update_statistics(self, history: LevelHistory) -> None:
         """Update volume statistics for level."""
-        if len(history.snapshots) < 2:
+        count = len(history.volumes)
+        if count < 2:
             return
 
-        volumes = [s.quantity for s in history.snapshots]
-
-        # Calculate mean and std dev
-        mean_vol = sum(volumes) / len(volumes)
-        variance = sum((v - mean_vol) ** 2 for v in volumes) / len(volumes)
-        std_dev = variance**0.5
+        # Mean and population std dev from the running moments, O(1)
+        mean_vol = history.volume_mean
+        std_dev = (max(history.volume_m2, 0.0) / count) ** 0.5
 
         history.avg_volume = mean_vol
         history.volume_std_dev = std_dev
@@ -259,27 +321,26 @@ class OrderBookTracker:
             cv = std_dev / mean_vol  # Coefficient of variation
             history.consistent_volume = cv < self.consistency_threshold
 
-    def _cleanup_old_levels(self, symbol: str, current_time: float) -> None:
-        """Remove levels outside history window."""
-        cutoff_time = current_time - self.history_window
-
-        # Clean bids
-        to_remove = [
-            price
-            for price, hist in self.bid_levels[symbol].items()
-            if hist.last_seen < cutoff_time
-        ]
-        for price in to_remove:
-            del self.bid_levels[symbol][price]
-
-        # Clean asks
-        to_remove = [
-            price
-            for price, hist in self.ask_levels[symbol].items()
-            if hist.last_seen < cutoff_time
-        ]
-        for price in to_remove:
-            del self.ask_levels[symbol][price]
+    @staticmethod
+    def _expire_levels(
+        levels: OrderedDict[float, LevelHistory],
+        prices: list[float],
+        cutoff_time: float,
+    ) -> None:
+        """
+        Drop levels last seen before the cutoff, along with their entries
+        in the sorted price index.
+
+        Levels are moved to the end whenever they are seen, so with snapshots
+        arriving in time order the expired ones form a prefix of the dict and
+        the scan stops at the first live level.
+        """
+        while levels:
+            price = next(iter(levels))
+            if levels[price].last_seen >= cutoff_time:
+                break
+            del levels[price]
+            del prices[bisect_left(prices, price)]
 
     def detect_icebergs(
         self, symbol: str, current_price: float, proximity_pct: float = 1.0
@@ -296,111 +357,92 @@ class OrderBookTracker:
             List of detected iceberg patterns
         """
         icebergs = []
+        # Read the clocks once for every level checked in this pass
+        current_time = time.time()
+        detected_at = datetime.utcnow()
 
         # Price range to check
         price_range = current_price * (proximity_pct / 100.0)
         min_price = current_price - price_range
         max_price = current_price + price_range
 
-        # Check bid levels
-        for price, history in self.bid_levels[symbol].items():
-            if min_price <= price <= max_price:
-                pattern = self._check_iceberg_pattern(symbol, price, history)
-                if pattern:
-                    icebergs.append(pattern)
+        # Check bid levels, bisecting the sorted price index to the range
+        levels = self.bid_levels.get(symbol, _NO_LEVELS)
+        prices = self._bid_prices.get(symbol, _NO_PRICES)
+        lo = bisect_left(prices, min_price)
+        hi = bisect_right(prices, max_price, lo)
+        for price in prices[lo:hi]:
+            pattern = self._check_iceberg_pattern(
+                symbol, price, levels[price], current_time, detected_at
+            )
+            if pattern:
+                icebergs.append(pattern)
 
         # Check ask levels
-        for price, history in self.ask_levels[symbol].items():
-            if min_price <= price <= max_price:
-                pattern = self._check_iceberg_pattern(symbol, price, history)
-                if pattern:
-                    icebergs.append(pattern)
+        levels = self.ask_levels.get(symbol, _NO_LEVELS)
+        prices = self._ask_prices.get(symbol, _NO_PRICES)
+        lo = bisect_left(prices, min_price)
+        hi = bisect_right(prices, max_price, lo)
+        for price in prices[lo:hi]:
+            pattern = self._check_iceberg_pattern(
+                symbol, price, levels[price], current_time, detected_at
+            )
+            if pattern:
+                icebergs.append(pattern)
 
         return icebergs
 
     def _check_iceberg_pattern(
-        self, symbol: str, price: float, history: LevelHistory
+        self,
+        symbol: str,
+        price: float,
+        history: LevelHistory,
+        current_time: float | None = None,
+        detected_at: datetime | None = None,
     ) -> IcebergPattern | None:
         """Check if level exhibits iceberg pattern."""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         persistence = current_time - history.first_seen
 
-        # Pattern 1: Repeated Refills (strongest signal)
+        # Volume statistics are only read from here on, so derive them from
+        # the running moments at check time rather than on every level update
+        self._update_statistics(history)
+
         if history.refill_count >= self.min_refill_count:
+            # Pattern 1: Repeated Refills (strongest signal)
             confidence = min(0.85, 0.65 + history.refill_count * 0.05)
-
-            pattern = IcebergPattern(
-                symbol=symbol,
-                price=price,
-                side=history.side,
-                refill_count=history.refill_count,
-                avg_refill_speed_seconds=history.avg_refill_speed_seconds,
-                volume_consistency_score=(
-                    1.0 - (history.volume_std_dev / history.avg_volume)
-                    if history.avg_volume > 0
-                    else 0.0
-                ),
-                persistence_seconds=persistence,
-                confidence=confidence,
-                pattern_type="refill",
-                detected_at=datetime.utcnow(),
-                level_history=history,
-            )
-
-            self.total_icebergs_detected += 1
-            return pattern
-
-        # Pattern 2: Consistent Volume + Persistence
-        if history.consistent_volume and persistence > 120:  # 2+ minutes
+            pattern_type = "refill"
+        elif history.consistent_volume and persistence > 120:  # 2+ minutes
+            # Pattern 2: Consistent Volume + Persistence
             confidence = 0.70
-
-            pattern = IcebergPattern(
-                symbol=symbol,
-                price=price,
-                side=history.side,
-                refill_count=history.refill_count,
-                avg_refill_speed_seconds=history.avg_refill_speed_seconds,
-                volume_consistency_score=(
-                    1.0 - (history.volume_std_dev / history.avg_volume)
-                    if history.avg_volume > 0
-                    else 0.0
-                ),
-                persistence_seconds=persistence,
-                confidence=confidence,
-                pattern_type="consistent_size",
-                detected_at=datetime.utcnow(),
-                level_history=history,
-            )
-
-            self.total_icebergs_detected += 1
-            return pattern
-
-        # Pattern 3: Price Anchoring (very persistent level)
-        if persistence > 180:  # 3+ minutes
+            pattern_type = "consistent_size"
+        elif persistence > 180:  # 3+ minutes
+            # Pattern 3: Price Anchoring (very persistent level)
             confidence = 0.75
+            pattern_type = "anchor"
+        else:
+            return None
+
+        avg_volume = history.avg_volume
+        pattern = IcebergPattern(
+            symbol=symbol,
+            price=price,
+            side=history.side,
+            refill_count=history.refill_count,
+            avg_refill_speed_seconds=history.avg_refill_speed_seconds,
+            volume_consistency_score=(
+                1.0 - (history.volume_std_dev / avg_volume) if avg_volume > 0 else 0.0
+            ),
+            persistence_seconds=persistence,
+            confidence=confidence,
+            pattern_type=pattern_type,
+            detected_at=detected_at or datetime.utcnow(),
+            level_history=history,
+        )
 
-            pattern = IcebergPattern(
-                symbol=symbol,
-                price=price,
-                side=history.side,
-                refill_count=history.refill_count,
-                avg_refill_speed_seconds=history.avg_refill_speed_seconds,
-                volume_consistency_score=(
-                    1.0 - (history.volume_std_dev / history.avg_volume)
-                    if history.avg_volume > 0
-                    else 0.0
-                ),
-                persistence_seconds=persistence,
-                confidence=confidence,
-                pattern_type="anchor",
-                detected_at=datetime.utcnow(),
-                level_history=history,
-            )
-
-            self.total_icebergs_detected += 1
-            return pattern
-
-        return None
+        self.total_icebergs_detected += 1
+        return pattern
 
     def get_statistics(self) -> dict[str, any]:
         """Get tracker statistics."""
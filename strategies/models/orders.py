@@ -16,7 +16,7 @@ except ImportError:
 from enum import Enum, StrEnum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class OrderType(StrEnum):
@@ -50,6 +50,10 @@ class PositionType(StrEnum):
     SHORT = "SHORT"
 
 
+# Response statuses counted as successful submissions
+SUCCESS_STATUSES = frozenset({"success", "accepted", "submitted"})
+
+
 class TradeOrder(BaseModel):
     """Trade order model for sending to TradeEngine."""
 
@@ -85,54 +89,56 @@ class TradeOrder(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
-    @validator("symbol")
-    def validate_symbol(cls, v):
+    @field_validator("symbol")
+    @classmethod
+    def validate_symbol(cls, v: str) -> str:
         """Validate trading symbol format."""
         if not v or len(v) < 6:
             raise ValueError("Invalid symbol format")
         return v.upper()
 
-    @validator("order_id")
-    def validate_order_id(cls, v):
+    @field_validator("order_id")
+    @classmethod
+    def validate_order_id(cls, v: str) -> str:
         """Validate order ID format."""
         if not v or len(v) < 10:
             raise ValueError("Order ID must be at least 10 characters")
         return v
 
-    @validator("signal_id")
-    def validate_signal_id(cls, v):
+    @field_validator("signal_id")
+    @classmethod
+    def validate_signal_id(cls, v: str) -> str:
         """Validate signal ID format."""
         if not v or len(v) < 10:
             raise ValueError("Signal ID must be at least 10 characters")
         return v
 
-    @validator("price")
-    def validate_price_for_limit_orders(cls, v, values):
+    @field_validator("price")
+    @classmethod
+    def validate_price_for_limit_orders(
+        cls, v: float | None, info: ValidationInfo
+    ) -> float | None:
         """Validate price is provided for LIMIT orders."""
         if (
-            values.get("order_type") in [OrderType.LIMIT, OrderType.STOP_LIMIT]
+            info.data.get("order_type") in [OrderType.LIMIT, OrderType.STOP_LIMIT]
             and v is None
         ):
             raise ValueError("Price is required for LIMIT and STOP_LIMIT orders")
         return v
 
-    @validator("stop_price")
-    def validate_stop_price_for_stop_orders(cls, v, values):
+    @field_validator("stop_price")
+    @classmethod
+    def validate_stop_price_for_stop_orders(
+        cls, v: float | None, info: ValidationInfo
+    ) -> float | None:
         """Validate stop price is provided for STOP orders."""
         if (
-            values.get("order_type") in [OrderType.STOP_MARKET, OrderType.STOP_LIMIT]
+            info.data.get("order_type") in [OrderType.STOP_MARKET, OrderType.STOP_LIMIT]
             and v is None
         ):
             raise ValueError("Stop price is required for STOP orders")
         return v
 
-    @validator("confidence_score")
-    def validate_confidence_score(cls, v):
-        """Validate confidence score is between 0 and 1."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Confidence score must be between 0.0 and 1.0")
-        return v
-
     @property
     def is_market_order(self) -> bool:
         """Check if this is a market order."""
@@ -177,6 +183,17 @@ class TradeOrder(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert order to dictionary for API calls."""
+        order_dict = self._payload_dict()
+        order_dict["timestamp"] = self.timestamp.isoformat()
+        return order_dict
+
+    def _payload_dict(self) -> dict[str, Any]:
+        """
+        Order fields laid out as in to_dict(), but with the raw datetime timestamp.
+
+        Only for the publisher's orjson encoder, which formats datetimes
+        natively; json.dumps cannot serialize the result.
+        """
         order_dict = {
             "order_id": self.order_id,
             "symbol": self.symbol,
@@ -191,7 +208,7 @@ class TradeOrder(BaseModel):
             "strategy_name": self.strategy_name,
             "signal_id": self.signal_id,
             "confidence_score": self.confidence_score,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp,
             "metadata": self.metadata,
         }
 
@@ -220,7 +237,7 @@ class OrderResponse(BaseModel):
     @property
     def is_success(self) -> bool:
         """Check if the order was successful."""
-        return self.status.lower() in ["success", "accepted", "submitted"]
+        return self.status.lower() in SUCCESS_STATUSES
 
     @property
     def is_error(self) -> bool:
@@ -354,11 +371,11 @@ class OrderMetrics(BaseModel):
         # Update total order value
         self.total_order_value += order.estimated_value
 
-        # Update success rate
+        # Update success rate from orders_by_status, so metrics built from
+        # existing data stay consistent; one lookup per success status
+        orders_by_status = self.orders_by_status
         successful_orders = sum(
-            count
-            for status, count in self.orders_by_status.items()
-            if status in ["success", "accepted", "submitted"]
+            orders_by_status.get(status, 0) for status in SUCCESS_STATUSES
         )
         self.success_rate = (successful_orders / self.total_orders_submitted) * 100
 
@@ -367,18 +384,22 @@ class OrderMetrics(BaseModel):
         if self.total_orders_submitted == 0:
             return {}
 
-        distribution = {}
-
-        # Status distribution
-        for status, count in self.orders_by_status.items():
-            distribution[f"status_{status}"] = count / self.total_orders_submitted
+        # Divide rather than multiply by a reciprocal, so shares are exact
+        # (49 * (1 / 49) is 0.9999999999999999)
+        total = self.total_orders_submitted
 
-        # Strategy distribution
-        for strategy, count in self.orders_by_strategy.items():
-            distribution[f"strategy_{strategy}"] = count / self.total_orders_submitted
-
-        # Symbol distribution
-        for symbol, count in self.orders_by_symbol.items():
-            distribution[f"symbol_{symbol}"] = count / self.total_orders_submitted
+        # Status, strategy and symbol distributions
+        distribution = {
+            f"status_{status}": count / total
+            for status, count in self.orders_by_status.items()
+        }
+        distribution.update(
+            (f"strategy_{strategy}", count / total)
+            for strategy, count in self.orders_by_strategy.items()
+        )
+        distribution.update(
+            (f"symbol_{symbol}", count / total)
+            for symbol, count in self.orders_by_symbol.items()
+        )
 
         return distribution
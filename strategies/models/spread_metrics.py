@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadMetrics:
     """
     Comprehensive spread metrics for a single orderbook snapshot.
@@ -27,6 +27,7 @@ class SpreadMetrics:
         bid_volume_top5: Total bid volume in top 5 levels
         ask_volume_top5: Total ask volume in top 5 levels
         total_depth: bid_volume + ask_volume
+        ts_ns: Snapshot time as Unix nanoseconds (used for interval math)
     """
 
     symbol: str
@@ -47,20 +48,55 @@ class SpreadMetrics:
     ask_volume_top5: float
     total_depth: float
 
+    # Integer clock for the hot path (avoids datetime/timedelta arithmetic)
+    ts_ns: int = 0
+
+    @classmethod
+    def from_book(
+        cls,
+        symbol: str,
+        timestamp: datetime,
+        best_bid: float,
+        best_ask: float,
+        bid_volume_top5: float,
+        ask_volume_top5: float,
+        ts_ns: int = 0,
+    ) -> "SpreadMetrics":
+        """Build metrics from top-of-book prices and depth, deriving the rest."""
+        mid_price = (best_bid + best_ask) / 2
+        spread_abs = best_ask - best_bid
+        spread_ratio = spread_abs / mid_price
+        return cls(
+            symbol=symbol,
+            timestamp=timestamp,
+            best_bid=best_bid,
+            best_ask=best_ask,
+            mid_price=mid_price,
+            spread_abs=spread_abs,
+            spread_bps=spread_ratio * 10000,
+            spread_pct=spread_ratio * 100,
+            bid_volume_top5=bid_volume_top5,
+            ask_volume_top5=ask_volume_top5,
+            total_depth=bid_volume_top5 + ask_volume_top5,
+            ts_ns=ts_ns,
+        )
+
     def __post_init__(self):
         """Validate metrics."""
-        if self.best_bid <= 0 or self.best_ask <= 0:
-            raise ValueError(
-                f"Invalid bid/ask prices: bid={self.best_bid}, ask={self.best_ask}"
-            )
-
-        if self.best_ask <= self.best_bid:
+        # Single chained comparison on the happy path; the specific error is
+        # only worked out once it fails. Written as "not > 0" so NaN prices are
+        # reported as invalid rather than as a crossed book
+        if not 0 < self.best_bid < self.best_ask:
+            if not (self.best_bid > 0 and self.best_ask > 0):
+                raise ValueError(
+                    f"Invalid bid/ask prices: bid={self.best_bid}, ask={self.best_ask}"
+                )
             raise ValueError(
                 f"Ask must be greater than bid: bid={self.best_bid}, ask={self.best_ask}"
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadSnapshot:
     """
     Historical snapshot with comparative metrics.
@@ -85,7 +121,7 @@ class SpreadSnapshot:
     depth_reduction_pct: float | None = None  # % reduction vs avg depth
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadEvent:
     """
     Detected spread event (widening or narrowing).
@@ -5,7 +5,7 @@ Strategy configuration models for runtime parameter management.
 from datetime import datetime
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class StrategyConfig(BaseModel):
@@ -36,8 +36,8 @@ class StrategyConfig(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439011",
                 "strategy_id": "btc_dominance",
@@ -54,6 +54,7 @@ class StrategyConfig(BaseModel):
                 "metadata": {},
             }
         }
+    )
 
 
 class StrategyConfigAudit(BaseModel):
@@ -82,8 +83,8 @@ class StrategyConfigAudit(BaseModel):
     )
     reason: str | None = Field(None, description="Reason for the change")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "507f1f77bcf86cd799439012",
                 "config_id": "507f1f77bcf86cd799439011",
@@ -97,6 +98,7 @@ class StrategyConfigAudit(BaseModel):
                 "reason": "Lower threshold for earlier signals",
             }
         }
+    )
 
 
 class ParameterSchema(BaseModel):
@@ -117,8 +119,9 @@ class ParameterSchema(BaseModel):
     )
     example: Any = Field(..., description="Example valid value")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "name": "high_threshold",
                 "type": "float",
@@ -128,7 +131,8 @@ class ParameterSchema(BaseModel):
                 "max": 90.0,
                 "example": 70.0,
             }
-        }
+        },
+    )
 
 
 class StrategyInfo(BaseModel):
@@ -145,8 +149,8 @@ class StrategyInfo(BaseModel):
     )
     parameter_count: int = Field(0, description="Number of parameters")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "strategy_id": "btc_dominance",
                 "name": "Bitcoin Dominance",
@@ -156,6 +160,7 @@ class StrategyInfo(BaseModel):
                 "parameter_count": 5,
             }
         }
+    )
 
 
 class ConfigSource(BaseModel):
@@ -173,3 +178,22 @@ class ConfigSource(BaseModel):
     )
     cache_hit: bool = Field(False, description="Whether this was served from cache")
     load_time_ms: float | None = Field(None, description="Time taken to load config")
+
+    model_config = ConfigDict(frozen=True)
+
+
+# Validator for audit record batches, built once per process
+_AUDIT_LIST_ADAPTER = TypeAdapter(list[StrategyConfigAudit])
+
+
+def parse_audits(rows: list[dict[str, Any]]) -> list[StrategyConfigAudit]:
+    """
+    Validate a batch of audit record dicts in a single call.
+
+    Args:
+        rows: Audit records keyed by StrategyConfigAudit field names
+
+    Returns:
+        List of StrategyConfigAudit models, in input order
+    """
+    return _AUDIT_LIST_ADAPTER.validate_python(rows)
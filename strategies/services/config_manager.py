@@ -13,7 +13,10 @@ Manages runtime configuration for trading strategies with:
 import asyncio
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import constants
@@ -24,11 +27,58 @@ from strategies.market_logic.defaults import (
     list_all_strategies,
     validate_parameters,
 )
-from strategies.models.strategy_config import StrategyConfig, StrategyConfigAudit
+from strategies.models.strategy_config import (
+    StrategyConfig,
+    StrategyConfigAudit,
+    parse_audits,
+)
 from strategies.utils.metrics import initialize_metrics
 
 logger = logging.getLogger(__name__)
 
+# Environment-backed parameters per strategy as (parameter, constants attribute)
+# pairs; values are read from constants on each lookup
+_ENV_PARAMETERS: dict[str, tuple[tuple[str, str], ...]] = {
+    "orderbook_skew": (
+        ("top_levels", "ORDERBOOK_SKEW_TOP_LEVELS"),
+        ("buy_threshold", "ORDERBOOK_SKEW_BUY_THRESHOLD"),
+        ("sell_threshold", "ORDERBOOK_SKEW_SELL_THRESHOLD"),
+        ("min_spread_percent", "ORDERBOOK_SKEW_MIN_SPREAD_PERCENT"),
+    ),
+    "trade_momentum": (
+        ("price_weight", "TRADE_MOMENTUM_PRICE_WEIGHT"),
+        ("quantity_weight", "TRADE_MOMENTUM_QUANTITY_WEIGHT"),
+        ("maker_weight", "TRADE_MOMENTUM_MAKER_WEIGHT"),
+        ("buy_threshold", "TRADE_MOMENTUM_BUY_THRESHOLD"),
+        ("sell_threshold", "TRADE_MOMENTUM_SELL_THRESHOLD"),
+        ("min_quantity", "TRADE_MOMENTUM_MIN_QUANTITY"),
+    ),
+    "ticker_velocity": (
+        ("time_window", "TICKER_VELOCITY_TIME_WINDOW"),
+        ("buy_threshold", "TICKER_VELOCITY_BUY_THRESHOLD"),
+        ("sell_threshold", "TICKER_VELOCITY_SELL_THRESHOLD"),
+        ("min_price_change", "TICKER_VELOCITY_MIN_PRICE_CHANGE"),
+    ),
+    "btc_dominance": (
+        ("high_threshold", "BTC_DOMINANCE_HIGH_THRESHOLD"),
+        ("low_threshold", "BTC_DOMINANCE_LOW_THRESHOLD"),
+        ("change_threshold", "BTC_DOMINANCE_CHANGE_THRESHOLD"),
+        ("window_hours", "BTC_DOMINANCE_WINDOW_HOURS"),
+        ("min_signal_interval", "BTC_DOMINANCE_MIN_SIGNAL_INTERVAL"),
+    ),
+    "cross_exchange_spread": (
+        ("spread_threshold_percent", "SPREAD_THRESHOLD_PERCENT"),
+        ("min_signal_interval", "SPREAD_MIN_SIGNAL_INTERVAL"),
+        ("max_position_size", "SPREAD_MAX_POSITION_SIZE"),
+        ("exchanges", "SPREAD_EXCHANGES"),
+    ),
+    "onchain_metrics": (
+        ("network_growth_threshold", "ONCHAIN_NETWORK_GROWTH_THRESHOLD"),
+        ("volume_threshold", "ONCHAIN_VOLUME_THRESHOLD"),
+        ("min_signal_interval", "ONCHAIN_MIN_SIGNAL_INTERVAL"),
+    ),
+}
+
 
 class StrategyConfigManager:
     """
@@ -57,8 +107,13 @@ class StrategyConfigManager:
         self.mongodb_client = mongodb_client
         self.cache_ttl_seconds = cache_ttl_seconds
 
-        # Cache: key = f"{strategy_id}:{symbol or 'global'}", value = (config, timestamp)
-        self._cache: dict[str, tuple[dict[str, Any], float]] = {}
+        # Cache: key = f"{strategy_id}:{symbol or 'global'}", value = (read-only
+        # config, expire_at on the monotonic clock). All entries share one TTL, so
+        # keeping the dict in set order also keeps it in expiry order
+        self._cache: OrderedDict[str, tuple[Mapping[str, Any], float]] = OrderedDict()
+
+        # Lookups in progress, keyed like the cache, shared by concurrent misses
+        self._inflight: dict[str, asyncio.Task] = {}
 
         # Background tasks
         self._cache_refresh_task: asyncio.Task | None = None
@@ -105,37 +160,75 @@ class StrategyConfigManager:
             try:
                 await asyncio.sleep(self.cache_ttl_seconds)
                 # Clear expired cache entries
-                current_time = time.time()
-                expired_keys = [
-                    key
-                    for key, (_, timestamp) in self._cache.items()
-                    if current_time - timestamp > self.cache_ttl_seconds
-                ]
-                for key in expired_keys:
-                    del self._cache[key]
+                expired_count = self._expire_cache()
 
-                if expired_keys:
-                    logger.debug(f"Cleared {len(expired_keys)} expired cache entries")
+                if expired_count:
+                    logger.debug(f"Cleared {expired_count} expired cache entries")
             except Exception as e:
                 logger.error(f"Cache refresh loop error: {e}")
                 await asyncio.sleep(10)
 
+    def _expire_cache(self) -> int:
+        """
+        Drop expired cache entries.
+
+        Entries are kept in expiry order, so only the expired prefix of the
+        cache is visited.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        cache = self._cache
+        expired_count = 0
+        while cache:
+            cache_key = next(iter(cache))
+            if cache[cache_key][1] > now:
+                break
+            del cache[cache_key]
+            expired_count += 1
+        return expired_count
+
+    def _mongo_ready(self) -> bool:
+        """Check whether a connected MongoDB client is available."""
+        return self.mongodb_client is not None and self.mongodb_client.is_connected
+
     def _make_cache_key(self, strategy_id: str, symbol: str | None) -> str:
         """Generate cache key for config lookup."""
         symbol_part = symbol or "global"
         return f"{strategy_id}:{symbol_part}"
 
-    def _get_from_cache(self, cache_key: str) -> dict[str, Any | None]:
-        """Get configuration from cache if not expired."""
-        if cache_key in self._cache:
-            config, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl_seconds:
-                return config.copy()
+    def _get_from_cache(self, cache_key: str) -> Mapping[str, Any] | None:
+        """Get the read-only cached configuration if not expired."""
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
         return None
 
     def _set_cache(self, cache_key: str, config: dict[str, Any]) -> None:
-        """Store configuration in cache with current timestamp."""
-        self._cache[cache_key] = (config.copy(), time.time())
+        """
+        Store configuration in cache, expiring one TTL from now.
+
+        The config is wrapped read-only rather than copied, so callers must
+        not mutate it after caching.
+        """
+        self._cache[cache_key] = (
+            MappingProxyType(config),
+            time.monotonic() + self.cache_ttl_seconds,
+        )
+        # A re-set key now expires last
+        self._cache.move_to_end(cache_key)
+
+    def _invalidate_cache(self, cache_key: str) -> None:
+        """
+        Drop a cached configuration after a write.
+
+        Any lookup still in flight for the key may have read the old config,
+        so it is detached too: later callers start a fresh lookup instead of
+        joining it, and it does not cache its result.
+        """
+        self._cache.pop(cache_key, None)
+        self._inflight.pop(cache_key, None)
 
     async def get_config(
         self, strategy_id: str, symbol: str | None = None
@@ -166,37 +259,68 @@ class StrategyConfigManager:
         # Check cache first
         cache_key = self._make_cache_key(strategy_id, symbol)
         cached = self._get_from_cache(cache_key)
-        if cached:
-            cached["cache_hit"] = True
-            cached["load_time_ms"] = (time.time() - start_time) * 1000
-            return cached
-
-        # Try MongoDB symbol-specific
-        if symbol and self.mongodb_client and self.mongodb_client.is_connected:
-            config_doc = await self.mongodb_client.get_symbol_config(
-                strategy_id, symbol
+        if cached is not None:
+            # Fresh result dict over the shared cached entry
+            return {
+                **cached,
+                "cache_hit": True,
+                "load_time_ms": (time.time() - start_time) * 1000,
+            }
+
+        # Coalesce concurrent misses for the same key onto a single lookup task.
+        # Every caller awaits it through a shield, so a cancelled caller (e.g. a
+        # disconnected HTTP client) does not abort the lookup for the others
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_config(cache_key, strategy_id, symbol)
             )
-            if config_doc:
-                result = self._doc_to_config_result(config_doc, "mongodb", True)
+            self._inflight[cache_key] = task
+        result = await asyncio.shield(task)
+
+        return {
+            **result,
+            "cache_hit": False,
+            "load_time_ms": (time.time() - start_time) * 1000,
+        }
+
+    async def _load_config(
+        self, cache_key: str, strategy_id: str, symbol: str | None
+    ) -> dict[str, Any]:
+        """Resolve and cache a config miss; runs as the shared in-flight task."""
+        task = asyncio.current_task()
+        try:
+            result = await self._resolve_config(strategy_id, symbol)
+            # Only cache if no write invalidated this lookup while it ran
+            if self._inflight.get(cache_key) is task:
                 self._set_cache(cache_key, result)
-                result["cache_hit"] = False
-                result["load_time_ms"] = (time.time() - start_time) * 1000
-                return result
+            return result
+        finally:
+            if self._inflight.get(cache_key) is task:
+                del self._inflight[cache_key]
+
+    async def _resolve_config(
+        self, strategy_id: str, symbol: str | None
+    ) -> dict[str, Any]:
+        """Resolve configuration past the cache (MongoDB, environment, defaults)."""
+        if self._mongo_ready():
+            # Try MongoDB symbol-specific
+            if symbol:
+                config_doc = await self.mongodb_client.get_symbol_config(
+                    strategy_id, symbol
+                )
+                if config_doc:
+                    return self._doc_to_config_result(config_doc, "mongodb", True)
 
-        # Try MongoDB global
-        if self.mongodb_client and self.mongodb_client.is_connected:
+            # Try MongoDB global
             config_doc = await self.mongodb_client.get_global_config(strategy_id)
             if config_doc:
-                result = self._doc_to_config_result(config_doc, "mongodb", False)
-                self._set_cache(cache_key, result)
-                result["cache_hit"] = False
-                result["load_time_ms"] = (time.time() - start_time) * 1000
-                return result
+                return self._doc_to_config_result(config_doc, "mongodb", False)
 
         # Try environment variables (backward compatibility)
         env_params = self._get_from_environment(strategy_id)
         if env_params:
-            result = {
+            return {
                 "parameters": env_params,
                 "version": 0,
                 "source": "environment",
@@ -204,25 +328,16 @@ class StrategyConfigManager:
                 "created_at": None,
                 "updated_at": None,
             }
-            self._set_cache(cache_key, result)
-            result["cache_hit"] = False
-            result["load_time_ms"] = (time.time() - start_time) * 1000
-            return result
 
         # Use hardcoded defaults
-        defaults = get_strategy_defaults(strategy_id)
-        result = {
-            "parameters": defaults,
+        return {
+            "parameters": get_strategy_defaults(strategy_id),
             "version": 0,
             "source": "default",
             "is_override": False,
             "created_at": None,
             "updated_at": None,
         }
-        self._set_cache(cache_key, result)
-        result["cache_hit"] = False
-        result["load_time_ms"] = (time.time() - start_time) * 1000
-        return result
 
     def _doc_to_config_result(
         self, doc: dict[str, Any], source: str, is_override: bool
@@ -247,55 +362,10 @@ class StrategyConfigManager:
 
         Reads from constants.py which loads from environment.
         """
-        env_params = {}
-
-        if strategy_id == "orderbook_skew":
-            env_params = {
-                "top_levels": constants.ORDERBOOK_SKEW_TOP_LEVELS,
-                "buy_threshold": constants.ORDERBOOK_SKEW_BUY_THRESHOLD,
-                "sell_threshold": constants.ORDERBOOK_SKEW_SELL_THRESHOLD,
-                "min_spread_percent": constants.ORDERBOOK_SKEW_MIN_SPREAD_PERCENT,
-            }
-        elif strategy_id == "trade_momentum":
-            env_params = {
-                "price_weight": constants.TRADE_MOMENTUM_PRICE_WEIGHT,
-                "quantity_weight": constants.TRADE_MOMENTUM_QUANTITY_WEIGHT,
-                "maker_weight": constants.TRADE_MOMENTUM_MAKER_WEIGHT,
-                "buy_threshold": constants.TRADE_MOMENTUM_BUY_THRESHOLD,
-                "sell_threshold": constants.TRADE_MOMENTUM_SELL_THRESHOLD,
-                "min_quantity": constants.TRADE_MOMENTUM_MIN_QUANTITY,
-            }
-        elif strategy_id == "ticker_velocity":
-            env_params = {
-                "time_window": constants.TICKER_VELOCITY_TIME_WINDOW,
-                "buy_threshold": constants.TICKER_VELOCITY_BUY_THRESHOLD,
-                "sell_threshold": constants.TICKER_VELOCITY_SELL_THRESHOLD,
-                "min_price_change": constants.TICKER_VELOCITY_MIN_PRICE_CHANGE,
-            }
-        elif strategy_id == "btc_dominance":
-            env_params = {
-                "high_threshold": constants.BTC_DOMINANCE_HIGH_THRESHOLD,
-                "low_threshold": constants.BTC_DOMINANCE_LOW_THRESHOLD,
-                "change_threshold": constants.BTC_DOMINANCE_CHANGE_THRESHOLD,
-                "window_hours": constants.BTC_DOMINANCE_WINDOW_HOURS,
-                "min_signal_interval": constants.BTC_DOMINANCE_MIN_SIGNAL_INTERVAL,
-            }
-        elif strategy_id == "cross_exchange_spread":
-            env_params = {
-                "spread_threshold_percent": constants.SPREAD_THRESHOLD_PERCENT,
-                "min_signal_interval": constants.SPREAD_MIN_SIGNAL_INTERVAL,
-                "max_position_size": constants.SPREAD_MAX_POSITION_SIZE,
-                "exchanges": constants.SPREAD_EXCHANGES,
-            }
-        elif strategy_id == "onchain_metrics":
-            env_params = {
-                "network_growth_threshold": constants.ONCHAIN_NETWORK_GROWTH_THRESHOLD,
-                "volume_threshold": constants.ONCHAIN_VOLUME_THRESHOLD,
-                "min_signal_interval": constants.ONCHAIN_MIN_SIGNAL_INTERVAL,
-            }
-
-        # Only return if we found env vars (not empty dict)
-        return env_params if env_params else {}
+        spec = _ENV_PARAMETERS.get(strategy_id)
+        if spec is None:
+            return {}
+        return {param: getattr(constants, attr) for param, attr in spec}
 
     async def set_config(
         self,
@@ -328,7 +398,7 @@ class StrategyConfigManager:
         if validate_only:
             return True, None, []
 
-        if not self.mongodb_client or not self.mongodb_client.is_connected:
+        if not self._mongo_ready():
             return False, None, ["MongoDB not available - cannot save configuration"]
 
         try:
@@ -410,9 +480,7 @@ class StrategyConfigManager:
             await self.mongodb_client.create_audit_record(audit_data)
 
             # Invalidate cache
-            cache_key = self._make_cache_key(strategy_id, symbol)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
+            self._invalidate_cache(self._make_cache_key(strategy_id, symbol))
 
             # Record configuration change metric
             metrics = initialize_metrics()
@@ -516,9 +584,7 @@ class StrategyConfigManager:
 
         # Explicit cache invalidation on success
         if success:
-            cache_key = self._make_cache_key(strategy_id, symbol)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
+            self._invalidate_cache(self._make_cache_key(strategy_id, symbol))
 
             # Record configuration change metric
             metrics = initialize_metrics()
@@ -546,7 +612,7 @@ class StrategyConfigManager:
         Returns:
             Tuple of (success, errors)
         """
-        if not self.mongodb_client or not self.mongodb_client.is_connected:
+        if not self._mongo_ready():
             return False, ["MongoDB not available - cannot delete configuration"]
 
         try:
@@ -590,9 +656,7 @@ class StrategyConfigManager:
                 await self.mongodb_client.create_audit_record(audit_data)
 
             # Invalidate cache
-            cache_key = self._make_cache_key(strategy_id, symbol)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
+            self._invalidate_cache(self._make_cache_key(strategy_id, symbol))
 
             # Record configuration change metric
             metrics = initialize_metrics()
@@ -620,30 +684,45 @@ class StrategyConfigManager:
         all_strategy_ids = list_all_strategies()
         result = []
 
+        # Fetch config status for all strategies up front (one query each for
+        # global configs and symbol overrides, instead of two per strategy)
+        global_ids: set[str] = set()
+        overrides: dict[str, list[str]] = {}
+        if self._mongo_ready():
+            global_ids = await self.mongodb_client.list_global_config_ids(
+                all_strategy_ids
+            )
+            if global_ids is None:
+                # Data Manager mode has no bulk lookup; check each strategy,
+                # overlapping the requests rather than awaiting them in turn
+                configs = await asyncio.gather(
+                    *(
+                        self.mongodb_client.get_global_config(strategy_id)
+                        for strategy_id in all_strategy_ids
+                    )
+                )
+                global_ids = {
+                    strategy_id
+                    for strategy_id, config in zip(
+                        all_strategy_ids, configs, strict=True
+                    )
+                    if config is not None
+                }
+            overrides = await self.mongodb_client.list_symbol_overrides_bulk(
+                all_strategy_ids
+            )
+
         for strategy_id in all_strategy_ids:
             metadata = get_strategy_metadata(strategy_id)
             defaults = get_strategy_defaults(strategy_id)
 
-            # Check if has global config
-            has_global = False
-            if self.mongodb_client and self.mongodb_client.is_connected:
-                global_config = await self.mongodb_client.get_global_config(strategy_id)
-                has_global = global_config is not None
-
-            # Get symbol overrides
-            symbol_overrides = []
-            if self.mongodb_client and self.mongodb_client.is_connected:
-                symbol_overrides = await self.mongodb_client.list_symbol_overrides(
-                    strategy_id
-                )
-
             result.append(
                 {
                     "strategy_id": strategy_id,
                     "name": metadata.get("name", strategy_id),
                     "description": metadata.get("description", ""),
-                    "has_global_config": has_global,
-                    "symbol_overrides": symbol_overrides,
+                    "has_global_config": strategy_id in global_ids,
+                    "symbol_overrides": overrides.get(strategy_id, []),
                     "parameter_count": len(defaults),
                 }
             )
@@ -667,7 +746,7 @@ class StrategyConfigManager:
         Returns:
             List of audit records (most recent first)
         """
-        if not self.mongodb_client or not self.mongodb_client.is_connected:
+        if not self._mongo_ready():
             return []
 
         try:
@@ -675,23 +754,23 @@ class StrategyConfigManager:
                 strategy_id, symbol, limit
             )
 
-            # Convert to StrategyConfigAudit objects
-            audit_list = []
-            for record in records:
-                audit = StrategyConfigAudit(
-                    id=str(record.get("_id", "")),
-                    strategy_id=record["strategy_id"],
-                    symbol=record.get("symbol"),
-                    action=record["action"],
-                    old_parameters=record.get("old_parameters"),
-                    new_parameters=record.get("new_parameters"),
-                    changed_by=record["changed_by"],
-                    changed_at=record["changed_at"],
-                    reason=record.get("reason"),
-                )
-                audit_list.append(audit)
-
-            return audit_list
+            # Convert to StrategyConfigAudit objects in one validation pass
+            return parse_audits(
+                [
+                    {
+                        "id": str(record.get("_id", "")),
+                        "strategy_id": record["strategy_id"],
+                        "symbol": record.get("symbol"),
+                        "action": record["action"],
+                        "old_parameters": record.get("old_parameters"),
+                        "new_parameters": record.get("new_parameters"),
+                        "changed_by": record["changed_by"],
+                        "changed_at": record["changed_at"],
+                        "reason": record.get("reason"),
+                    }
+                    for record in records
+                ]
+            )
 
         except Exception as e:
             logger.error(f"Error getting audit trail: {e}")
@@ -700,6 +779,8 @@ class StrategyConfigManager:
     async def refresh_cache(self) -> None:
         """Force immediate cache invalidation."""
         self._cache.clear()
+        # Lookups already in flight may have read pre-invalidation data
+        self._inflight.clear()
         logger.info("Configuration cache cleared")
 
     async def get_previous_config(
@@ -773,7 +854,7 @@ class StrategyConfigManager:
         if version < 1:
             return None
 
-        if not self.mongodb_client or not self.mongodb_client.is_connected:
+        if not self._mongo_ready():
             return None
 
         # Direct database lookup by version
@@ -785,18 +866,6 @@ class StrategyConfigManager:
             if params:
                 return {k: v for k, v in params.items() if k != "version"}
 
-        # Fallback to searching history (only if not using Data Manager)
-        if not self.mongodb_client.use_data_manager:
-            history = await self.get_audit_trail(strategy_id, symbol, limit=1000)
-            for record in history:
-                if (
-                    record.new_parameters
-                    and record.new_parameters.get("version") == version
-                ):
-                    return {
-                        k: v for k, v in record.new_parameters.items() if k != "version"
-                    }
-
         return None
 
     async def get_config_by_id(
@@ -812,7 +881,7 @@ class StrategyConfigManager:
         Returns:
             Dictionary of configuration values or None if not found
         """
-        if not self.mongodb_client or not self.mongodb_client.is_connected:
+        if not self._mongo_ready():
             return None
 
         # Direct database lookup by ID
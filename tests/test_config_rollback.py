@@ -240,8 +240,13 @@ class TestStrategyConfigRollback:
 
     async def test_list_strategies(self, config_manager, mock_mongodb_client):
         """Test listing strategies with their config status."""
-        mock_mongodb_client.get_global_config = AsyncMock(return_value={"version": 1})
-        mock_mongodb_client.list_symbol_overrides = AsyncMock(return_value=["BTCUSDT"])
+        mock_mongodb_client.list_global_config_ids = AsyncMock(
+            return_value={"orderbook_skew"}
+        )
+        mock_mongodb_client.list_symbol_overrides_bulk = AsyncMock(
+            return_value={"orderbook_skew": ["BTCUSDT"]}
+        )
+        mock_mongodb_client.get_global_config = AsyncMock()
 
         strategies = await config_manager.list_strategies()
         assert len(strategies) > 0
@@ -249,6 +254,27 @@ class TestStrategyConfigRollback:
         s = next(st for st in strategies if st["strategy_id"] == "orderbook_skew")
         assert s["has_global_config"] is True
         assert "BTCUSDT" in s["symbol_overrides"]
+        other = next(st for st in strategies if st["strategy_id"] != "orderbook_skew")
+        assert other["has_global_config"] is False
+        assert other["symbol_overrides"] == []
+
+        # Status comes from the bulk lookups, not per-strategy queries
+        mock_mongodb_client.list_global_config_ids.assert_awaited_once()
+        mock_mongodb_client.get_global_config.assert_not_called()
+
+    async def test_list_strategies_data_manager_fallback(
+        self, config_manager, mock_mongodb_client
+    ):
+        """Test global config status falls back to per-strategy lookups."""
+        mock_mongodb_client.list_global_config_ids = AsyncMock(return_value=None)
+        mock_mongodb_client.list_symbol_overrides_bulk = AsyncMock(return_value={})
+        mock_mongodb_client.get_global_config = AsyncMock(
+            side_effect=lambda sid: {"version": 1} if sid == "btc_dominance" else None
+        )
+
+        strategies = await config_manager.list_strategies()
+        has_global = {st["strategy_id"] for st in strategies if st["has_global_config"]}
+        assert has_global == {"btc_dominance"}
 
     async def test_set_config_success(self, config_manager, mock_mongodb_client):
         """Test successful set_config with audit record."""
@@ -401,19 +427,16 @@ class TestStrategyConfigRollback:
         manager = StrategyConfigManager(
             mongodb_client=mock_mongodb_client, cache_ttl_seconds=0.01
         )
-        manager._cache["s1:global"] = ({"p": 1}, time.time() - 100)
+        manager._cache["s1:global"] = ({"p": 1}, time.monotonic() - 100)
+        manager._set_cache("s2:global", {"p": 2})
+        manager.cache_ttl_seconds = 60
+        manager._set_cache("s3:global", {"p": 3})
 
         # Manually run the cleanup logic
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, (_, timestamp) in manager._cache.items()
-            if current_time - timestamp > manager.cache_ttl_seconds
-        ]
-        for key in expired_keys:
-            del manager._cache[key]
+        time.sleep(0.02)
+        assert manager._expire_cache() == 2
 
-        assert "s1:global" not in manager._cache
+        assert list(manager._cache) == ["s3:global"]
 
     async def test_get_config_cache_hit(self, config_manager, mock_mongodb_client):
         """Test that cache hit returns correctly and skips DB."""
@@ -429,6 +452,111 @@ class TestStrategyConfigRollback:
         assert config["cache_hit"] is True
         mock_mongodb_client.get_global_config.assert_not_called()
 
+    async def test_concurrent_misses_share_one_lookup(
+        self, config_manager, mock_mongodb_client
+    ):
+        """Test concurrent get_config misses for one key issue a single query."""
+
+        async def slow_global_config(strategy_id):
+            await asyncio.sleep(0.01)
+            return {"parameters": {"p": 1}, "version": 1}
+
+        mock_mongodb_client.get_global_config = AsyncMock(
+            side_effect=slow_global_config
+        )
+
+        results = await asyncio.gather(
+            *(config_manager.get_config("s1") for _ in range(5))
+        )
+
+        assert [r["parameters"] for r in results] == [{"p": 1}] * 5
+        mock_mongodb_client.get_global_config.assert_awaited_once_with("s1")
+        assert config_manager._inflight == {}
+
+    async def test_cancelled_leader_does_not_abort_waiters(
+        self, config_manager, mock_mongodb_client
+    ):
+        """Test cancelling the first caller still delivers the config to others."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_global_config(strategy_id):
+            started.set()
+            await release.wait()
+            return {"parameters": {"p": 1}, "version": 1}
+
+        mock_mongodb_client.get_global_config = AsyncMock(
+            side_effect=slow_global_config
+        )
+
+        leader = asyncio.create_task(config_manager.get_config("s1"))
+        await started.wait()
+        waiter = asyncio.create_task(config_manager.get_config("s1"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+
+        result = await waiter
+        assert result["parameters"] == {"p": 1}
+        mock_mongodb_client.get_global_config.assert_awaited_once_with("s1")
+        assert config_manager._inflight == {}
+
+    async def test_read_after_write_skips_inflight_lookup(
+        self, config_manager, mock_mongodb_client
+    ):
+        """Test a lookup started before a write neither serves nor caches it."""
+        stored = {"parameters": {"p": 1}, "version": 1}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def gated_global_config(strategy_id):
+            snapshot = dict(stored)
+            started.set()
+            await release.wait()
+            return snapshot
+
+        mock_mongodb_client.get_global_config = AsyncMock(
+            side_effect=gated_global_config
+        )
+
+        early = asyncio.create_task(config_manager.get_config("s1"))
+        await started.wait()
+
+        # Write lands while the first lookup is still in flight
+        stored = {"parameters": {"p": 2}, "version": 2}
+        config_manager._invalidate_cache("s1:global")
+        late = asyncio.create_task(config_manager.get_config("s1"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert (await early)["version"] == 1
+        assert (await late)["version"] == 2
+        assert mock_mongodb_client.get_global_config.await_count == 2
+        assert config_manager._get_from_cache("s1:global")["version"] == 2
+        assert config_manager._inflight == {}
+
+    async def test_cached_entry_unaffected_by_result_mutation(
+        self, config_manager, mock_mongodb_client
+    ):
+        """Test results are fresh dicts layered over a read-only cache entry."""
+        mock_mongodb_client.get_global_config = AsyncMock(
+            return_value={"parameters": {"p": 1}, "version": 1}
+        )
+        first = await config_manager.get_config("s1")
+        first["version"] = 99
+
+        second = await config_manager.get_config("s1")
+        assert second["version"] == 1
+        assert second is not first
+
+        cached = config_manager._get_from_cache("s1:global")
+        assert "cache_hit" not in cached
+        with pytest.raises(TypeError):
+            cached["version"] = 2
+
     async def test_set_config_upsert_failure(self, config_manager, mock_mongodb_client):
         """Test failure when database upsert fails."""
         mock_mongodb_client.get_global_config = AsyncMock(return_value=None)
@@ -451,30 +579,21 @@ class TestStrategyConfigRollback:
             assert success is False
             assert "No previous configuration found" in errors[0]
 
-    async def test_get_config_by_version_fallback(
+    async def test_get_config_by_version_miss(
         self, config_manager, mock_mongodb_client
     ):
-        """Test fallback when direct MongoDB query fails or is not used."""
-        mock_mongodb_client.use_data_manager = False  # Allow fallback search
-        # Ensure direct lookup returns None so it falls through to get_audit_trail
+        """Test a version miss returns None after the single direct lookup."""
+        mock_mongodb_client.use_data_manager = False
         mock_mongodb_client.get_audit_record_by_version = AsyncMock(return_value=None)
+        mock_mongodb_client.get_audit_trail = AsyncMock()
 
-        with patch.object(
-            config_manager,
-            "get_audit_trail",
-            return_value=[
-                StrategyConfigAudit(
-                    id="1",
-                    strategy_id="s1",
-                    action="CREATE",
-                    new_parameters={"p": 1, "version": 5},
-                    changed_by="u1",
-                    changed_at=datetime.utcnow(),
-                )
-            ],
-        ):
-            config = await config_manager.get_config_by_version("s1", 5)
-            assert config["p"] == 1
+        config = await config_manager.get_config_by_version("s1", 5)
+
+        assert config is None
+        mock_mongodb_client.get_audit_record_by_version.assert_awaited_once_with(
+            "s1", 5, None
+        )
+        mock_mongodb_client.get_audit_trail.assert_not_awaited()
 
 
 def test_rollback_api_integration(client, config_manager):
@@ -51,3 +51,29 @@ class TestParameterValidation:
 
         # Should return None or empty dict
         assert schema is None or schema == {}
+
+    def test_validate_parameters_type_and_range_errors(self):
+        """Test compiled rules report type, range and unknown-parameter errors."""
+        is_valid, errors = validate_parameters(
+            "iceberg_detector",
+            {
+                "min_refill_count": 1.5,
+                "level_proximity_pct": 10,
+                "max_symbols": 5,
+                "bogus": 1,
+            },
+        )
+
+        assert is_valid is False
+        assert errors == [
+            "min_refill_count must be an integer",
+            "level_proximity_pct must be <= 5.0, got 10",
+            "max_symbols must be >= 10, got 5",
+            "Unknown parameter: bogus",
+        ]
+
+    def test_validate_parameters_valid(self):
+        """Test in-range parameters pass validation."""
+        assert validate_parameters(
+            "iceberg_detector", {"min_refill_count": 3, "base_confidence": 0.7}
+        ) == (True, [])
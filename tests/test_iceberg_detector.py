@@ -8,7 +8,10 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from strategies.market_logic.iceberg_detector import IcebergDetectorStrategy
+from strategies.market_logic.iceberg_detector import (
+    IcebergDetectorStrategy,
+    OrderBookSnapshot,
+)
 from strategies.models.signals import SignalAction, SignalConfidence, SignalType
 
 
@@ -304,7 +307,6 @@ class TestIcebergDetectorStrategy:
 
     def test_iceberg_invalid_side_returns_none(self, strategy):
         """Test that invalid iceberg side returns None - covers line 204."""
-        from collections import deque
         from datetime import datetime
 
         from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
@@ -313,7 +315,6 @@ class TestIcebergDetectorStrategy:
         level_history = LevelHistory(
             price=50000.0,
             side="bid",
-            snapshots=deque(),
         )
 
         # Create iceberg with invalid side (not "bid" or "ask")
@@ -337,7 +338,6 @@ class TestIcebergDetectorStrategy:
 
     def test_iceberg_low_confidence_path(self, strategy):
         """Test LOW confidence path - covers lines 210-213."""
-        from collections import deque
         from datetime import datetime
 
         from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
@@ -346,7 +346,6 @@ class TestIcebergDetectorStrategy:
         level_history = LevelHistory(
             price=50000.0,
             side="bid",
-            snapshots=deque(),
         )
 
         # Create iceberg with confidence < 0.6 (LOW)
@@ -611,3 +610,239 @@ class TestIcebergDetectorStrategy:
 
                     assert signal.metadata["strategy_id"] == "iceberg_detector"
                     return
+
+    def test_signal_key_packing(self, strategy):
+        """Test rate-limit keys are unique per symbol, price and side."""
+        from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
+
+        def make_iceberg(symbol, price, side):
+            return IcebergPattern(
+                symbol=symbol,
+                price=price,
+                side=side,
+                refill_count=3,
+                avg_refill_speed_seconds=2.0,
+                volume_consistency_score=0.9,
+                persistence_seconds=150.0,
+                confidence=0.85,
+                pattern_type="refill",
+                detected_at=datetime.utcnow(),
+                level_history=LevelHistory(price=price, side=side),
+            )
+
+        key = strategy._signal_key(make_iceberg("BTCUSDT", 50000.0, "bid"))
+
+        assert key == strategy._signal_key(make_iceberg("BTCUSDT", 50000.001, "bid"))
+        assert key != strategy._signal_key(make_iceberg("BTCUSDT", 50000.0, "ask"))
+        assert key != strategy._signal_key(make_iceberg("BTCUSDT", 50000.01, "bid"))
+        assert key != strategy._signal_key(make_iceberg("ETHUSDT", 50000.0, "bid"))
+        assert key == ("BTCUSDT", 5_000_000 << 1)
+
+    def test_last_signal_time_is_bounded(self):
+        """Test rate-limit entries are evicted instead of growing forever."""
+        strategy = IcebergDetectorStrategy(
+            max_symbols=1, min_signal_interval_seconds=60
+        )
+
+        for i in range(100):
+            strategy._record_signal_time(("BTCUSDT", i), 1000.0)
+        assert len(strategy.last_signal_time) == strategy.max_signal_keys == 64
+        assert next(iter(strategy.last_signal_time)) == ("BTCUSDT", 36)
+
+        # Expired entries are pruned on the next insert
+        strategy._record_signal_time(("BTCUSDT", 1000), 1100.0)
+        assert list(strategy.last_signal_time) == [("BTCUSDT", 1000)]
+
+    def test_analyze_skips_tracer_when_tracing_disabled(
+        self, strategy, normal_orderbook
+    ):
+        """Test no spans are started when tracing is disabled."""
+        from unittest.mock import patch
+
+        with (
+            patch("strategies.market_logic.iceberg_detector._TRACING_ENABLED", False),
+            patch(
+                "strategies.market_logic.iceberg_detector.get_tracer"
+            ) as mock_get_tracer,
+        ):
+            signal = strategy.analyze(
+                symbol="BTCUSDT",
+                bids=normal_orderbook["bids"],
+                asks=normal_orderbook["asks"],
+            )
+
+        assert signal is None
+        mock_get_tracer.assert_not_called()
+
+    def test_unchanged_orderbook_still_detected(self, strategy, normal_orderbook):
+        """Test every snapshot is tracked and detected, even if unchanged."""
+        from unittest.mock import patch
+
+        base_time = datetime.utcnow()
+
+        with patch.object(
+            strategy.tracker, "detect_icebergs", return_value=[]
+        ) as mock_detect:
+            for offset in (0.0, 0.5, 1.5, 1.6):
+                strategy.analyze(
+                    symbol="BTCUSDT",
+                    bids=normal_orderbook["bids"],
+                    asks=normal_orderbook["asks"],
+                    timestamp=base_time + timedelta(seconds=offset),
+                )
+            assert mock_detect.call_count == 4
+
+        levels = strategy.tracker.bid_levels["BTCUSDT"]
+        assert levels[50000.00].total_appearances == 4
+
+    def test_strongest_iceberg_selected(self, strategy, normal_orderbook):
+        """Test the highest-confidence iceberg is used for signal generation."""
+        from unittest.mock import MagicMock, patch
+
+        icebergs = [MagicMock(confidence=c, side="bid") for c in (0.7, 0.85, 0.85)]
+
+        with (
+            patch.object(strategy.tracker, "detect_icebergs", return_value=icebergs),
+            patch.object(strategy, "_generate_signal", return_value=None) as mock_gen,
+        ):
+            strategy.analyze(
+                symbol="BTCUSDT",
+                bids=normal_orderbook["bids"],
+                asks=normal_orderbook["asks"],
+            )
+
+        assert mock_gen.call_args.args[0] is icebergs[1]
+        assert strategy.icebergs_detected == 3
+
+    def test_generated_signal_metadata(self, strategy):
+        """Test signal metadata combines static and per-iceberg fields."""
+        from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
+
+        iceberg = IcebergPattern(
+            symbol="BTCUSDT",
+            price=50000.0,
+            side="bid",
+            refill_count=4,
+            avg_refill_speed_seconds=2.0,
+            volume_consistency_score=0.9,
+            persistence_seconds=150.0,
+            confidence=0.85,
+            pattern_type="refill",
+            detected_at=datetime.utcnow(),
+            level_history=LevelHistory(price=50000.0, side="bid"),
+        )
+
+        first = strategy._generate_signal(iceberg, 50100.0)
+        strategy.last_signal_time.clear()
+        second = strategy._generate_signal(iceberg, 50100.0)
+
+        assert first.metadata["strategy_id"] == "iceberg_detector"
+        assert first.metadata["quantity"] == 0.001
+        assert first.metadata["timeframe"] == "tick"
+        assert first.metadata["refill_count"] == 4
+        assert first.metadata["stop_loss"] == pytest.approx(50000.0 - 250.5)
+        assert first.metadata["take_profit"] == pytest.approx(50100.0 + 250.5 * 2.5)
+        assert first.metadata is not second.metadata
+
+    def test_ask_iceberg_generates_short_levels(self, strategy):
+        """Test ask icebergs produce SELL signals with stop above the level."""
+        from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
+
+        iceberg = IcebergPattern(
+            symbol="BTCUSDT",
+            price=50100.0,
+            side="ask",
+            refill_count=4,
+            avg_refill_speed_seconds=2.0,
+            volume_consistency_score=0.9,
+            persistence_seconds=150.0,
+            confidence=0.7,
+            pattern_type="refill",
+            detected_at=datetime.utcnow(),
+            level_history=LevelHistory(price=50100.0, side="ask"),
+        )
+
+        signal = strategy._generate_signal(iceberg, 50000.0)
+
+        assert signal.signal_type == SignalType.SELL
+        assert signal.signal_action == SignalAction.OPEN_SHORT
+        assert "hidden seller" in signal.metadata["reasoning"]
+        assert signal.metadata["stop_loss"] == pytest.approx(50100.0 + 250.0)
+        assert signal.metadata["take_profit"] == pytest.approx(50000.0 - 250.0 * 2.5)
+
+    def test_analyze_batch_matches_sequential_analyze(self, strategy):
+        """Test analyze_batch produces the same signals as per-snapshot analyze."""
+        base_time = datetime.utcnow()
+        snapshots = []
+        for cycle in range(6):
+            for phase, volume in enumerate((2.0, 0.2, 2.0)):
+                for symbol in ("BTCUSDT", "ETHUSDT"):
+                    snapshots.append(
+                        OrderBookSnapshot(
+                            symbol=symbol,
+                            bids=[(50000.00, volume), (49999.00, 1.0)],
+                            asks=[(50001.00, 1.0), (50002.00, 1.0)],
+                            timestamp=base_time + timedelta(seconds=cycle * 10 + phase),
+                        )
+                    )
+
+        sequential = IcebergDetectorStrategy()
+        expected = [
+            signal
+            for snap in snapshots
+            if (
+                signal := sequential.analyze(
+                    snap.symbol, snap.bids, snap.asks, snap.timestamp
+                )
+            )
+        ]
+
+        signals = strategy.analyze_batch(snapshots)
+
+        assert [(s.symbol, s.signal_type) for s in signals] == [
+            (s.symbol, s.signal_type) for s in expected
+        ]
+        assert (
+            strategy.get_statistics()["icebergs_detected"]
+            == (sequential.get_statistics()["icebergs_detected"])
+        )
+
+    def test_analyze_batch_empty(self, strategy):
+        """Test analyze_batch handles empty input and empty books."""
+        assert strategy.analyze_batch([]) == []
+        assert strategy.analyze_batch([OrderBookSnapshot("BTCUSDT", [], [])]) == []
+
+    def test_generate_signal_records_on_caller_span(self, strategy):
+        """Test _generate_signal annotates the analyze span instead of its own."""
+        from unittest.mock import MagicMock, patch
+
+        from strategies.models.orderbook_tracker import IcebergPattern, LevelHistory
+
+        iceberg = IcebergPattern(
+            symbol="BTCUSDT",
+            price=50000.0,
+            side="bid",
+            refill_count=4,
+            avg_refill_speed_seconds=2.0,
+            volume_consistency_score=0.9,
+            persistence_seconds=150.0,
+            confidence=0.85,
+            pattern_type="refill",
+            detected_at=datetime.utcnow(),
+            level_history=LevelHistory(price=50000.0, side="bid"),
+        )
+        span = MagicMock()
+
+        with (
+            patch("strategies.market_logic.iceberg_detector._TRACING_ENABLED", True),
+            patch(
+                "strategies.market_logic.iceberg_detector.get_tracer"
+            ) as mock_get_tracer,
+        ):
+            assert strategy._generate_signal(iceberg, 50100.0, span) is not None
+            assert strategy._generate_signal(iceberg, 50100.0, span) is None
+
+        mock_get_tracer.assert_not_called()
+        span.set_attribute.assert_any_call("iceberg.side", "bid")
+        span.set_attribute.assert_any_call("order.stop_loss", 50000.0 - 250.5)
+        span.add_event.assert_called_once_with("signal_rate_limited")
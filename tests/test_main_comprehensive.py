@@ -204,18 +204,19 @@ def test_cli_run_command():
     with (
         patch("strategies.main.StrategiesService") as mock_service_class,
         patch("strategies.main.signal") as mock_signal,
-        patch("strategies.main.asyncio.run") as mock_asyncio_run,
+        patch("strategies.main.asyncio.Runner") as mock_runner_class,
     ):
         mock_service = MagicMock()
         mock_service_class.return_value = mock_service
-        mock_asyncio_run.side_effect = KeyboardInterrupt()
+        mock_run = mock_runner_class.return_value.__enter__.return_value.run
+        mock_run.side_effect = KeyboardInterrupt()
 
         result = runner.invoke(app, ["run"])
 
         assert result.exit_code == 0
         mock_service_class.assert_called_once()
         mock_signal.signal.assert_called()
-        mock_asyncio_run.assert_called_once()
+        mock_run.assert_called_once()
 
 
 def test_cli_run_command_with_options():
@@ -225,12 +226,13 @@ def test_cli_run_command_with_options():
     with (
         patch("strategies.main.StrategiesService") as mock_service_class,
         patch("strategies.main.signal") as mock_signal,
-        patch("strategies.main.asyncio.run") as mock_asyncio_run,
+        patch("strategies.main.asyncio.Runner") as mock_runner_class,
         patch("strategies.main.os.environ", {}),
     ):
         mock_service = MagicMock()
         mock_service_class.return_value = mock_service
-        mock_asyncio_run.side_effect = KeyboardInterrupt()
+        mock_run = mock_runner_class.return_value.__enter__.return_value.run
+        mock_run.side_effect = KeyboardInterrupt()
 
         result = runner.invoke(
             app,
@@ -262,11 +264,12 @@ def test_cli_run_command_service_failure():
     with (
         patch("strategies.main.StrategiesService") as mock_service_class,
         patch("strategies.main.signal") as mock_signal,
-        patch("strategies.main.asyncio.run") as mock_asyncio_run,
+        patch("strategies.main.asyncio.Runner") as mock_runner_class,
     ):
         mock_service = MagicMock()
         mock_service_class.return_value = mock_service
-        mock_asyncio_run.side_effect = Exception("Service failed")
+        mock_run = mock_runner_class.return_value.__enter__.return_value.run
+        mock_run.side_effect = Exception("Service failed")
 
         result = runner.invoke(app, ["run"])
 
@@ -274,6 +277,29 @@ def test_cli_run_command_service_failure():
         assert result.exit_code != 0 or "Service failed" in result.output
 
 
+@pytest.mark.parametrize("use_uvloop", [True, False])
+def test_run_event_loop_factory(monkeypatch, use_uvloop):
+    """Test run() uses a uvloop loop factory only when USE_UVLOOP is enabled."""
+    from strategies import main
+
+    fake_uvloop = MagicMock()
+    monkeypatch.setattr(main, "uvloop", fake_uvloop)
+    monkeypatch.setattr(main.constants, "USE_UVLOOP", use_uvloop)
+
+    with (
+        patch("strategies.main.StrategiesService"),
+        patch("strategies.main.signal"),
+        patch("strategies.main.asyncio.Runner") as mock_runner_class,
+        patch("strategies.main.asyncio.set_event_loop_policy") as mock_set_policy,
+    ):
+        main.run(nats_url=None, consumer_topic=None, publisher_topic=None, log_level="")
+
+    expected = fake_uvloop.new_event_loop if use_uvloop else None
+    mock_runner_class.assert_called_once_with(loop_factory=expected)
+    mock_runner_class.return_value.__enter__.return_value.run.assert_called_once()
+    mock_set_policy.assert_not_called()
+
+
 def test_cli_health_command_success():
     """Test CLI health command success."""
     runner = CliRunner()
@@ -165,3 +165,83 @@ def test_market_data_message_stream_validation_and_props():
     assert msg.is_depth is True
     assert msg.is_trade is False
     assert msg.is_ticker is False
+
+
+def test_market_data_message_stream_parts_cached_and_not_dumped():
+    du = DepthUpdate(
+        symbol="BTCUSDT",
+        event_time=1,
+        first_update_id=1,
+        final_update_id=2,
+        bids=[DepthLevel(price="1", quantity="1")],
+        asks=[DepthLevel(price="2", quantity="1")],
+    )
+    msg = MarketDataMessage.model_construct(stream="ethusdt@trade", data=du)
+    assert msg.symbol == "ETHUSDT"
+    assert msg.stream_type == "trade"
+    assert msg.symbol is msg.symbol
+    assert set(msg.model_dump()) == {"stream", "data", "timestamp"}
+
+
+def test_model_copy_update_rederives_cached_values():
+    du = DepthUpdate(
+        symbol="BTCUSDT",
+        event_time=1,
+        first_update_id=1,
+        final_update_id=2,
+        bids=[DepthLevel(price="1", quantity="1")],
+        asks=[DepthLevel(price="2", quantity="1")],
+    )
+    msg = MarketDataMessage(stream="btcusdt@depth", data=du)
+    assert msg.symbol == "BTCUSDT"
+    assert du.mid_price == 1.5
+
+    copied = msg.model_copy(update={"stream": "ethusdt@trade"})
+    assert copied.symbol == "ETHUSDT"
+    assert copied.stream_type == "trade"
+    assert msg.model_copy().symbol == "BTCUSDT"
+
+    du_copy = du.model_copy(update={"asks": [DepthLevel(price="3", quantity="1")]})
+    assert du_copy.mid_price == 2.0
+
+
+def test_depth_update_derived_values_cached_and_not_dumped():
+    du = DepthUpdate(
+        symbol="BTCUSDT",
+        event_time=1_700_000_000_000,
+        first_update_id=1,
+        final_update_id=2,
+        bids=[DepthLevel(price="100", quantity="1")],
+        asks=[DepthLevel(price="101", quantity="1")],
+    )
+    assert du.mid_price == 100.5
+    assert du.spread_percent == 1.0
+    assert du.timestamp is du.timestamp
+    assert set(du.model_dump()) == {
+        "symbol",
+        "event_time",
+        "first_update_id",
+        "final_update_id",
+        "bids",
+        "asks",
+    }
+
+
+def test_market_data_message_kind_tag():
+    du = DepthUpdate(
+        symbol="BTCUSDT",
+        event_time=1,
+        first_update_id=1,
+        final_update_id=2,
+        bids=[DepthLevel(price="1", quantity="1")],
+        asks=[DepthLevel(price="2", quantity="1")],
+    )
+    msg = MarketDataMessage.model_construct(stream="btcusdt@depth", data=du)
+    assert msg.kind == "depth"
+    assert msg.is_depth is True
+    assert msg.is_trade is msg.is_ticker is msg.is_mark_price is False
+    assert "kind" not in msg.model_dump()
+
+    unknown = MarketDataMessage.model_construct(stream="btcusdt@other", data={})
+    assert unknown.kind is None
+    assert unknown.is_depth is False
@@ -210,7 +210,7 @@ async def test_create_indexes_success(mock_database):
     mock_database.strategy_configs_symbol.create_index.assert_called_once_with(
         [("strategy_id", 1), ("symbol", 1)], unique=True
     )
-    assert mock_database.strategy_config_audit.create_index.call_count == 2
+    assert mock_database.strategy_config_audit.create_index.call_count == 3
 
 
 @pytest.mark.asyncio
@@ -627,6 +627,29 @@ async def test_get_audit_trail_direct_mode(mock_database):
     mock_database.strategy_config_audit.find.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_audit_record_by_version_newest_first(mock_database):
+    """Test the version lookup returns the most recent matching record."""
+    record = {"strategy_id": "test_strategy", "new_parameters": {"version": 3}}
+    mock_database.strategy_config_audit.find_one = AsyncMock(return_value=record)
+
+    client = MongoDBClient(use_data_manager=False)
+    client.database = mock_database
+    client._connected = True
+
+    result = await client.get_audit_record_by_version("test_strategy", 3, "BTCUSDT")
+
+    assert result == record
+    mock_database.strategy_config_audit.find_one.assert_awaited_once_with(
+        {
+            "strategy_id": "test_strategy",
+            "new_parameters.version": 3,
+            "symbol": "BTCUSDT",
+        },
+        sort=[("changed_at", -1)],
+    )
+
+
 @pytest.mark.asyncio
 async def test_add_audit_record_direct_mode(mock_database):
     """Test add audit record in direct mode."""
@@ -650,6 +673,43 @@ async def test_add_audit_record_direct_mode(mock_database):
     mock_database.strategy_config_audit.insert_one.assert_called_once_with(audit_data)
 
 
+@pytest.mark.asyncio
+async def test_list_global_config_ids_direct_mode(mock_database):
+    """Test bulk global config lookup uses a single distinct query."""
+    mock_database.strategy_configs_global.distinct = AsyncMock(return_value=["s1"])
+
+    client = MongoDBClient(use_data_manager=False)
+    client.database = mock_database
+    client._connected = True
+
+    result = await client.list_global_config_ids(["s1", "s2"])
+
+    assert result == {"s1"}
+    mock_database.strategy_configs_global.distinct.assert_awaited_once_with(
+        "strategy_id", {"strategy_id": {"$in": ["s1", "s2"]}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_symbol_overrides_bulk_direct_mode(mock_database):
+    """Test bulk symbol override lookup groups symbols by strategy."""
+    mock_cursor = MagicMock()
+    mock_cursor.to_list = AsyncMock(
+        return_value=[{"_id": "s1", "symbols": ["ETHUSDT", "BTCUSDT"]}]
+    )
+    mock_database.strategy_configs_symbol = MagicMock()
+    mock_database.strategy_configs_symbol.aggregate.return_value = mock_cursor
+
+    client = MongoDBClient(use_data_manager=False)
+    client.database = mock_database
+    client._connected = True
+
+    result = await client.list_symbol_overrides_bulk(["s1", "s2"])
+
+    assert result == {"s1": ["BTCUSDT", "ETHUSDT"]}
+    mock_database.strategy_configs_symbol.aggregate.assert_called_once()
+
+
 def test_data_manager_availability():
     """Test DATA_MANAGER_AVAILABLE constant."""
     # This tests the import logic
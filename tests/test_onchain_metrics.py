@@ -4,9 +4,12 @@ from datetime import datetime
 
 import pytest
 
-from strategies.market_logic.onchain_metrics import OnChainMetricsStrategy
+from strategies.market_logic.onchain_metrics import (
+    HISTORY_MAX_ENTRIES,
+    OnChainMetricsStrategy,
+)
 from strategies.models.market_data import MarketDataMessage, TickerData
-from strategies.models.signals import SignalAction, SignalType
+from strategies.models.signals import SignalAction, SignalConfidence, SignalType
 
 
 def make_ticker(symbol: str) -> TickerData:
@@ -36,6 +39,16 @@ def make_ticker(symbol: str) -> TickerData:
     )
 
 
+def seed_history(strategy: OnChainMetricsStrategy, asset: str, history) -> None:
+    for metrics in history:
+        strategy._update_metrics_history(asset, metrics)
+
+
+def skip_fetch(strategy: OnChainMetricsStrategy) -> None:
+    # Mark metrics as just fetched so ticks don't trigger the hourly fetch
+    strategy._next_fetch_ns = time.monotonic_ns() + strategy._fetch_interval_ns
+
+
 def make_mdm(symbol: str) -> MarketDataMessage:
     return MarketDataMessage(
         stream=f"{symbol.lower()}@ticker",
@@ -62,7 +75,7 @@ async def test_onchain_btc_bullish_signal_generation():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["BTC"] = history
+    seed_history(strategy, "BTC", history)
     # Current cached metrics
     strategy.metrics_cache["BTC"] = history[-1]
 
@@ -93,7 +106,7 @@ async def test_onchain_eth_bearish_exchange_inflow_signal():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["ETH"] = history
+    seed_history(strategy, "ETH", history)
     strategy.metrics_cache["ETH"] = history[-1]
 
     mdm = make_mdm("ETHUSDT")
@@ -110,34 +123,174 @@ async def test_onchain_rate_limiting_prevents_signal():
     strategy = OnChainMetricsStrategy()
     # Seed minimal valid history/cache for BTC
     now = time.time()
-    strategy.metrics_history["BTC"] = [
-        {
-            "active_addresses": 1,
-            "transaction_volume_btc": 1,
-            "hash_rate_eh": 1,
-            "exchange_inflow_btc": 0,
-            "exchange_outflow_btc": 0,
-            "timestamp": now - 25 * 3600,
-        }
-    ] * 24
-    strategy.metrics_cache["BTC"] = strategy.metrics_history["BTC"][-1]
+    row = {
+        "active_addresses": 1,
+        "transaction_volume_btc": 1,
+        "hash_rate_eh": 1,
+        "exchange_inflow_btc": 0,
+        "exchange_outflow_btc": 0,
+        "timestamp": now - 25 * 3600,
+    }
+    seed_history(strategy, "BTC", [row] * 24)
+    strategy.metrics_cache["BTC"] = row
     # Mark last signal as just emitted -> enforce min interval
-    strategy.last_signal_times["BTC_onchain"] = datetime.utcnow()
+    strategy.last_signal_times["BTC_onchain"] = time.monotonic()
 
     mdm = make_mdm("BTCUSDT")
     signal = await strategy.process_market_data(mdm)
     assert signal is None
 
 
+@pytest.mark.asyncio
+async def test_onchain_prefilter_skips_analysis(monkeypatch):
+    """Test unsupported and rate-limited ticks never reach the analysis path."""
+    strategy = OnChainMetricsStrategy()
+    skip_fetch(strategy)
+    strategy.last_signal_times["BTC_onchain"] = time.monotonic()
+
+    def fail(*_):
+        raise AssertionError("analysis should be skipped")
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_analyze_onchain_metrics", fail)
+
+    assert await strategy.process_market_data(make_mdm("ADAUSDT")) is None
+    assert await strategy.process_market_data(make_mdm("BTCUSDT")) is None
+    assert strategy._prefilter("ETHUSDT") == "ETH"
+
+
+@pytest.mark.asyncio
+async def test_onchain_rate_limit_checked_once_per_tick(monkeypatch):
+    """Test analysis reuses the prefilter's asset key and rate-limit check."""
+    strategy = OnChainMetricsStrategy()
+    skip_fetch(strategy)
+    calls = []
+    monkeypatch.setattr(
+        OnChainMetricsStrategy,
+        "_should_generate_signal",
+        lambda _self, key: calls.append(key) or True,
+    )
+    monkeypatch.setattr(
+        OnChainMetricsStrategy,
+        "_asset_key",
+        lambda _self, symbol: calls.append(symbol) or "BTC",
+    )
+
+    await strategy.process_market_data(make_mdm("BTCUSDT"))
+
+    assert calls == ["BTCUSDT", "BTC_onchain"]
+
+
+def test_onchain_rate_limit_expires():
+    """Test the rate limit reopens once the minimum interval has elapsed."""
+    strategy = OnChainMetricsStrategy()
+    strategy.last_signal_times["ETH_onchain"] = time.monotonic()
+    assert strategy._should_generate_signal("ETH_onchain") is False
+
+    strategy.last_signal_times["ETH_onchain"] -= strategy.min_signal_interval
+    assert strategy._should_generate_signal("ETH_onchain") is True
+
+
+@pytest.mark.asyncio
+async def test_onchain_process_span_sampling(monkeypatch):
+    """Test per-tick spans are sampled but signal ticks are always traced."""
+    from unittest.mock import MagicMock
+
+    from strategies.market_logic import onchain_metrics
+
+    tracer = MagicMock()
+    monkeypatch.setattr(onchain_metrics, "tracer", tracer)
+    strategy = OnChainMetricsStrategy()
+    skip_fetch(strategy)
+    strategy.span_sample_every = 2
+    signal = None
+    monkeypatch.setattr(
+        OnChainMetricsStrategy,
+        "_analyze_onchain_metrics",
+        lambda _self, _md, _asset_key, _traced: signal,
+    )
+
+    await strategy.process_market_data(make_mdm("BTCUSDT"))
+    assert tracer.start_as_current_span.call_count == 0
+
+    await strategy.process_market_data(make_mdm("BTCUSDT"))
+    assert tracer.start_as_current_span.call_count == 1
+
+    signal = MagicMock()
+    assert await strategy.process_market_data(make_mdm("BTCUSDT")) is signal
+    assert tracer.start_as_current_span.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_onchain_errors_traced_on_unsampled_ticks(monkeypatch):
+    """Test an analysis error on an unsampled tick still records an error span."""
+    from unittest.mock import MagicMock
+
+    from strategies.market_logic import onchain_metrics
+
+    tracer = MagicMock()
+    monkeypatch.setattr(onchain_metrics, "tracer", tracer)
+    monkeypatch.setattr(onchain_metrics, "_TRACING_ENABLED", True)
+    strategy = OnChainMetricsStrategy()
+    skip_fetch(strategy)
+    strategy.span_sample_every = 2
+    error = RuntimeError("boom")
+
+    def boom(*_):
+        raise error
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_analyze_onchain_metrics", boom)
+
+    assert await strategy.process_market_data(make_mdm("BTCUSDT")) is None
+
+    tracer.start_as_current_span.assert_called_once_with(
+        "onchain_metrics.process_market_data"
+    )
+    span = tracer.start_as_current_span.return_value.__enter__.return_value
+    span.record_exception.assert_called_once_with(error)
+    span.set_status.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_onchain_no_spans_when_tracing_disabled(monkeypatch):
+    """Test no tracer calls are made at all when tracing is disabled."""
+    from unittest.mock import MagicMock
+
+    from strategies.market_logic import onchain_metrics
+
+    tracer = MagicMock()
+    monkeypatch.setattr(onchain_metrics, "tracer", tracer)
+    monkeypatch.setattr(onchain_metrics, "_TRACING_ENABLED", False)
+    strategy = OnChainMetricsStrategy()
+    strategy.span_sample_every = 1
+
+    await strategy.process_market_data(make_mdm("BTCUSDT"))
+    tracer.start_as_current_span.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_onchain_process_market_data_runs_analysis_cleanly():
+    """Test sampled and unsampled ticks both reach analysis without errors."""
+    from unittest.mock import MagicMock
+
+    logger = MagicMock()
+    strategy = OnChainMetricsStrategy(logger=logger)
+    strategy.span_sample_every = 2
+
+    for _ in range(2):
+        assert await strategy.process_market_data(make_mdm("BTCUSDT")) is None
+
+    logger.error.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_onchain_error_handling_in_process_market_data(monkeypatch):
     strategy = OnChainMetricsStrategy()
 
-    async def boom(_):
+    def boom(*_):
         raise RuntimeError("boom")
 
     # Force analyze to throw and hit except path
-    monkeypatch.setattr(strategy, "_analyze_onchain_metrics", boom)
+    monkeypatch.setattr(OnChainMetricsStrategy, "_analyze_onchain_metrics", boom)
 
     mdm = make_mdm("BTCUSDT")
     result = await strategy.process_market_data(mdm)
@@ -163,7 +316,7 @@ async def test_onchain_eth_ecosystem_growth_signal():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["ETH"] = history
+    seed_history(strategy, "ETH", history)
     strategy.metrics_cache["ETH"] = history[-1]
 
     # Allow signal generation (no recent signal)
@@ -180,36 +333,31 @@ async def test_onchain_eth_ecosystem_growth_signal():
         assert signal.price > 0
 
 
-@pytest.mark.asyncio
-async def test_onchain_unsupported_symbol():
-    """Test unsupported symbol returns None - covers line 214."""
+def test_onchain_unsupported_symbol():
+    """Test unsupported symbols are rejected by the prefilter."""
     strategy = OnChainMetricsStrategy()
     strategy.metrics_cache["BTC"] = {"active_addresses": 1000000}
 
-    mdm = make_mdm("ADAUSDT")  # Not BTC or ETH
-    signal = await strategy._analyze_onchain_metrics(mdm)
-    assert signal is None
+    assert strategy._prefilter("ADAUSDT") is None  # Not BTC or ETH
 
 
-@pytest.mark.asyncio
-async def test_onchain_no_metrics_cache():
+def test_onchain_no_metrics_cache():
     """Test missing metrics cache returns None - covers line 217."""
     strategy = OnChainMetricsStrategy()
     mdm = make_mdm("BTCUSDT")
-    signal = await strategy._analyze_onchain_metrics(mdm)
+    signal = strategy._analyze_onchain_metrics(mdm, "BTC")
     assert signal is None
 
 
-@pytest.mark.asyncio
-async def test_onchain_insufficient_history():
+def test_onchain_insufficient_history():
     """Test insufficient history returns None - covers line 244."""
     strategy = OnChainMetricsStrategy()
     strategy.metrics_cache["BTC"] = {"active_addresses": 1000000}
     # Less than 24 hours of history
-    strategy.metrics_history["BTC"] = [{"active_addresses": 1000000}] * 10
+    seed_history(strategy, "BTC", [{"active_addresses": 1000000}] * 10)
 
     mdm = make_mdm("BTCUSDT")
-    signal = await strategy._analyze_onchain_metrics(mdm)
+    signal = strategy._analyze_onchain_metrics(mdm, "BTC")
     assert signal is None
 
 
@@ -232,18 +380,34 @@ async def test_onchain_calculate_growth_metrics_exception():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["BTC"] = history
+    seed_history(strategy, "BTC", history)
 
     result = strategy._calculate_growth_metrics("BTC")
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_onchain_percentage_change_zero_old_value():
-    """Test percentage change with zero old value - covers line 311."""
+def test_onchain_growth_metrics_values():
+    """Test 24h growth rates, zero base values and net exchange flow."""
     strategy = OnChainMetricsStrategy()
-    result = strategy._calculate_percentage_change(0, 100)
-    assert result == 0
+    day_ago = {
+        "active_addresses": 1_000,
+        "transaction_volume_eth": 0,
+        "defi_tvl_usd": 200,
+    }
+    now = {
+        "active_addresses": 1_100,
+        "transaction_volume_eth": 500,
+        "defi_tvl_usd": 150,
+        "exchange_inflow_eth": 30,
+        "exchange_outflow_eth": 50,
+    }
+    seed_history(strategy, "ETH", [day_ago] + [now] * 23)
+
+    growth = strategy._calculate_growth_metrics("ETH")
+    assert growth.active_addresses_24h == pytest.approx(10.0)
+    assert growth.transaction_volume_24h == 0
+    assert growth.network_24h == pytest.approx(-25.0)
+    assert growth.net_exchange_flow == -20
 
 
 @pytest.mark.asyncio
@@ -266,7 +430,7 @@ async def test_onchain_signal_confidence_mapping():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["BTC"] = history
+    seed_history(strategy, "BTC", history)
     strategy.metrics_cache["BTC"] = history[-1]
 
     mdm = make_mdm("BTCUSDT")
@@ -278,6 +442,36 @@ async def test_onchain_signal_confidence_mapping():
         assert signal.confidence_score >= 0.5
 
 
+@pytest.mark.parametrize(
+    "score,expected",
+    [
+        (0.49, SignalConfidence.LOW),
+        (0.5, SignalConfidence.MEDIUM),
+        (0.69, SignalConfidence.MEDIUM),
+        (0.7, SignalConfidence.HIGH),
+    ],
+)
+def test_onchain_confidence_level_boundaries(monkeypatch, score, expected):
+    """Test confidence levels switch at inclusive 0.5 and 0.7 cut-offs."""
+    from strategies.market_logic import onchain_metrics
+
+    # Capture the Signal fields instead of validating a full model
+    monkeypatch.setattr(onchain_metrics, "Signal", dict)
+    strategy = OnChainMetricsStrategy()
+    signal = strategy._create_onchain_signal(
+        signal_type=SignalType.BUY,
+        action=SignalAction.OPEN_LONG,
+        symbol="BTCUSDT",
+        confidence_score=score,
+        reasoning="test",
+        market_data=make_mdm("BTCUSDT"),
+        metadata={},
+    )
+    assert signal["confidence"] == expected
+    assert signal["metadata"]["reasoning"] == "test"
+    assert "timestamp" in signal["metadata"]
+
+
 @pytest.mark.asyncio
 async def test_onchain_price_extraction_from_trade():
     """Test price extraction from trade data - covers line 445."""
@@ -300,7 +494,7 @@ async def test_onchain_price_extraction_from_trade():
                 "timestamp": base_time + i * 3600,
             }
         )
-    strategy.metrics_history["BTC"] = history
+    seed_history(strategy, "BTC", history)
     strategy.metrics_cache["BTC"] = history[-1]
 
     # Create market data with trade instead of ticker
@@ -336,40 +530,144 @@ async def test_onchain_get_metrics():
     assert metrics["strategy_name"] == "onchain_metrics"
 
 
+@pytest.mark.asyncio
+async def test_onchain_fetch_runs_sources_concurrently(monkeypatch):
+    """Test BTC and ETH fetches overlap instead of running back to back."""
+    strategy = OnChainMetricsStrategy()
+    started = asyncio.Event()
+
+    async def btc(_self):
+        # Only completes if the ETH fetch is already in flight
+        await asyncio.wait_for(started.wait(), timeout=1)
+        return {"active_addresses": 1}
+
+    async def eth(_self):
+        started.set()
+        return {"active_addresses": 2}
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_simulate_btc_metrics", btc)
+    monkeypatch.setattr(OnChainMetricsStrategy, "_simulate_eth_metrics", eth)
+
+    await strategy._fetch_onchain_metrics()
+
+    assert strategy.metrics_cache["BTC"] == {"active_addresses": 1}
+    assert strategy.metrics_cache["ETH"] == {"active_addresses": 2}
+
+
+@pytest.mark.asyncio
+async def test_onchain_concurrent_ticks_share_one_fetch(monkeypatch):
+    """Test ticks arriving during an in-flight fetch don't fetch again."""
+    strategy = OnChainMetricsStrategy()
+    fetches = 0
+
+    async def fetch(_self):
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_fetch_onchain_metrics", fetch)
+
+    await asyncio.gather(
+        *(strategy.process_market_data(make_mdm("ADAUSDT")) for _ in range(5))
+    )
+    assert fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_onchain_fetch_runs_once_per_interval(monkeypatch):
+    """Test the hourly fetch is scheduled on the monotonic clock."""
+    strategy = OnChainMetricsStrategy()
+    fetches = 0
+
+    async def fetch(_self):
+        nonlocal fetches
+        fetches += 1
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_fetch_onchain_metrics", fetch)
+
+    await strategy.process_market_data(make_mdm("ADAUSDT"))
+    await strategy.process_market_data(make_mdm("ADAUSDT"))
+    assert fetches == 1
+    assert strategy.last_fetch_time > 0
+
+    strategy._next_fetch_ns -= strategy._fetch_interval_ns
+    await strategy.process_market_data(make_mdm("ADAUSDT"))
+    assert fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_onchain_fetch_skips_unchanged_observation(monkeypatch):
+    """Test a re-served source observation is not appended to history twice."""
+    strategy = OnChainMetricsStrategy()
+    btc = {"active_addresses": 1, "timestamp": 1000.0}
+    eth = {"active_addresses": 2, "timestamp": 1000.0}
+
+    async def fetch_btc(_self):
+        return btc
+
+    async def fetch_eth(_self):
+        return eth
+
+    monkeypatch.setattr(OnChainMetricsStrategy, "_simulate_btc_metrics", fetch_btc)
+    monkeypatch.setattr(OnChainMetricsStrategy, "_simulate_eth_metrics", fetch_eth)
+
+    await strategy._fetch_onchain_metrics()
+    await strategy._fetch_onchain_metrics()
+    assert len(strategy.metrics_history["BTC"]) == 1
+    assert len(strategy.metrics_history["ETH"]) == 1
+
+    btc = {"active_addresses": 3, "timestamp": 4600.0}
+    await strategy._fetch_onchain_metrics()
+    assert len(strategy.metrics_history["BTC"]) == 2
+    assert len(strategy.metrics_history["ETH"]) == 1
+
+
 @pytest.mark.asyncio
 async def test_onchain_fetch_error_handling(monkeypatch):
     """Test error handling in _fetch_onchain_metrics - covers lines 135-136."""
     strategy = OnChainMetricsStrategy()
 
-    async def boom():
+    async def boom(_self):
         raise Exception("Fetch error")
 
-    monkeypatch.setattr(strategy, "_simulate_btc_metrics", boom)
+    monkeypatch.setattr(OnChainMetricsStrategy, "_simulate_btc_metrics", boom)
 
     await strategy._fetch_onchain_metrics()
     # Should handle error gracefully
 
 
-@pytest.mark.asyncio
-async def test_onchain_history_trimming():
-    """Test history trimming when exceeding max entries - covers line 194."""
+def test_onchain_history_trimming():
+    """Test history ring evicts the oldest entries past max entries."""
     strategy = OnChainMetricsStrategy()
 
-    # Create more than 7 days * 24 hours of history
-    history = []
-    base_time = time.time() - (10 * 24 * 3600)  # 10 days ago
-    for i in range(10 * 24 + 1):  # More than max_entries
-        history.append(
-            {
-                "active_addresses": 1000000,
-                "timestamp": base_time + i * 3600,
-            }
+    # Feed more than 7 days * 24 hours of hourly history
+    for i in range(10 * 24 + 1):
+        strategy._update_metrics_history(
+            "BTC", {"active_addresses": i, "hash_rate_eh": 200}
         )
 
-    strategy._update_metrics_history("BTC", history[-1])
-    strategy._update_metrics_history(
-        "BTC", {"active_addresses": 1000000, "timestamp": time.time()}
-    )
+    history = strategy.metrics_history["BTC"]
+    assert len(history) == HISTORY_MAX_ENTRIES
+    assert history[0] == (10 * 24 + 1 - HISTORY_MAX_ENTRIES, 0, 200, 0, 0)
+    assert history[-1] == (10 * 24, 0, 200, 0, 0)
 
-    # History should be trimmed to max_entries
-    assert len(strategy.metrics_history["BTC"]) <= 7 * 24
+
+def test_onchain_growth_metrics_cached_until_history_changes():
+    """Test growth metrics are reused between history appends."""
+    strategy = OnChainMetricsStrategy()
+    seed_history(strategy, "BTC", [{"active_addresses": 100}] * 24)
+
+    growth = strategy._calculate_growth_metrics("BTC")
+    assert strategy._calculate_growth_metrics("BTC") is growth
+
+    strategy._update_metrics_history("BTC", {"active_addresses": 150})
+    refreshed = strategy._calculate_growth_metrics("BTC")
+    assert refreshed is not growth
+    assert refreshed.active_addresses_24h == pytest.approx(50.0)
+
+
+def test_onchain_history_ignores_unknown_asset():
+    """Test history is only kept for assets with a known row layout."""
+    strategy = OnChainMetricsStrategy()
+    strategy._update_metrics_history("SOL", {"active_addresses": 1})
+    assert "SOL" not in strategy.metrics_history
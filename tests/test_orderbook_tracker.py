@@ -24,12 +24,9 @@ class TestLevelHistory:
 
     def test_post_init_timestamp_initialization(self):
         """Test __post_init__ initializes timestamps when 0.0 - covers lines 58, 60."""
-        from collections import deque
-
         history = LevelHistory(
             price=50000.0,
             side="bid",
-            snapshots=deque(),
             first_seen=0.0,
             last_seen=0.0,
         )
@@ -42,13 +39,10 @@ class TestLevelHistory:
 
     def test_post_init_preserves_existing_timestamps(self):
         """Test __post_init__ preserves existing timestamps."""
-        from collections import deque
-
         existing_time = time.time() - 100
         history = LevelHistory(
             price=50000.0,
             side="bid",
-            snapshots=deque(),
             first_seen=existing_time,
             last_seen=existing_time + 50,
         )
@@ -57,6 +51,13 @@ class TestLevelHistory:
         assert history.first_seen == existing_time
         assert history.last_seen == existing_time + 50
 
+    def test_level_history_is_slotted(self):
+        """Test LevelHistory instances carry no per-instance __dict__."""
+        history = LevelHistory(price=50000.0, side="bid")
+
+        assert not hasattr(history, "__dict__")
+        assert "volume_m2" in LevelHistory.__slots__
+
 
 class TestOrderbookTracker:
     """Test OrderBookTracker edge cases."""
@@ -78,6 +79,16 @@ class TestOrderbookTracker:
         stats = tracker.get_statistics()
         assert stats["symbols_tracked"] == 1
 
+    def test_update_orderbook_unix_timestamp(self, tracker):
+        """Test update_orderbook accepts Unix seconds directly."""
+        unix_ts = time.time() - 10
+
+        tracker.update_orderbook("BTCUSDT", [(50000.0, 1.0)], [(50001.0, 1.0)], unix_ts)
+
+        history = tracker.bid_levels["BTCUSDT"][50000.0]
+        assert history.last_seen == unix_ts
+        assert history.timestamps[-1] == unix_ts
+
     def test_cleanup_expired_levels(self, tracker):
         """Test cleanup removes expired levels - covers lines 273, 282."""
         bids = [(50000.0, 1.0)]
@@ -181,3 +192,106 @@ class TestOrderbookTracker:
         assert "active_bid_levels" in stats
         assert "active_ask_levels" in stats
         assert stats["symbols_tracked"] == 2
+
+    def test_detect_unknown_symbol_does_not_register_it(self, tracker):
+        """Test read paths do not add empty entries for unseen symbols."""
+        assert tracker.detect_icebergs("ETHUSDT", current_price=3000.0) == []
+        assert "ETHUSDT" not in tracker.bid_levels
+        assert "ETHUSDT" not in tracker.ask_levels
+        assert tracker.get_statistics()["symbols_tracked"] == 0
+
+    def test_least_recently_updated_symbol_evicted_at_max_symbols(self):
+        """Test a new symbol beyond max_symbols evicts the stalest one."""
+        tracker = OrderBookTracker(max_symbols=2)
+        bids = [(100.0, 1.0)]
+        asks = [(101.0, 1.0)]
+
+        tracker.update_orderbook("BTCUSDT", bids, asks)
+        tracker.update_orderbook("ETHUSDT", bids, asks)
+        tracker.update_orderbook("BTCUSDT", bids, asks)  # ETHUSDT now stalest
+        tracker.update_orderbook("SOLUSDT", bids, asks)
+
+        assert list(tracker.bid_levels) == ["BTCUSDT", "SOLUSDT"]
+        assert list(tracker.ask_levels) == ["BTCUSDT", "SOLUSDT"]
+        assert (
+            set(tracker._bid_prices)
+            == set(tracker._ask_prices)
+            == {
+                "BTCUSDT",
+                "SOLUSDT",
+            }
+        )
+        assert tracker.get_statistics()["symbols_tracked"] == 2
+
+    def test_volume_statistics(self, tracker):
+        """Test level mean/std dev are computed over the retained volumes."""
+        base = time.time()
+        for i, qty in enumerate([1.0, 2.0, 3.0, 4.0]):
+            tracker.update_orderbook(
+                "BTCUSDT", [(50000.0, qty)], [(50001.0, 0.3)], base + i
+            )
+        bid = tracker.bid_levels["BTCUSDT"][50000.0]
+        assert bid.avg_volume == 0.0  # Not computed until the level is checked
+
+        tracker.detect_icebergs("BTCUSDT", current_price=50000.5)
+
+        bid = tracker.bid_levels["BTCUSDT"][50000.0]
+        assert list(bid.volumes) == [1.0, 2.0, 3.0, 4.0]
+        assert bid.avg_volume == pytest.approx(2.5)
+        assert bid.volume_std_dev == pytest.approx(1.25**0.5)
+        assert bid.consistent_volume is False
+
+        ask = tracker.ask_levels["BTCUSDT"][50001.0]
+        assert ask.volume_std_dev == 0.0
+        assert ask.consistent_volume is True
+
+    def test_expired_levels_removed_in_last_seen_order(self, tracker):
+        """Test only levels last seen before the window are expired."""
+        base = time.time() - 1000
+        tracker.update_orderbook(
+            "BTCUSDT", [(50000.0, 1.0), (49999.0, 1.0)], [(50001.0, 1.0)], base
+        )
+        # Re-touch 50000.0 later so it moves behind 49999.0
+        tracker.update_orderbook("BTCUSDT", [(50000.0, 1.0)], [], base + 200)
+        tracker.update_orderbook("BTCUSDT", [(49998.0, 1.0)], [], base + 450)
+
+        assert list(tracker.bid_levels["BTCUSDT"]) == [50000.0, 49998.0]
+        assert list(tracker.ask_levels["BTCUSDT"]) == []
+
+    def test_price_index_follows_level_lifecycle(self, tracker):
+        """Test the sorted price index tracks new, expired and in-range levels."""
+        base = time.time() - 1000
+        tracker.update_orderbook(
+            "BTCUSDT", [(50000.0, 1.0), (40000.0, 1.0)], [(50001.0, 1.0)], base
+        )
+        tracker.update_orderbook("BTCUSDT", [(49990.0, 1.0)], [], base + 10)
+        assert tracker._bid_prices["BTCUSDT"] == [40000.0, 49990.0, 50000.0]
+
+        # 40000.0 is far outside 1% of the mid and never reaches detection;
+        # the in-range bids persisted long enough to be anchors
+        patterns = tracker.detect_icebergs("BTCUSDT", current_price=50000.5)
+        assert sorted(p.price for p in patterns) == [49990.0, 50000.0, 50001.0]
+
+        tracker.update_orderbook("BTCUSDT", [(50000.0, 1.0)], [], base + 305)
+        assert tracker._bid_prices["BTCUSDT"] == [49990.0, 50000.0]
+        assert tracker._ask_prices["BTCUSDT"] == []
+
+    def test_running_volume_moments_track_evictions(self, tracker):
+        """Test running mean/std dev match a full recompute after evictions."""
+        import statistics
+
+        base = time.time() - 200
+        for i in range(150):
+            qty = 1.0 + (i * 7 % 11) * 0.25
+            tracker.update_orderbook(
+                "BTCUSDT", [(50000.0, qty)], [(50001.0, 0.3)], base + i
+            )
+        tracker.detect_icebergs("BTCUSDT", current_price=50000.5)
+
+        bid = tracker.bid_levels["BTCUSDT"][50000.0]
+        assert len(bid.volumes) == 100
+        assert bid.avg_volume == pytest.approx(statistics.fmean(bid.volumes))
+        assert bid.volume_std_dev == pytest.approx(statistics.pstdev(bid.volumes))
+
+        ask = tracker.ask_levels["BTCUSDT"][50001.0]
+        assert ask.volume_std_dev == 0.0
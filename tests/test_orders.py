@@ -479,6 +479,23 @@ class TestTradeOrder:
 
         assert order_dict["stop_price"] == 49000.0
 
+    def test_to_dict_timestamp_formats(self):
+        """Test to_dict formats the timestamp; the publisher payload keeps it raw."""
+        order = TradeOrder(
+            order_id=str(uuid4()),
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=0.001,
+            position_type=PositionType.LONG,
+            strategy_name="test_strategy",
+            signal_id=str(uuid4()),
+            confidence_score=0.85,
+        )
+
+        assert order.to_dict()["timestamp"] == order.timestamp.isoformat()
+        assert order._payload_dict()["timestamp"] is order.timestamp
+
 
 class TestOrderResponse:
     """Test OrderResponse model."""
@@ -843,6 +860,57 @@ class TestOrderMetrics:
         assert metrics.average_processing_time_ms == 15.0  # (10 + 20) / 2
         assert metrics.success_rate == 50.0  # 1/2 * 100
 
+    def test_success_rate_counts_each_successful_status(self):
+        """Test the success rate counts every successful status."""
+        metrics = OrderMetrics()
+
+        for status in ["Accepted", "submitted", "rejected", "success"]:
+            order = TradeOrder(
+                order_id=str(uuid4()),
+                symbol="BTCUSDT",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                quantity=0.001,
+                position_type=PositionType.LONG,
+                strategy_name="test_strategy",
+                signal_id=str(uuid4()),
+                confidence_score=0.85,
+            )
+            response = OrderResponse(
+                order_id=order.order_id, status=status, message="Order processed"
+            )
+            metrics.update_metrics(order, response, processing_time_ms=10.0)
+
+        assert metrics.success_rate == 75.0  # 3/4 * 100
+
+    def test_success_rate_includes_existing_counts(self):
+        """Test metrics built from existing data keep their success counts."""
+        order = TradeOrder(
+            order_id=str(uuid4()),
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=0.001,
+            position_type=PositionType.LONG,
+            strategy_name="test_strategy",
+            signal_id=str(uuid4()),
+            confidence_score=0.85,
+        )
+        response = OrderResponse(
+            order_id=order.order_id, status="success", message="Order processed"
+        )
+
+        metrics = OrderMetrics(
+            orders_by_status={"success": 5}, total_orders_submitted=5
+        )
+        metrics.update_metrics(order, response, processing_time_ms=10.0)
+        assert metrics.success_rate == 100.0
+
+        restored = OrderMetrics.model_validate(metrics.model_dump())
+        restored.update_metrics(order, response, processing_time_ms=10.0)
+        assert restored.success_rate == 100.0
+        assert restored.orders_by_status == {"success": 7}
+
     def test_get_order_distribution_empty(self):
         """Test get_order_distribution with no orders."""
         metrics = OrderMetrics()
@@ -880,3 +948,16 @@ class TestOrderMetrics:
         assert distribution["strategy_test_strategy"] == 1.0
         assert "symbol_BTCUSDT" in distribution
         assert distribution["symbol_BTCUSDT"] == 1.0
+
+    def test_get_order_distribution_shares_are_exact(self):
+        """Test a single bucket holding every order reports exactly 1.0."""
+        metrics = OrderMetrics(
+            total_orders_submitted=49,
+            orders_by_status={"success": 49},
+            orders_by_strategy={"test_strategy": 49},
+            orders_by_symbol={"BTCUSDT": 49},
+        )
+
+        distribution = metrics.get_order_distribution()
+
+        assert set(distribution.values()) == {1.0}
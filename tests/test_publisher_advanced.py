@@ -532,6 +532,65 @@ async def test_publish_order_sync_success(publisher, mock_nats_client):
     assert publisher.order_count == 1
 
 
+@pytest.mark.asyncio
+async def test_publish_order_sync_payload_matches_to_dict(publisher, mock_nats_client):
+    """Test the published bytes decode to the same document as to_dict()."""
+    import json
+    import uuid
+
+    publisher.nats_client = mock_nats_client
+    publisher.nats_client.publish = AsyncMock()
+
+    order = TradeOrder(
+        order_id=str(uuid.uuid4()),
+        symbol="BTCUSDT",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=1.0,
+        price=50000.0,
+        position_type=PositionType.LONG,
+        strategy_name="test",
+        signal_id="test-12345",
+        confidence_score=0.85,
+        metadata={"source": "unit", "levels": {1: 50000.0, 2: 49990.5}},
+    )
+
+    await publisher.publish_order_sync(order)
+
+    payload = publisher.nats_client.publish.call_args.kwargs["payload"]
+    assert json.loads(payload) == json.loads(json.dumps(order.to_dict()))
+
+
+@pytest.mark.asyncio
+async def test_publish_order_sync_payload_encodes_nan_as_null(
+    publisher, mock_nats_client
+):
+    """Test NaN metadata values are published as JSON null."""
+    import json
+    import uuid
+
+    publisher.nats_client = mock_nats_client
+    publisher.nats_client.publish = AsyncMock()
+
+    order = TradeOrder(
+        order_id=str(uuid.uuid4()),
+        symbol="BTCUSDT",
+        side=OrderSide.BUY,
+        order_type=OrderType.MARKET,
+        quantity=1.0,
+        position_type=PositionType.LONG,
+        strategy_name="test",
+        signal_id="test-12345",
+        confidence_score=0.85,
+        metadata={"spread": float("nan")},
+    )
+
+    await publisher.publish_order_sync(order)
+
+    payload = publisher.nats_client.publish.call_args.kwargs["payload"]
+    assert json.loads(payload)["metadata"] == {"spread": None}
+
+
 @pytest.mark.asyncio
 async def test_publish_order_sync_exception_handling(publisher, mock_nats_client):
     """Test publish_order_sync exception handling - covers lines 349-365."""
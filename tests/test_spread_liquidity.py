@@ -5,6 +5,7 @@ Tests spread widening/narrowing detection and signal generation.
 """
 
 import time
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 
 import pytest
@@ -258,6 +259,124 @@ class TestSpreadLiquidityStrategy:
         assert "BTCUSDT" in strategy.spread_history
         assert "ETHUSDT" in strategy.spread_history
 
+    def test_state_views_are_read_only(self, strategy, normal_orderbook):
+        """Test spread_history and wide_spread_events reject writes."""
+        strategy.analyze(
+            symbol="BTCUSDT",
+            bids=normal_orderbook["bids"],
+            asks=normal_orderbook["asks"],
+        )
+
+        with pytest.raises(TypeError):
+            strategy.spread_history["ETHUSDT"] = None
+        with pytest.raises(TypeError):
+            strategy.wide_spread_events["BTCUSDT"] = {}
+        assert list(strategy.symbol_state) == ["BTCUSDT"]
+
+    def test_running_sums_track_history(self, strategy):
+        """Test running sums match the retained history after evictions."""
+        base_time = datetime.utcnow()
+        for i in range(35):
+            spread = 1.0 + (i % 7)
+            strategy.analyze(
+                symbol="BTCUSDT",
+                bids=[(50000.0 - spread, 1.0 + i), (49990.0, 2.0)],
+                asks=[(50000.0 + spread, 1.5), (50010.0, 2.5)],
+                timestamp=base_time + timedelta(seconds=i),
+            )
+
+        history = strategy.spread_history["BTCUSDT"]
+        assert len(history) == 20
+        state = strategy.symbol_state["BTCUSDT"]
+        assert state.spread_sum == pytest.approx(sum(m.spread_bps for m in history))
+        assert state.depth_sum == pytest.approx(sum(m.total_depth for m in history))
+
+    def test_snapshot_flags_match_snapshot_bools(
+        self, strategy, normal_orderbook, wide_orderbook
+    ):
+        """Test packed snapshot flags agree with the SpreadSnapshot booleans."""
+        from strategies.market_logic import spread_liquidity
+
+        base_time = datetime.utcnow()
+        for i in range(5):
+            strategy.analyze(
+                symbol="BTCUSDT",
+                bids=normal_orderbook["bids"],
+                asks=normal_orderbook["asks"],
+                timestamp=base_time + timedelta(seconds=i),
+            )
+        strategy.analyze(
+            symbol="BTCUSDT",
+            bids=wide_orderbook["bids"],
+            asks=wide_orderbook["asks"],
+            timestamp=base_time + timedelta(seconds=5),
+        )
+
+        metrics = strategy.spread_history["BTCUSDT"][-1]
+        comparison = strategy._compare_to_history(
+            strategy.symbol_state["BTCUSDT"], metrics
+        )
+        flags = comparison[3]
+        snapshot = strategy._create_snapshot(metrics, comparison)
+
+        assert flags == spread_liquidity._WIDENING | spread_liquidity._ABNORMAL
+        assert snapshot.is_widening is True
+        assert snapshot.is_narrowing is False
+        assert snapshot.is_abnormal is True
+
+    def test_quiet_ticks_do_not_build_snapshots(
+        self, strategy, normal_orderbook, monkeypatch
+    ):
+        """Test SpreadSnapshot is only constructed when an event fires."""
+        from strategies.market_logic import spread_liquidity
+
+        def fail(**kwargs):
+            raise AssertionError("snapshot built without an event")
+
+        monkeypatch.setattr(spread_liquidity, "SpreadSnapshot", fail)
+
+        base_time = datetime.utcnow()
+        for i in range(25):
+            assert (
+                strategy.analyze(
+                    symbol="BTCUSDT",
+                    bids=normal_orderbook["bids"],
+                    asks=normal_orderbook["asks"],
+                    timestamp=base_time + timedelta(seconds=i),
+                )
+                is None
+            )
+
+    def test_rate_limited_ticks_skip_event_detection(
+        self, strategy, normal_orderbook, monkeypatch
+    ):
+        """Test quiet ticks inside the rate limit window only update history."""
+        base_time = datetime.utcnow()
+        for i in range(5):
+            strategy.analyze(
+                symbol="BTCUSDT",
+                bids=normal_orderbook["bids"],
+                asks=normal_orderbook["asks"],
+                timestamp=base_time + timedelta(seconds=i),
+            )
+
+        def fail(*args):
+            raise AssertionError("event detection ran inside rate limit window")
+
+        monkeypatch.setattr(SpreadLiquidityStrategy, "_compare_to_history", fail)
+        state = strategy.symbol_state["BTCUSDT"]
+        state.last_signal_ns = state.history[-1].ts_ns
+
+        signal = strategy.analyze(
+            symbol="BTCUSDT",
+            bids=normal_orderbook["bids"],
+            asks=normal_orderbook["asks"],
+            timestamp=base_time + timedelta(seconds=10),
+        )
+
+        assert signal is None
+        assert len(strategy.spread_history["BTCUSDT"]) == 6
+
     def test_confidence_calculation(self, strategy):
         """Test confidence increases with signal strength."""
         # Higher spread ratio should increase confidence
@@ -383,8 +502,8 @@ class TestSpreadLiquidityStrategy:
         # Verify strategy maintains state
         assert hasattr(strategy, "spread_history")
         assert hasattr(strategy, "wide_spread_events")
-        assert isinstance(strategy.spread_history, dict)
-        assert isinstance(strategy.wide_spread_events, dict)
+        assert isinstance(strategy.spread_history, Mapping)
+        assert isinstance(strategy.wide_spread_events, Mapping)
 
     def test_calculate_metrics_exception_handling(self, strategy):
         """Test exception handling in _calculate_metrics - covers lines 204-206."""
@@ -602,6 +721,55 @@ class TestSpreadLiquidityStrategy:
             # Should be rate limited
             assert second_signal is None
 
+    def test_rate_limiting_uses_snapshot_clock(self, strategy):
+        """Test rate limiting measures intervals on the snapshot's ns clock."""
+        from strategies.models.spread_metrics import (
+            SpreadEvent,
+            SpreadMetrics,
+            SpreadSnapshot,
+        )
+
+        def make_event(ts_ns):
+            metrics = SpreadMetrics(
+                symbol="BTCUSDT",
+                timestamp=datetime.utcnow(),
+                best_bid=50000.0,
+                best_ask=50001.0,
+                mid_price=50000.5,
+                spread_abs=1.0,
+                spread_bps=0.2,
+                spread_pct=0.002,
+                bid_volume_top5=10.0,
+                ask_volume_top5=10.0,
+                total_depth=20.0,
+                ts_ns=ts_ns,
+            )
+            snapshot = SpreadSnapshot(
+                metrics=metrics, spread_ratio=1.0, depth_reduction_pct=0.0
+            )
+            event = SpreadEvent(
+                event_type="narrowing",
+                symbol="BTCUSDT",
+                timestamp=metrics.timestamp,
+                spread_before_bps=1.0,
+                spread_current_bps=0.2,
+                spread_ratio=1.0,
+                spread_velocity=-0.6,
+                duration_seconds=40.0,
+                persistence_above_threshold=True,
+                confidence=0.75,
+                reasoning="Test",
+                snapshot=snapshot,
+            )
+            return event, snapshot
+
+        base_ns = 1_700_000_000 * 1_000_000_000
+        assert strategy._generate_signal(*make_event(base_ns)) is not None
+        assert strategy.symbol_state["BTCUSDT"].last_signal_ns == base_ns
+        # 59s later on the snapshot clock is still inside the 60s interval
+        assert strategy._generate_signal(*make_event(base_ns + 59 * 10**9)) is None
+        assert strategy._generate_signal(*make_event(base_ns + 60 * 10**9)) is not None
+
     def test_confidence_mapping_edge_cases(self, strategy):
         """Test confidence level mapping - covers lines 391-394."""
         from datetime import datetime
@@ -71,6 +71,25 @@ def test_spread_metrics_invalid_ask_zero():
     assert exc_info.value is not None
 
 
+def test_spread_metrics_nan_prices_rejected_as_invalid():
+    """Test a NaN bid or ask is reported as an invalid price, not a crossed book."""
+    for best_bid, best_ask in ((float("nan"), 50010.0), (50000.0, float("nan"))):
+        with pytest.raises(ValueError, match="Invalid bid/ask prices"):
+            SpreadMetrics(
+                symbol="BTCUSDT",
+                timestamp=datetime.utcnow(),
+                best_bid=best_bid,
+                best_ask=best_ask,
+                mid_price=50005.0,
+                spread_abs=10.0,
+                spread_bps=2.0,
+                spread_pct=0.02,
+                bid_volume_top5=1000.0,
+                ask_volume_top5=950.0,
+                total_depth=1950.0,
+            )
+
+
 def test_spread_metrics_invalid_ask_less_than_bid():
     """Test SpreadMetrics validation rejects ask <= bid - covers line 58."""
     with pytest.raises(ValueError, match="Ask must be greater than bid") as exc_info:
@@ -109,6 +128,23 @@ def test_spread_metrics_invalid_ask_equal_to_bid():
     assert exc_info.value is not None
 
 
+def test_spread_metrics_from_book_derives_fields():
+    """Test from_book derives mid price, spreads and depth from the book."""
+    metrics = SpreadMetrics.from_book(
+        "BTCUSDT", datetime.utcnow(), 49990.0, 50010.0, 4.0, 6.0, ts_ns=123
+    )
+
+    assert metrics.mid_price == 50000.0
+    assert metrics.spread_abs == 20.0
+    assert metrics.spread_bps == pytest.approx(4.0)
+    assert metrics.spread_pct == pytest.approx(0.04)
+    assert metrics.total_depth == 10.0
+    assert metrics.ts_ns == 123
+
+    with pytest.raises(ValueError, match="Ask must be greater than bid"):
+        SpreadMetrics.from_book("BTCUSDT", datetime.utcnow(), 100.0, 99.0, 1.0, 1.0)
+
+
 def test_spread_snapshot_creation():
     """Test SpreadSnapshot creation."""
     metrics = SpreadMetrics(
@@ -167,3 +203,25 @@ def test_spread_event_creation():
 
     assert event.event_type == "widening"
     assert event.confidence == 0.85
+
+
+def test_spread_models_are_slotted():
+    """Test spread models carry no per-instance __dict__."""
+    metrics = SpreadMetrics(
+        symbol="BTCUSDT",
+        timestamp=datetime.utcnow(),
+        best_bid=50000.0,
+        best_ask=50010.0,
+        mid_price=50005.0,
+        spread_abs=10.0,
+        spread_bps=2.0,
+        spread_pct=0.02,
+        bid_volume_top5=1000.0,
+        ask_volume_top5=950.0,
+        total_depth=1950.0,
+    )
+    snapshot = SpreadSnapshot(metrics=metrics)
+
+    assert not hasattr(metrics, "__dict__")
+    assert not hasattr(snapshot, "__dict__")
+    assert "snapshot" in SpreadEvent.__slots__